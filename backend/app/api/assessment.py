@@ -1,12 +1,10 @@
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel, EmailStr
 
 from app.core.config import Settings, get_settings
-from app.services.assessment import (
-    generate_assessment_download_link,
-    schedule_reminder_email,
-)
-from app.services.assessment_store import get_assessment
+from app.services.assessment import generate_assessment_download_link
+from app.services.async_store import get_assessment, run_db
+from app.services.email_scheduler import schedule_reminder_email
 from app.services.invites import create_and_send_invite
 
 router = APIRouter(prefix="/assessments", tags=["assessments"])
@@ -24,7 +22,6 @@ class StartAssessmentRequest(BaseModel):
 @router.post("/start")
 async def start_assessment(
     payload: StartAssessmentRequest,
-    background_tasks: BackgroundTasks,
     settings: Settings = Depends(get_settings),
 ):
     if payload.name:
@@ -32,27 +29,28 @@ async def start_assessment(
         assessment_type = "default"
         try:
             numeric_assessment_id = int(str(assessment_id))
-            assessment = get_assessment(settings, numeric_assessment_id)
+            assessment = await get_assessment(settings, numeric_assessment_id)
             if assessment is not None:
                 assessment_type = assessment.assessment_type
         except ValueError:
             pass
+        # Building the boto3 client and signing the URL blocks; keep it off the loop.
+        download_url = await run_db(settings, generate_assessment_download_link, settings)
         return {
-            "downloadUrl": generate_assessment_download_link(settings),
+            "downloadUrl": download_url,
             "assessmentId": assessment_id,
             "assessmentType": assessment_type,
             "s3Key": settings.assessment_object_key,
         }
 
-    create_and_send_invite(payload.email, settings)
-    background_tasks.add_task(schedule_reminder_email, payload.email, settings)
+    await run_db(settings, create_and_send_invite, payload.email, settings)
+    await run_db(settings, schedule_reminder_email, payload.email, settings)
     return {"message": "Assessment sent to candidate."}
 
 
 @legacy_router.post("/start-assessment", include_in_schema=False)
 async def start_assessment_legacy(
     payload: StartAssessmentRequest,
-    background_tasks: BackgroundTasks,
     settings: Settings = Depends(get_settings),
 ):
-    return await start_assessment(payload, background_tasks, settings)
+    return await start_assessment(payload, settings)
@@ -6,13 +6,16 @@ import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Request, UploadFile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
 from fastapi.responses import JSONResponse
 
 from app.core.config import Settings, get_settings
+from app.core.responses import FastJSONResponse, JSONFragment
 from app.services.assessment import generate_assessment_download_link
 from app.services.assessment_store import (
+    CandidateRecord,
     ReportRecord,
+    assessment_exists,
     get_assessment,
     get_latest_candidate_by_assessment,
     get_latest_reflection_key_for_candidate,
@@ -23,8 +26,10 @@ from app.services.assessment_store import (
     record_reflection_upload,
     upsert_report,
 )
+from app.services.async_files import append_bytes, save_upload, write_bytes
+from app.services.async_store import run_db
 from app.services.invite_store import get_invite_by_token
-from app.services.report_engine import run_scoring_and_store_report
+from app.services.report_queue import enqueue_report_job
 
 router = APIRouter(tags=["candidate"])
 
@@ -169,28 +174,40 @@ def _report_payload_from_record(
     candidate_email: str,
     assessment_title: str,
     submitted_at: str,
-) -> dict[str, object]:
-    return {
-        "id": report.candidate_id,
-        "assessmentId": report.assessment_id,
-        "assessmentTitle": assessment_title,
-        "name": candidate_name,
-        "email": candidate_email,
-        "score": report.score,
-        "codeQuality": report.code_quality,
-        "results": report.results,
-        "diffs": report.diffs,
-        "codeSummaryBullets": report.code_summary_bullets,
-        "reportReady": report.report_ready,
-        "error": report.error,
-        "assessmentType": report.assessment_type,
-        "appUsage": report.app_usage,
-        "totalDuration": report.total_duration,
-        "submissionFile": report.submission_file,
-        "assessmentRecordingKey": report.assessment_recording_key,
-        "reflectionRecordingKey": report.reflection_recording_key,
-        "submittedAt": submitted_at,
-    }
+) -> FastJSONResponse:
+    # The large JSON columns are already serialized in the store; embed them
+    # as fragments instead of decoding and re-encoding them per request.
+    return FastJSONResponse(
+        {
+            "id": report.candidate_id,
+            "assessmentId": report.assessment_id,
+            "assessmentTitle": assessment_title,
+            "name": candidate_name,
+            "email": candidate_email,
+            "score": report.score,
+            "codeQuality": report.code_quality,
+            "results": JSONFragment(report.results_json),
+            "diffs": JSONFragment(report.diffs_json),
+            "codeSummaryBullets": JSONFragment(report.code_summary_json),
+            "reportReady": report.report_ready,
+            "error": report.error,
+            "assessmentType": report.assessment_type,
+            "appUsage": JSONFragment(report.app_usage_json),
+            "totalDuration": report.total_duration,
+            "submissionFile": report.submission_file,
+            "assessmentRecordingKey": report.assessment_recording_key,
+            "reflectionRecordingKey": report.reflection_recording_key,
+            "submittedAt": submitted_at,
+            "stages": {
+                name: {
+                    "status": stage.get("status"),
+                    "error": stage.get("error"),
+                    "updatedAt": stage.get("updated_at"),
+                }
+                for name, stage in report.stages.items()
+            },
+        }
+    )
 
 
 def _init_pending_report(settings: Settings, candidate_id: int, assessment_id: int, assessment_type: str) -> None:
@@ -214,6 +231,25 @@ def _init_pending_report(settings: Settings, candidate_id: int, assessment_id: i
     )
 
 
+def _record_submission(settings: Settings, assessment_id: str, email: str, name: str) -> CandidateRecord | None:
+    try:
+        assessment_numeric = int(assessment_id)
+    except ValueError:
+        return None
+    assessment = get_assessment(settings, assessment_numeric)
+    if not email or assessment is None:
+        return None
+    candidate = mark_candidate_submitted(
+        settings,
+        assessment_id=assessment_numeric,
+        email=email,
+        name=name or None,
+    )
+    _init_pending_report(settings, candidate.id, assessment_numeric, assessment.assessment_type)
+    enqueue_report_job(settings, candidate)
+    return candidate
+
+
 def _upload_response_payload(
     *,
     candidate_id: int | None,
@@ -297,7 +333,7 @@ def get_presigned_upload_url(
         assessment_id = int(raw_assessment_id)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail="Invalid assessmentId") from exc
-    if get_assessment(settings, assessment_id) is None:
+    if not assessment_exists(settings, assessment_id):
         raise HTTPException(status_code=404, detail="Assessment not found")
     invite = get_invite_by_token(invite_token, settings)
     if invite is None or invite.assessment_id != assessment_id or invite.status not in {"invited", "resent", "taken"}:
@@ -323,11 +359,10 @@ async def local_upload_put(key: str, request: Request, settings: Settings = Depe
         except ValueError as exc:
             raise HTTPException(status_code=400, detail="Invalid content-length") from exc
     dest = _recordings_destination(settings, safe_key)
-    dest.parent.mkdir(parents=True, exist_ok=True)
     body = await request.body()
     if len(body) > _LOCAL_UPLOAD_MAX_BYTES:
         raise HTTPException(status_code=413, detail="Upload too large")
-    dest.write_bytes(body)
+    await write_bytes(settings, dest, body)
     return JSONResponse({"ok": True})
 
 
@@ -345,7 +380,7 @@ def notify_recording_upload(payload: dict, settings: Settings = Depends(get_sett
             assessment_id = int(str(raw_assessment_id))
         except (TypeError, ValueError) as exc:
             raise HTTPException(status_code=400, detail="Invalid assessmentId for reflection upload") from exc
-        if get_assessment(settings, assessment_id) is None:
+        if not assessment_exists(settings, assessment_id):
             raise HTTPException(status_code=404, detail="Assessment not found")
         record_reflection_upload(
             settings,
@@ -379,7 +414,7 @@ def start_multipart_upload(payload: dict, settings: Settings = Depends(get_setti
 
 
 @router.post("/api/recording/upload-part")
-async def upload_part(request: Request):
+async def upload_part(request: Request, settings: Settings = Depends(get_settings)):
     upload_id = request.headers.get("x-upload-id")
     part_number = request.headers.get("x-part-number")
     key = request.headers.get("x-s3-key")
@@ -401,8 +436,7 @@ async def upload_part(request: Request):
     if not body:
         raise HTTPException(status_code=400, detail="Empty part payload")
     tmp_path = Path(str(session["tmp_path"]))
-    with tmp_path.open("ab") as handle:
-        handle.write(body)
+    await append_bytes(settings, tmp_path, body)
     etag = hashlib.md5(body).hexdigest()  # noqa: S324
     cast_parts = session["parts"]
     if isinstance(cast_parts, list):
@@ -449,7 +483,6 @@ def abort_upload(payload: dict):
 
 @router.post("/upload-zip")
 async def upload_zip(
-    background_tasks: BackgroundTasks,
     zipFile: UploadFile | None = File(default=None),
     assessmentId: str = Form("default"),
     name: str = Form(""),
@@ -463,26 +496,9 @@ async def upload_zip(
             original_name = f"{original_name}.zip"
         file_name = f"{assessmentId}-{uuid.uuid4().hex}-{original_name}"
         dest = Path(settings.local_submissions_dir) / _safe_key(file_name)
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        data = await zipFile.read()
-        dest.write_bytes(data)
+        await save_upload(settings, zipFile, dest)
         dest_name = dest.name
-    candidate = None
-    try:
-        assessment_numeric = int(assessmentId)
-        assessment = get_assessment(settings, assessment_numeric)
-        if email and assessment is not None:
-            candidate = mark_candidate_submitted(
-                settings,
-                assessment_id=assessment_numeric,
-                email=email,
-                name=name or None,
-            )
-            _init_pending_report(settings, candidate.id, assessment_numeric, assessment.assessment_type)
-    except ValueError:
-        pass
-    if candidate is not None:
-        background_tasks.add_task(run_scoring_and_store_report, settings, candidate)
+    candidate = await run_db(settings, _record_submission, settings, assessmentId, email, name)
     return _upload_response_payload(
         candidate_id=candidate.id if candidate is not None else None,
         assessment_id=assessmentId,
@@ -492,7 +508,6 @@ async def upload_zip(
 
 @router.post("/upload-assessment4")
 async def upload_assessment4(
-    background_tasks: BackgroundTasks,
     submissionZip: UploadFile | None = File(default=None),
     notebookFile: UploadFile | None = File(default=None),
     assessmentId: str = Form("default"),
@@ -511,33 +526,16 @@ async def upload_assessment4(
         zip_name = f"{zip_name}.zip"
     zip_dest_name = f"{assessmentId}-{upload_token}-{zip_name}"
     zip_dest = Path(settings.local_submissions_dir) / _safe_key(zip_dest_name)
-    zip_dest.parent.mkdir(parents=True, exist_ok=True)
-    zip_dest.write_bytes(await submissionZip.read())
+    await save_upload(settings, submissionZip, zip_dest)
 
     notebook_name = notebookFile.filename or "notebook.ipynb"
     if not notebook_name.lower().endswith(".ipynb"):
         notebook_name = f"{notebook_name}.ipynb"
     notebook_dest_name = f"{assessmentId}-{upload_token}-{notebook_name}"
     notebook_dest = Path(settings.local_submissions_dir) / _safe_key(notebook_dest_name)
-    notebook_dest.write_bytes(await notebookFile.read())
-
-    candidate = None
-    try:
-        assessment_numeric = int(assessmentId)
-        assessment = get_assessment(settings, assessment_numeric)
-        if email and assessment is not None:
-            candidate = mark_candidate_submitted(
-                settings,
-                assessment_id=assessment_numeric,
-                email=email,
-                name=name or None,
-            )
-            _init_pending_report(settings, candidate.id, assessment_numeric, assessment.assessment_type)
-    except ValueError:
-        pass
+    await save_upload(settings, notebookFile, notebook_dest)
 
-    if candidate is not None:
-        background_tasks.add_task(run_scoring_and_store_report, settings, candidate)
+    candidate = await run_db(settings, _record_submission, settings, assessmentId, email, name)
 
     return _upload_response_payload(
         candidate_id=candidate.id if candidate is not None else None,
@@ -1,16 +1,24 @@
+import base64
+import json
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from app.core.config import Settings, get_settings
+from app.core.responses import FastJSONResponse
 from app.services.assessment_store import (
+    assessment_exists,
     assessment_title_exists,
     create_assessment,
     get_assessment,
+    get_candidate_by_id,
     get_question,
-    list_assessments,
+    list_assessments_page,
     list_candidates,
+    list_candidates_page,
     list_questions,
 )
+from app.services.report_queue import ReportPriority, enqueue_report_job, get_report_scheduler
 
 router = APIRouter(prefix="/api", tags=["dashboard"])
 
@@ -22,26 +30,53 @@ class CreateAssessmentRequest(BaseModel):
     jobDesc: str | None = None
 
 
+def _encode_cursor(key: tuple[str, int] | None) -> str | None:
+    if key is None:
+        return None
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str | None) -> tuple[str, int] | None:
+    if not cursor:
+        return None
+    try:
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return str(sort_value), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
 @router.get("/assessments")
-def get_assessments(settings: Settings = Depends(get_settings)):
-    assessments = list_assessments(settings)
-    return {
-        "assessments": [
-            {
-                "id": item.id,
-                "title": item.title,
-                "role": item.role,
-                "status": item.status,
-                "createdAt": item.created_at,
-                "candidateCount": item.candidate_count,
-                "questionId": item.question_id,
-                "jobLink": item.job_link,
-                "jobDesc": item.job_desc,
-                "assessmentType": item.assessment_type,
-            }
-            for item in assessments
-        ]
-    }
+def get_assessments(
+    limit: int = Query(default=100, ge=1, le=500),
+    cursor: str | None = Query(default=None),
+    status: str | None = Query(default=None),
+    search: str | None = Query(default=None),
+    settings: Settings = Depends(get_settings),
+):
+    assessments, next_key = list_assessments_page(
+        settings, limit=limit, after=_decode_cursor(cursor), status=status, search=search
+    )
+    return FastJSONResponse(
+        {
+            "nextCursor": _encode_cursor(next_key),
+            "assessments": [
+                {
+                    "id": item.id,
+                    "title": item.title,
+                    "role": item.role,
+                    "status": item.status,
+                    "createdAt": item.created_at,
+                    "candidateCount": item.candidate_count,
+                    "questionId": item.question_id,
+                    "jobLink": item.job_link,
+                    "jobDesc": item.job_desc,
+                    "assessmentType": item.assessment_type,
+                }
+                for item in assessments
+            ]
+        }
+    )
 
 
 @router.get("/assessments/check-title")
@@ -53,7 +88,7 @@ def check_assessment_title(title: str = Query(...), settings: Settings = Depends
 
 @router.get("/assessments/{assessment_id}")
 def get_assessment_detail(assessment_id: int, settings: Settings = Depends(get_settings)):
-    assessment = get_assessment(settings, assessment_id)
+    assessment = get_assessment(settings, assessment_id, fresh=True)
     if assessment is None:
         raise HTTPException(status_code=404, detail="Assessment not found")
     question = get_question(settings, assessment.question_id) if assessment.question_id else None
@@ -89,22 +124,36 @@ def get_assessment_detail(assessment_id: int, settings: Settings = Depends(get_s
 @router.get("/candidates")
 def get_candidates(
     assessment_id: int | None = Query(default=None, alias="assessmentId"),
+    limit: int = Query(default=100, ge=1, le=500),
+    cursor: str | None = Query(default=None),
+    status: str | None = Query(default=None),
+    search: str | None = Query(default=None),
     settings: Settings = Depends(get_settings),
 ):
-    candidates = list_candidates(settings, assessment_id=assessment_id)
-    return {
-        "candidates": [
-            {
-                "id": item.id,
-                "assessmentId": item.assessment_id,
-                "email": item.email,
-                "name": item.name,
-                "status": item.status,
-                "invitedAt": item.invited_at,
-            }
-            for item in candidates
-        ]
-    }
+    candidates, next_key = list_candidates_page(
+        settings,
+        limit=limit,
+        assessment_id=assessment_id,
+        after=_decode_cursor(cursor),
+        status=status,
+        search=search,
+    )
+    return FastJSONResponse(
+        {
+            "nextCursor": _encode_cursor(next_key),
+            "candidates": [
+                {
+                    "id": item.id,
+                    "assessmentId": item.assessment_id,
+                    "email": item.email,
+                    "name": item.name,
+                    "status": item.status,
+                    "invitedAt": item.invited_at,
+                }
+                for item in candidates
+            ]
+        }
+    )
 
 
 @router.get("/questions")
@@ -170,3 +219,29 @@ def new_assessment(payload: CreateAssessmentRequest, settings: Settings = Depend
         "role": created.role,
         "status": created.status,
     }
+
+
+@router.post("/reports/{candidate_id}/rerun")
+def rerun_report(candidate_id: int, settings: Settings = Depends(get_settings)):
+    candidate = get_candidate_by_id(settings, candidate_id)
+    if candidate is None:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+    queued = enqueue_report_job(settings, candidate, ReportPriority.RERUN)
+    return {"candidateId": candidate.id, "queued": queued}
+
+
+@router.post("/assessments/{assessment_id}/reports/backfill")
+def backfill_reports(assessment_id: int, settings: Settings = Depends(get_settings)):
+    if not assessment_exists(settings, assessment_id):
+        raise HTTPException(status_code=404, detail="Assessment not found")
+    queued = sum(
+        1
+        for candidate in list_candidates(settings, assessment_id=assessment_id)
+        if candidate.status == "submitted" and enqueue_report_job(settings, candidate, ReportPriority.BACKFILL)
+    )
+    return {"assessmentId": assessment_id, "queued": queued}
+
+
+@router.get("/report-jobs/metrics")
+def report_job_metrics(settings: Settings = Depends(get_settings)):
+    return get_report_scheduler(settings).metrics()
@@ -3,7 +3,7 @@ from pydantic import BaseModel, EmailStr
 
 from app.core.config import Settings, get_settings
 from app.services.invites import (
-    create_and_send_invite,
+    create_and_send_bulk_invites,
     mark_taken,
     resend_invite,
     verify_invite,
@@ -35,16 +35,19 @@ class MarkTakenRequest(BaseModel):
 
 @router.post("/bulk")
 def send_bulk_invites(payload: BulkInviteRequest, settings: Settings = Depends(get_settings)):
-    invites = [
-        create_and_send_invite(
-            candidate.email,
-            settings,
-            assessment_id=payload.assessmentId,
-            candidate_name=candidate.name,
-        )
-        for candidate in payload.candidates
-    ]
-    return {"message": "Invites sent.", "count": len(invites), "invites": invites}
+    invites, deliveries = create_and_send_bulk_invites(
+        [(candidate.email, candidate.name) for candidate in payload.candidates],
+        settings,
+        assessment_id=payload.assessmentId,
+    )
+    # Emails are delivered by the outbox dispatcher after this returns.
+    return {
+        "message": f"Invites created; {len(deliveries)} emails queued for delivery.",
+        "count": len(invites),
+        "queued": len(deliveries),
+        "invites": invites,
+        "results": deliveries,
+    }
 
 
 @router.post("/resend")
@@ -13,16 +13,37 @@ class Settings(BaseSettings):
     app_base_url: str = "http://localhost:8000"
     frontend_base_url: str = "http://localhost:5173"
     cors_origins: list[str] = ["*"]
+    compression_enabled: bool = True
+    compression_minimum_size: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+    compression_content_types: list[str] = [
+        "application/json",
+        "text/plain",
+        "text/html",
+        "text/css",
+        "text/javascript",
+        "application/javascript",
+    ]
 
     email_provider: Literal["console", "smtp", "aws_ses"] = "console"
     email_from: str = "assessment@example.com"
     ses_from_email: str | None = None
+    ses_max_send_rate: float | None = None
     smtp_host: str = "localhost"
     smtp_port: int = 1025
     smtp_username: str | None = None
     smtp_password: str | None = None
     smtp_use_tls: bool = False
     smtp_use_ssl: bool = False
+    smtp_pool_size: int = 4
+    smtp_pool_idle_seconds: int = 60
+    email_send_concurrency: int = 8
+    email_outbox_batch_size: int = 50
+    email_outbox_poll_seconds: float = 1.0
+    email_outbox_max_attempts: int = 5
+    email_outbox_base_backoff_seconds: int = 30
+    email_outbox_max_backoff_seconds: int = 60 * 60
 
     storage_provider: Literal["local", "s3"] = "local"
     local_assets_dir: str = "assets"
@@ -39,8 +60,30 @@ class Settings(BaseSettings):
     presigned_url_expiration_seconds: int = 3600
     reminder_delay_seconds: int = 45 * 60
     invite_expiry_seconds: int = 7 * 24 * 60 * 60
+    invite_sweep_interval_seconds: int = 60
+
+    report_workers: int = 2
+
+    threadpool_max_workers: int = 100
+    db_executor_workers: int = 8
+    file_io_workers: int = 4
+
+    metadata_cache_ttl_seconds: float = 300.0
+    metadata_cache_check_seconds: float = 2.0
+
+    rag_eval_questions_path: str = "assets/rag_eval_questions.json"
+    rag_eval_top_k: int = 5
+    rag_eval_batch_size: int = 8
+    rag_eval_concurrency: int = 4
+    rag_eval_timeout_seconds: int = 120
+    rag_eval_command_prefix: list[str] = []
+    json_expected_outputs_dir: str = "assets/json_expected"
 
     aws_region: str = "us-east-1"
+    aws_endpoint_url: str | None = None
+    aws_max_pool_connections: int = 10
+    aws_tcp_keepalive: bool = True
+    aws_max_attempts: int = 3
 
     @field_validator("cors_origins", mode="before")
     @classmethod
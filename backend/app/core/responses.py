@@ -0,0 +1,78 @@
+import json
+import uuid
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+_ORJSON_FRAGMENTS = orjson is not None and hasattr(orjson, "Fragment")
+
+
+class JSONFragment:
+    """Already-serialized JSON embedded into a response body as-is.
+
+    Use it for JSON text read straight from the database so it is never
+    decoded and re-encoded on the way out.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: str | bytes) -> None:
+        self.data = data if isinstance(data, bytes) else data.encode("utf-8")
+
+
+def _dumps_with_markers(content: Any, dumps: Any) -> bytes:
+    # Fallback for encoders without native fragment support: serialize each
+    # fragment as a unique placeholder string, then swap the raw JSON in.
+    prefix = f"__json_fragment_{uuid.uuid4().hex}_"
+    fragments: list[bytes] = []
+
+    def default(value: Any) -> str:
+        if isinstance(value, JSONFragment):
+            fragments.append(value.data)
+            return f"{prefix}{len(fragments) - 1}"
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    body = dumps(content, default)
+    for index, data in enumerate(fragments):
+        body = body.replace(f'"{prefix}{index}"'.encode("ascii"), data, 1)
+    return body
+
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, JSONFragment):
+        return orjson.Fragment(value.data)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _orjson_dumps(content: Any, default: Any) -> bytes:
+    return orjson.dumps(content, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _stdlib_dumps(content: Any, default: Any) -> bytes:
+    return json.dumps(
+        content, default=default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def dumps_json(content: Any) -> bytes:
+    """Serialize ``content`` to compact UTF-8 JSON, with orjson when it is installed."""
+    if _ORJSON_FRAGMENTS:
+        return _orjson_dumps(content, _orjson_default)
+    return _dumps_with_markers(content, _orjson_dumps if orjson is not None else _stdlib_dumps)
+
+
+class FastJSONResponse(JSONResponse):
+    """Default response class: orjson when available, stdlib ``json`` otherwise.
+
+    Endpoints that return this class directly also skip FastAPI's
+    ``jsonable_encoder`` pass, so content must already be plain JSON types
+    (or :class:`JSONFragment`).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
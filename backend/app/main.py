@@ -1,5 +1,7 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -8,12 +10,39 @@ from app.api.assessment import legacy_router, router as assessment_router
 from app.api.candidate import router as candidate_router
 from app.api.dashboard import router as dashboard_router
 from app.api.invite import router as invite_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import get_settings
+from app.core.responses import FastJSONResponse
 from app.services.assessment_store import init_assessment_store
+from app.services.async_files import shutdown_file_executor
+from app.services.async_store import shutdown_db_executor
+from app.services.email_outbox import init_outbox, start_dispatcher, stop_dispatcher
+from app.services.email_scheduler import init_scheduler_store, start_scheduler, stop_scheduler
 from app.services.invite_store import init_store as init_invite_store
+from app.services.invite_store import start_invite_sweeper, stop_invite_sweeper
+from app.services.smtp_pool import close_smtp_pool
 
 settings = get_settings()
-app = FastAPI(title=settings.app_name)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Sync endpoints run on anyio's default threadpool (40 threads); async
+    # endpoints use their own DB and file executors instead.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_max_workers
+    start_dispatcher(settings)
+    start_scheduler(settings)
+    start_invite_sweeper(settings)
+    yield
+    stop_invite_sweeper()
+    stop_scheduler()
+    stop_dispatcher()
+    close_smtp_pool()
+    shutdown_file_executor()
+    shutdown_db_executor()
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan, default_response_class=FastJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -21,6 +50,15 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if settings.compression_enabled:
+    # Allowlisted text types only: zips and recordings are already compressed.
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+        content_types=settings.compression_content_types,
+    )
 
 assets_dir = Path(settings.local_assets_dir)
 assets_dir.mkdir(parents=True, exist_ok=True)
@@ -31,6 +69,8 @@ Path(settings.local_recordings_dir).mkdir(parents=True, exist_ok=True)
 Path(settings.local_db_path).parent.mkdir(parents=True, exist_ok=True)
 init_invite_store(settings)
 init_assessment_store(settings)
+init_outbox(settings)
+init_scheduler_store(settings)
 
 app.include_router(assessment_router)
 app.include_router(legacy_router)
@@ -1,27 +1,54 @@
-import asyncio
-import smtplib
-from email.message import EmailMessage
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import threading
+import time
 
 from app.core.config import Settings
-from app.services.aws_clients import s3_client, ses_client
-from app.services.email_templates import assessment_invite_email, assessment_reminder_email
+from app.services.aws_clients import s3_client, signing_identity
+from app.services.email_templates import EmailContent, render_raw_email
+from app.services.ses_sender import SendResult, get_ses_sender
+from app.services.smtp_pool import get_smtp_pool
+
+
+# Presigned download links are identical for every candidate, so they are
+# signed once per object and signing identity (region, endpoint, access key)
+# and reused until this fraction of their lifetime has elapsed, leaving the
+# rest as headroom for slow downloads. Rotating credentials also cap the
+# lifetime, since a URL stops working when the key that signed it expires.
+_PRESIGNED_REFRESH_FRACTION = 0.5
+_presigned_urls: dict[tuple[str, str, str, str | None, str | None], tuple[str, float]] = {}
+_presigned_lock = threading.Lock()
+
+
+def _presigned_download_url(settings: Settings, bucket: str, key: str) -> str:
+    now = time.monotonic()
+    access_key, credentials_ttl = signing_identity(settings)
+    cache_key = (bucket, key, settings.aws_region, settings.aws_endpoint_url or None, access_key)
+    cached = _presigned_urls.get(cache_key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+    with _presigned_lock:
+        cached = _presigned_urls.get(cache_key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+        url = s3_client(settings).generate_presigned_url(
+            "get_object",
+            Params={"Bucket": bucket, "Key": key},
+            ExpiresIn=settings.presigned_url_expiration_seconds,
+        )
+        lifetime = settings.presigned_url_expiration_seconds
+        if credentials_ttl is not None:
+            lifetime = min(lifetime, credentials_ttl)
+        # Entries for rotated-out keys are never hit again; drop them.
+        for stale_key in [k for k, (_, expires) in _presigned_urls.items() if expires <= now]:
+            del _presigned_urls[stale_key]
+        _presigned_urls[cache_key] = (url, now + lifetime * _PRESIGNED_REFRESH_FRACTION)
+        return url
 
 
 def generate_assessment_download_link(settings: Settings) -> str:
     if settings.storage_provider == "local":
         return f"{settings.app_base_url}/assets/{settings.local_assessment_filename}"
 
-    s3 = s3_client(settings)
-    return s3.generate_presigned_url(
-        "get_object",
-        Params={
-            "Bucket": settings.assessment_bucket,
-            "Key": settings.assessment_object_key,
-        },
-        ExpiresIn=settings.presigned_url_expiration_seconds,
-    )
+    return _presigned_download_url(settings, settings.assessment_bucket, settings.assessment_object_key)
 
 
 def _sender_email(settings: Settings) -> str:
@@ -36,85 +63,35 @@ def _send_via_console(to_email: str, subject: str, body: str) -> None:
     print("=== End Email ===\n")
 
 
-def _send_via_smtp(to_email: str, subject: str, html_body: str, text_body: str, settings: Settings) -> None:
-    msg = EmailMessage()
-    msg["Subject"] = subject
-    msg["From"] = _sender_email(settings)
-    msg["To"] = to_email
-    msg.set_content(text_body)
-    msg.add_alternative(html_body, subtype="html")
-
-    if settings.smtp_use_ssl:
-        with smtplib.SMTP_SSL(settings.smtp_host, settings.smtp_port) as server:
-            if settings.smtp_username:
-                server.login(settings.smtp_username, settings.smtp_password or "")
-            server.send_message(msg)
-        return
-
-    with smtplib.SMTP(settings.smtp_host, settings.smtp_port) as server:
-        if settings.smtp_use_tls:
-            server.starttls()
-        if settings.smtp_username:
-            server.login(settings.smtp_username, settings.smtp_password or "")
-        server.send_message(msg)
-
-
-def send_assessment_email(
-    to_email: str,
-    instructions_link: str,
-    settings: Settings,
-    *,
-    is_resend: bool = False,
-) -> None:
-    content = assessment_invite_email(instructions_link=instructions_link, is_resend=is_resend)
+def _send_via_smtp(to_email: str, raw_message: bytes, settings: Settings) -> None:
+    get_smtp_pool(settings).send_raw(_sender_email(settings), [to_email], raw_message)
 
-    if settings.email_provider == "console":
-        _send_via_console(to_email, content.subject, content.text_body)
-        return
-
-    if settings.email_provider == "smtp":
-        _send_via_smtp(to_email, content.subject, content.html_body, content.text_body, settings)
-        return
-
-    msg = MIMEMultipart()
-    msg["Subject"] = content.subject
-    msg["From"] = _sender_email(settings)
-    msg["To"] = to_email
-    msg.attach(MIMEText(content.html_body, "html"))
-
-    ses = ses_client(settings)
-    ses.send_raw_email(
-        Source=_sender_email(settings),
-        Destinations=[to_email],
-        RawMessage={"Data": msg.as_string()},
-    )
 
+def _send_via_ses(to_email: str, raw_message: bytes, settings: Settings) -> str | None:
+    result = get_ses_sender(settings).send(_sender_email(settings), to_email, raw_message)
+    if result.error is not None:
+        raise RuntimeError(result.error)
+    return result.message_id
 
-def send_reminder_email(to_email: str, settings: Settings) -> None:
-    content = assessment_reminder_email()
 
+def send_email(to_email: str, content: EmailContent, settings: Settings) -> str | None:
+    """Send one message; returns the provider message ID when the provider reports one."""
     if settings.email_provider == "console":
         _send_via_console(to_email, content.subject, content.text_body)
-        return
+        return None
 
+    raw_message = render_raw_email(content, sender=_sender_email(settings), to_email=to_email)
     if settings.email_provider == "smtp":
-        _send_via_smtp(to_email, content.subject, content.html_body, content.text_body, settings)
-        return
-
-    msg = MIMEMultipart()
-    msg["Subject"] = content.subject
-    msg["From"] = _sender_email(settings)
-    msg["To"] = to_email
-    msg.attach(MIMEText(content.html_body, "html"))
-
-    ses = ses_client(settings)
-    ses.send_raw_email(
-        Source=_sender_email(settings),
-        Destinations=[to_email],
-        RawMessage={"Data": msg.as_string()},
-    )
+        _send_via_smtp(to_email, raw_message, settings)
+        return None
+
+    return _send_via_ses(to_email, raw_message, settings)
 
 
-async def schedule_reminder_email(to_email: str, settings: Settings) -> None:
-    await asyncio.sleep(settings.reminder_delay_seconds)
-    send_reminder_email(to_email, settings)
+def send_emails_via_ses(messages: list[tuple[str, EmailContent]], settings: Settings) -> list[SendResult]:
+    sender = _sender_email(settings)
+    return get_ses_sender(settings).send_batch(
+        sender,
+        [(to_email, render_raw_email(content, sender=sender, to_email=to_email)) for to_email, content in messages],
+    )
+
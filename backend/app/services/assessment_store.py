@@ -1,13 +1,19 @@
 import json
 import sqlite3
-from dataclasses import dataclass
+import string
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 from app.core.config import Settings
+from app.services.metadata_cache import VersionedCache
+from app.services.sql_records import fetch_all, fetch_one, record_columns, record_factory
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AssessmentRecord:
     id: int
     title: str
@@ -21,7 +27,7 @@ class AssessmentRecord:
     assessment_type: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CandidateRecord:
     id: int
     assessment_id: int
@@ -31,7 +37,7 @@ class CandidateRecord:
     invited_at: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QuestionRecord:
     id: int
     title: str
@@ -44,24 +50,88 @@ class QuestionRecord:
     assessment_type: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ReportRecord:
+    """A stored report. JSON columns stay as their raw text until first accessed.
+
+    ``results``, ``diffs``, ``code_summary_bullets``, ``app_usage`` and
+    ``stages`` decode on first access and are memoized; the ``*_json``
+    fields can be passed through to a response without any decoding.
+    """
+
     candidate_id: int
     assessment_id: int
     score: int | None
     code_quality: int | None
-    results: list[dict[str, object]]
-    diffs: list[dict[str, object]]
-    code_summary_bullets: list[str]
+    results_json: str
+    diffs_json: str
+    code_summary_json: str
     report_ready: bool
     error: str | None
     assessment_type: str
-    app_usage: list[dict[str, object]]
+    app_usage_json: str
     total_duration: int | None
     submission_file: str | None
     assessment_recording_key: str | None
     reflection_recording_key: str | None
     updated_at: str
+    stages_json: str
+    _decoded: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def _decode(self, column: str) -> Any:
+        decoded = self._decoded
+        if column not in decoded:
+            decoded[column] = json.loads(getattr(self, column))
+        return decoded[column]
+
+    @property
+    def results(self) -> list[dict[str, object]]:
+        return self._decode("results_json")
+
+    @property
+    def diffs(self) -> list[dict[str, object]]:
+        return self._decode("diffs_json")
+
+    @property
+    def code_summary_bullets(self) -> list[str]:
+        return self._decode("code_summary_json")
+
+    @property
+    def app_usage(self) -> list[dict[str, object]]:
+        return self._decode("app_usage_json")
+
+    @property
+    def stages(self) -> dict[str, dict[str, object]]:
+        return self._decode("stages_json")
+
+
+def _or_default(assessment_type: str | None) -> str:
+    return assessment_type or "default"
+
+
+def _json_text_or(default: str) -> Callable[[str | None], str]:
+    return lambda value: value or default
+
+
+# One row factory per table: queries select the record's columns in field
+# order and the factory builds the frozen record straight from the row tuple.
+_ASSESSMENT_COLUMNS = record_columns(AssessmentRecord)
+_assessment_record = record_factory(AssessmentRecord, assessment_type=_or_default)
+_CANDIDATE_COLUMNS = record_columns(CandidateRecord)
+_candidate_record = record_factory(CandidateRecord)
+_QUESTION_COLUMNS = record_columns(QuestionRecord)
+_question_record = record_factory(QuestionRecord, assessment_type=_or_default)
+_REPORT_COLUMNS = record_columns(ReportRecord)
+_report_record = record_factory(
+    ReportRecord,
+    results_json=_json_text_or("[]"),
+    diffs_json=_json_text_or("[]"),
+    code_summary_json=_json_text_or("[]"),
+    report_ready=bool,
+    assessment_type=_or_default,
+    app_usage_json=_json_text_or("[]"),
+    stages_json=_json_text_or("{}"),
+)
 
 
 def _connect(settings: Settings) -> sqlite3.Connection:
@@ -76,12 +146,13 @@ def _iso_now() -> str:
     return datetime.now(UTC).isoformat()
 
 
-def _ensure_column(connection: sqlite3.Connection, table: str, column: str, column_type: str) -> None:
+def _ensure_column(connection: sqlite3.Connection, table: str, column: str, column_type: str) -> bool:
     rows = connection.execute(f"PRAGMA table_info({table})").fetchall()
     existing = {str(row["name"]) for row in rows}
     if column in existing:
-        return
+        return False
     connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+    return True
 
 
 def init_assessment_store(settings: Settings) -> None:
@@ -97,7 +168,8 @@ def init_assessment_store(settings: Settings) -> None:
                 question_id INTEGER,
                 job_link TEXT,
                 job_desc TEXT,
-                assessment_type TEXT NOT NULL DEFAULT 'default'
+                assessment_type TEXT NOT NULL DEFAULT 'default',
+                candidate_count INTEGER NOT NULL DEFAULT 0
             )
             """
         )
@@ -148,11 +220,21 @@ def init_assessment_store(settings: Settings) -> None:
                 assessment_recording_key TEXT,
                 reflection_recording_key TEXT,
                 updated_at TEXT NOT NULL,
+                stages_json TEXT NOT NULL DEFAULT '{}',
                 FOREIGN KEY (candidate_id) REFERENCES candidates(id),
                 FOREIGN KEY (assessment_id) REFERENCES assessments(id)
             )
             """
         )
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS metadata_version (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                version INTEGER NOT NULL
+            )
+            """
+        )
+        connection.execute("INSERT OR IGNORE INTO metadata_version (id, version) VALUES (1, 0)")
         connection.execute(
             """
             CREATE TABLE IF NOT EXISTS reflection_uploads (
@@ -166,21 +248,120 @@ def init_assessment_store(settings: Settings) -> None:
             )
             """
         )
+        # Email lookups filter on lower(email), so the indexes are built on
+        # that expression; a plain email column index could never serve them.
+        connection.execute("DROP INDEX IF EXISTS idx_reflection_uploads_lookup")
         connection.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_reflection_uploads_lookup
-            ON reflection_uploads(assessment_id, email, uploaded_at DESC)
+            CREATE INDEX IF NOT EXISTS idx_reflection_uploads_email
+            ON reflection_uploads(assessment_id, lower(email), uploaded_at DESC)
             """
         )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_candidates_assessment_email ON candidates(assessment_id, lower(email))"
+        )
+        # Keyset pagination walks these in (invited_at, id) / (created_at, id) order.
+        connection.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_candidates_assessment_invited
+            ON candidates(assessment_id, invited_at DESC, id DESC)
+            """
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_candidates_invited ON candidates(invited_at DESC, id DESC)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_assessments_created ON assessments(created_at DESC, id DESC)"
+        )
+        # Candidate search resolves email/name prefixes as range scans on these.
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_candidates_assessment_name ON candidates(assessment_id, lower(name))"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_candidates_email_lower ON candidates(lower(email))")
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_candidates_name_lower ON candidates(lower(name))")
 
         _ensure_column(connection, "assessments", "question_id", "INTEGER")
         _ensure_column(connection, "assessments", "job_link", "TEXT")
         _ensure_column(connection, "assessments", "job_desc", "TEXT")
         _ensure_column(connection, "assessments", "assessment_type", "TEXT NOT NULL DEFAULT 'default'")
         _ensure_column(connection, "questions", "assessment_type", "TEXT NOT NULL DEFAULT 'default'")
+        _ensure_column(connection, "reports", "stages_json", "TEXT NOT NULL DEFAULT '{}'")
+        if _ensure_column(connection, "assessments", "candidate_count", "INTEGER NOT NULL DEFAULT 0"):
+            connection.execute(
+                """
+                UPDATE assessments
+                SET candidate_count = (SELECT COUNT(*) FROM candidates c WHERE c.assessment_id = assessments.id)
+                """
+            )
+        _create_candidate_count_triggers(connection)
 
         _seed_questions(connection)
         _seed_demo_rows(connection)
+        _bump_metadata_version(connection)
+    _metadata_cache(settings).invalidate()
+
+
+def _bump_metadata_version(connection: sqlite3.Connection) -> None:
+    # Call inside the transaction that changes assessments or questions, so
+    # every worker's metadata cache drops its entries on its next version check.
+    connection.execute("UPDATE metadata_version SET version = version + 1 WHERE id = 1")
+
+
+_metadata_caches: dict[str, VersionedCache] = {}
+_metadata_caches_lock = threading.Lock()
+
+
+def _metadata_cache(settings: Settings) -> VersionedCache:
+    with _metadata_caches_lock:
+        cache = _metadata_caches.get(settings.local_db_path)
+        if cache is None:
+
+            def read_version() -> int:
+                with _connect(settings) as connection:
+                    row = connection.execute("SELECT version FROM metadata_version WHERE id = 1").fetchone()
+                    return int(row["version"]) if row is not None else 0
+
+            cache = VersionedCache(
+                read_version,
+                ttl_seconds=settings.metadata_cache_ttl_seconds,
+                check_seconds=settings.metadata_cache_check_seconds,
+            )
+            _metadata_caches[settings.local_db_path] = cache
+        return cache
+
+
+def _create_candidate_count_triggers(connection: sqlite3.Connection) -> None:
+    # assessments.candidate_count is maintained by triggers, so every insert
+    # path (single, bulk executemany, seed) updates it in the same transaction.
+    connection.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_candidates_count_insert
+        AFTER INSERT ON candidates
+        BEGIN
+            UPDATE assessments SET candidate_count = candidate_count + 1 WHERE id = NEW.assessment_id;
+        END
+        """
+    )
+    connection.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_candidates_count_delete
+        AFTER DELETE ON candidates
+        BEGIN
+            UPDATE assessments SET candidate_count = candidate_count - 1 WHERE id = OLD.assessment_id;
+        END
+        """
+    )
+    connection.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_candidates_count_move
+        AFTER UPDATE OF assessment_id ON candidates
+        WHEN OLD.assessment_id IS NOT NEW.assessment_id
+        BEGIN
+            UPDATE assessments SET candidate_count = candidate_count - 1 WHERE id = OLD.assessment_id;
+            UPDATE assessments SET candidate_count = candidate_count + 1 WHERE id = NEW.assessment_id;
+        END
+        """
+    )
 
 
 def _seed_demo_rows(connection: sqlite3.Connection) -> None:
@@ -265,103 +446,194 @@ def _seed_questions(connection: sqlite3.Connection) -> None:
         )
 
 
-def _assessment_row_to_record(row: sqlite3.Row) -> AssessmentRecord:
-    return AssessmentRecord(
-        id=int(row["id"]),
-        title=str(row["title"]),
-        role=str(row["role"]),
-        status=str(row["status"]),
-        created_at=str(row["created_at"]),
-        candidate_count=int(row["candidate_count"]),
-        question_id=row["question_id"],
-        job_link=row["job_link"],
-        job_desc=row["job_desc"],
-        assessment_type=str(row["assessment_type"] or "default"),
-    )
+def list_assessments(settings: Settings) -> list[AssessmentRecord]:
+    with _connect(settings) as connection:
+        return fetch_all(
+            connection,
+            _assessment_record,
+            f"""
+            SELECT {_ASSESSMENT_COLUMNS}
+            FROM assessments
+            ORDER BY created_at DESC
+            """,
+        )
 
 
-def list_assessments(settings: Settings) -> list[AssessmentRecord]:
+def _load_assessment(settings: Settings, assessment_id: int) -> AssessmentRecord | None:
     with _connect(settings) as connection:
-        rows = connection.execute(
-            """
-            SELECT
-                a.id,
-                a.title,
-                a.role,
-                a.status,
-                a.created_at,
-                a.question_id,
-                a.job_link,
-                a.job_desc,
-                a.assessment_type,
-                COALESCE(COUNT(c.id), 0) AS candidate_count
-            FROM assessments a
-            LEFT JOIN candidates c ON c.assessment_id = a.id
-            GROUP BY a.id
-            ORDER BY a.created_at DESC
-            """
-        ).fetchall()
-        return [_assessment_row_to_record(row) for row in rows]
+        return fetch_one(
+            connection,
+            _assessment_record,
+            f"SELECT {_ASSESSMENT_COLUMNS} FROM assessments WHERE id = ?",
+            (assessment_id,),
+        )
+
+
+def get_assessment(settings: Settings, assessment_id: int, *, fresh: bool = False) -> AssessmentRecord | None:
+    """Look up an assessment through the metadata cache.
+
+    Cached records may carry a ``candidate_count`` up to the cache TTL old;
+    pass ``fresh=True`` where the count is shown.
+    """
+    if fresh:
+        return _load_assessment(settings, assessment_id)
+    return _metadata_cache(settings).get(
+        ("assessment", assessment_id), lambda: _load_assessment(settings, assessment_id)
+    )
+
+
+# SQLite's built-in lower() only folds ASCII letters, so search prefixes are
+# folded the same way; str.lower() would also fold e.g. "É" and then miss rows
+# whose lower(column) kept it.
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
 
 
-def get_assessment(settings: Settings, assessment_id: int) -> AssessmentRecord | None:
+def _sqlite_lower(value: str) -> str:
+    return value.translate(_ASCII_LOWER)
+
+
+def _like_prefix(prefix: str) -> str:
+    escaped = _sqlite_lower(prefix.strip()).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+def _prefix_range(prefix: str) -> tuple[str, str]:
+    # [prefix, prefix + max code point) holds every string starting with
+    # prefix and, unlike LIKE, is served by an index on the lower() expression.
+    lowered = _sqlite_lower(prefix.strip())
+    return lowered, f"{lowered}\U0010ffff"
+
+
+def list_assessments_page(
+    settings: Settings,
+    *,
+    limit: int,
+    after: tuple[str, int] | None = None,
+    status: str | None = None,
+    search: str | None = None,
+) -> tuple[list[AssessmentRecord], tuple[str, int] | None]:
+    """Return one page ordered newest first plus the ``(created_at, id)`` key to resume after."""
+    clauses: list[str] = []
+    params: list[object] = []
+    if after is not None:
+        clauses.append("(created_at, id) < (?, ?)")
+        params.extend(after)
+    if status:
+        clauses.append("status = ?")
+        params.append(status)
+    if search and search.strip():
+        clauses.append("lower(title) LIKE ? ESCAPE '\\'")
+        params.append(_like_prefix(search))
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
     with _connect(settings) as connection:
-        row = connection.execute(
-            """
-            SELECT
-                a.id,
-                a.title,
-                a.role,
-                a.status,
-                a.created_at,
-                a.question_id,
-                a.job_link,
-                a.job_desc,
-                a.assessment_type,
-                COALESCE(COUNT(c.id), 0) AS candidate_count
-            FROM assessments a
-            LEFT JOIN candidates c ON c.assessment_id = a.id
-            WHERE a.id = ?
-            GROUP BY a.id
+        records = fetch_all(
+            connection,
+            _assessment_record,
+            f"""
+            SELECT {_ASSESSMENT_COLUMNS}
+            FROM assessments
+            {where}
+            ORDER BY created_at DESC, id DESC
+            LIMIT ?
             """,
-            (assessment_id,),
-        ).fetchone()
-        if row is None:
-            return None
-        return _assessment_row_to_record(row)
+            (*params, limit + 1),
+        )
+    next_key = (records[limit - 1].created_at, records[limit - 1].id) if len(records) > limit else None
+    return records[:limit], next_key
+
+
+def assessment_exists(settings: Settings, assessment_id: int) -> bool:
+    return get_assessment(settings, assessment_id) is not None
+
+
+def list_candidates_page(
+    settings: Settings,
+    *,
+    limit: int,
+    assessment_id: int | None = None,
+    after: tuple[str, int] | None = None,
+    status: str | None = None,
+    search: str | None = None,
+) -> tuple[list[CandidateRecord], tuple[str, int] | None]:
+    """Return one page ordered by most recent invite plus the ``(invited_at, id)`` key to resume after.
+
+    ``search`` is a prefix matched against email and name, case-insensitive
+    for ASCII letters only (the same folding as SQLite's ``lower()``).
+    It runs as two index range scans (email, name), each capped at one page,
+    merged with UNION; cost grows with the rows matching the prefix rather
+    than with the size of the assessment.
+    """
+    clauses: list[str] = []
+    params: list[object] = []
+    if assessment_id is not None:
+        clauses.append("assessment_id = ?")
+        params.append(assessment_id)
+    if after is not None:
+        clauses.append("(invited_at, id) < (?, ?)")
+        params.extend(after)
+    if status:
+        clauses.append("status = ?")
+        params.append(status)
+    if search and search.strip():
+        low, high = _prefix_range(search)
+        branches = [
+            f"""
+            SELECT * FROM (
+                SELECT {_CANDIDATE_COLUMNS}
+                FROM candidates
+                WHERE {' AND '.join([*clauses, f"lower({column}) >= ? AND lower({column}) < ?"])}
+                ORDER BY invited_at DESC, id DESC
+                LIMIT ?
+            )
+            """
+            for column in ("email", "name")
+        ]
+        sql = f"""
+            SELECT {_CANDIDATE_COLUMNS}
+            FROM ({" UNION ".join(branches)})
+            ORDER BY invited_at DESC, id DESC
+            LIMIT ?
+            """
+        sql_params = [*params, low, high, limit + 1, *params, low, high, limit + 1, limit + 1]
+    else:
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"""
+            SELECT {_CANDIDATE_COLUMNS}
+            FROM candidates
+            {where}
+            ORDER BY invited_at DESC, id DESC
+            LIMIT ?
+            """
+        sql_params = [*params, limit + 1]
+    with _connect(settings) as connection:
+        records = fetch_all(connection, _candidate_record, sql, sql_params)
+    next_key = (records[limit - 1].invited_at, records[limit - 1].id) if len(records) > limit else None
+    return records[:limit], next_key
 
 
 def list_candidates(settings: Settings, assessment_id: int | None = None) -> list[CandidateRecord]:
     with _connect(settings) as connection:
         if assessment_id is None:
-            rows = connection.execute(
-                """
-                SELECT id, assessment_id, email, name, status, invited_at
-                FROM candidates
-                ORDER BY invited_at DESC
-                """
-            ).fetchall()
-        else:
-            rows = connection.execute(
-                """
-                SELECT id, assessment_id, email, name, status, invited_at
+            return fetch_all(
+                connection,
+                _candidate_record,
+                f"""
+                SELECT {_CANDIDATE_COLUMNS}
                 FROM candidates
-                WHERE assessment_id = ?
                 ORDER BY invited_at DESC
                 """,
-                (assessment_id,),
-            ).fetchall()
-        return [
-            CandidateRecord(
-                id=int(row["id"]),
-                assessment_id=int(row["assessment_id"]),
-                email=str(row["email"]),
-                name=row["name"],
-                status=str(row["status"]),
-                invited_at=str(row["invited_at"]),
             )
-            for row in rows
-        ]
+        return fetch_all(
+            connection,
+            _candidate_record,
+            f"""
+            SELECT {_CANDIDATE_COLUMNS}
+            FROM candidates
+            WHERE assessment_id = ?
+            ORDER BY invited_at DESC
+            """,
+            (assessment_id,),
+        )
 
 
 def add_or_update_candidate(
@@ -407,41 +679,72 @@ def add_or_update_candidate(
                 ((name or "").strip(), status, invited_at, candidate_id),
             )
 
-        row = connection.execute(
-            "SELECT id, assessment_id, email, name, status, invited_at FROM candidates WHERE id = ?",
+        candidate = fetch_one(
+            connection,
+            _candidate_record,
+            f"SELECT {_CANDIDATE_COLUMNS} FROM candidates WHERE id = ?",
             (candidate_id,),
-        ).fetchone()
-        if row is None:
+        )
+        if candidate is None:
             raise RuntimeError("Failed to upsert candidate")
-        return CandidateRecord(
-            id=int(row["id"]),
-            assessment_id=int(row["assessment_id"]),
-            email=str(row["email"]),
-            name=row["name"],
-            status=str(row["status"]),
-            invited_at=str(row["invited_at"]),
+        return candidate
+
+
+def upsert_candidates_in_connection(
+    connection: sqlite3.Connection,
+    *,
+    assessment_id: int,
+    candidates: list[tuple[str, str | None]],
+    status: str,
+) -> None:
+    invited_at = _iso_now()
+    rows = [(email.strip().lower(), (name or "").strip()) for email, name in candidates]
+    existing: set[str] = set()
+    for offset in range(0, len(rows), 500):
+        chunk = [email for email, _ in rows[offset : offset + 500]]
+        placeholders = ", ".join("?" for _ in chunk)
+        existing.update(
+            str(row["email"]).lower()
+            for row in connection.execute(
+                f"""
+                SELECT email
+                FROM candidates
+                WHERE assessment_id = ? AND lower(email) IN ({placeholders})
+                """,
+                (assessment_id, *chunk),
+            ).fetchall()
         )
 
+    connection.executemany(
+        """
+        UPDATE candidates
+        SET name = COALESCE(NULLIF(?, ''), name),
+            status = ?,
+            invited_at = ?
+        WHERE assessment_id = ? AND lower(email) = ?
+        """,
+        [(name, status, invited_at, assessment_id, email) for email, name in rows if email in existing],
+    )
+    connection.executemany(
+        """
+        INSERT INTO candidates (assessment_id, email, name, status, invited_at)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        [(assessment_id, email, name or None, status, invited_at) for email, name in rows if email not in existing],
+    )
+
 
 def get_candidate_by_id(settings: Settings, candidate_id: int) -> CandidateRecord | None:
     with _connect(settings) as connection:
-        row = connection.execute(
-            """
-            SELECT id, assessment_id, email, name, status, invited_at
+        return fetch_one(
+            connection,
+            _candidate_record,
+            f"""
+            SELECT {_CANDIDATE_COLUMNS}
             FROM candidates
             WHERE id = ?
             """,
             (candidate_id,),
-        ).fetchone()
-        if row is None:
-            return None
-        return CandidateRecord(
-            id=int(row["id"]),
-            assessment_id=int(row["assessment_id"]),
-            email=str(row["email"]),
-            name=row["name"],
-            status=str(row["status"]),
-            invited_at=str(row["invited_at"]),
         )
 
 
@@ -450,48 +753,59 @@ def get_candidate_by_assessment_and_email(
 ) -> CandidateRecord | None:
     normalized_email = email.strip().lower()
     with _connect(settings) as connection:
-        row = connection.execute(
-            """
-            SELECT id, assessment_id, email, name, status, invited_at
+        return fetch_one(
+            connection,
+            _candidate_record,
+            f"""
+            SELECT {_CANDIDATE_COLUMNS}
             FROM candidates
             WHERE assessment_id = ? AND lower(email) = lower(?)
             LIMIT 1
             """,
             (assessment_id, normalized_email),
-        ).fetchone()
-        if row is None:
-            return None
-        return CandidateRecord(
-            id=int(row["id"]),
-            assessment_id=int(row["assessment_id"]),
-            email=str(row["email"]),
-            name=row["name"],
-            status=str(row["status"]),
-            invited_at=str(row["invited_at"]),
         )
 
 
+def get_candidate_names_by_email(
+    settings: Settings, keys: list[tuple[int, str]]
+) -> dict[tuple[int, str], str | None]:
+    """Batch lookup of candidate names keyed by ``(assessment_id, lowercased email)``."""
+    emails_by_assessment: dict[int, set[str]] = {}
+    for assessment_id, email in keys:
+        emails_by_assessment.setdefault(assessment_id, set()).add(email.strip().lower())
+
+    names: dict[tuple[int, str], str | None] = {}
+    with _connect(settings) as connection:
+        for assessment_id, email_set in emails_by_assessment.items():
+            emails = sorted(email_set)
+            for offset in range(0, len(emails), 500):
+                chunk = emails[offset : offset + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                for row in connection.execute(
+                    f"""
+                    SELECT email, name
+                    FROM candidates
+                    WHERE assessment_id = ? AND lower(email) IN ({placeholders})
+                    """,
+                    (assessment_id, *chunk),
+                ):
+                    names[(assessment_id, str(row["email"]).lower())] = row["name"]
+    return names
+
+
 def get_latest_candidate_by_assessment(settings: Settings, assessment_id: int) -> CandidateRecord | None:
     with _connect(settings) as connection:
-        row = connection.execute(
-            """
-            SELECT id, assessment_id, email, name, status, invited_at
+        return fetch_one(
+            connection,
+            _candidate_record,
+            f"""
+            SELECT {_CANDIDATE_COLUMNS}
             FROM candidates
             WHERE assessment_id = ?
             ORDER BY invited_at DESC
             LIMIT 1
             """,
             (assessment_id,),
-        ).fetchone()
-        if row is None:
-            return None
-        return CandidateRecord(
-            id=int(row["id"]),
-            assessment_id=int(row["assessment_id"]),
-            email=str(row["email"]),
-            name=row["name"],
-            status=str(row["status"]),
-            invited_at=str(row["invited_at"]),
         )
 
 
@@ -559,11 +873,13 @@ def get_latest_reflection_key_for_candidate(
         return str(row["s3_key"])
 
 
-def list_questions(settings: Settings) -> list[QuestionRecord]:
+def _load_questions(settings: Settings) -> list[QuestionRecord]:
     with _connect(settings) as connection:
-        rows = connection.execute(
-            """
-            SELECT id, title, summary, difficulty, role, language, overview, estimated_time, assessment_type
+        return fetch_all(
+            connection,
+            _question_record,
+            f"""
+            SELECT {_QUESTION_COLUMNS}
             FROM questions
             WHERE lower(title) IN (
                 'users api',
@@ -572,49 +888,28 @@ def list_questions(settings: Settings) -> list[QuestionRecord]:
                 'insurance document processor - llamaindex api'
             )
             ORDER BY id ASC
-            """
-        ).fetchall()
-        return [
-            QuestionRecord(
-                id=int(row["id"]),
-                title=str(row["title"]),
-                summary=str(row["summary"]),
-                difficulty=str(row["difficulty"]),
-                role=str(row["role"]),
-                language=str(row["language"]),
-                overview=str(row["overview"]),
-                estimated_time=str(row["estimated_time"]),
-                assessment_type=str(row["assessment_type"] or "default"),
-            )
-            for row in rows
-        ]
+            """,
+        )
 
 
-def get_question(settings: Settings, question_id: int) -> QuestionRecord | None:
+def _load_question(settings: Settings, question_id: int) -> QuestionRecord | None:
     with _connect(settings) as connection:
-        row = connection.execute(
-            """
-            SELECT id, title, summary, difficulty, role, language, overview, estimated_time, assessment_type
-            FROM questions
-            WHERE id = ?
-            """,
+        return fetch_one(
+            connection,
+            _question_record,
+            f"SELECT {_QUESTION_COLUMNS} FROM questions WHERE id = ?",
             (question_id,),
-        ).fetchone()
-        if row is None:
-            return None
-        return QuestionRecord(
-            id=int(row["id"]),
-            title=str(row["title"]),
-            summary=str(row["summary"]),
-            difficulty=str(row["difficulty"]),
-            role=str(row["role"]),
-            language=str(row["language"]),
-            overview=str(row["overview"]),
-            estimated_time=str(row["estimated_time"]),
-            assessment_type=str(row["assessment_type"] or "default"),
         )
 
 
+def list_questions(settings: Settings) -> list[QuestionRecord]:
+    return list(_metadata_cache(settings).get(("questions",), lambda: _load_questions(settings)))
+
+
+def get_question(settings: Settings, question_id: int) -> QuestionRecord | None:
+    return _metadata_cache(settings).get(("question", question_id), lambda: _load_question(settings, question_id))
+
+
 def assessment_title_exists(settings: Settings, title: str) -> bool:
     with _connect(settings) as connection:
         row = connection.execute(
@@ -659,6 +954,8 @@ def create_assessment(
             ),
         )
         assessment_id = int(cursor.lastrowid)
+        _bump_metadata_version(connection)
+    _metadata_cache(settings).invalidate()
 
     created = get_assessment(settings, assessment_id)
     if created is None:
@@ -666,27 +963,6 @@ def create_assessment(
     return created
 
 
-def _row_to_report_record(row: sqlite3.Row) -> ReportRecord:
-    return ReportRecord(
-        candidate_id=int(row["candidate_id"]),
-        assessment_id=int(row["assessment_id"]),
-        score=row["score"],
-        code_quality=row["code_quality"],
-        results=json.loads(row["results_json"] or "[]"),
-        diffs=json.loads(row["diffs_json"] or "[]"),
-        code_summary_bullets=json.loads(row["code_summary_json"] or "[]"),
-        report_ready=bool(int(row["report_ready"])),
-        error=row["error"],
-        assessment_type=str(row["assessment_type"] or "default"),
-        app_usage=json.loads(row["app_usage_json"] or "[]"),
-        total_duration=row["total_duration"],
-        submission_file=row["submission_file"],
-        assessment_recording_key=row["assessment_recording_key"],
-        reflection_recording_key=row["reflection_recording_key"],
-        updated_at=str(row["updated_at"]),
-    )
-
-
 def upsert_report(
     settings: Settings,
     *,
@@ -705,83 +981,124 @@ def upsert_report(
     submission_file: str | None,
     assessment_recording_key: str | None,
     reflection_recording_key: str | None,
+    stages: dict[str, dict[str, object]] | None = None,
 ) -> ReportRecord:
-    now = _iso_now()
+    """Insert or replace the candidate's report.
+
+    ``stages=None`` keeps the stage checkpoints already stored for the
+    candidate; pass ``stages={}`` to reset them explicitly.
+    """
     with _connect(settings) as connection:
-        connection.execute(
-            """
-            INSERT INTO reports (
-                candidate_id, assessment_id, score, code_quality, results_json, diffs_json, code_summary_json,
-                report_ready, error, assessment_type, app_usage_json, total_duration, submission_file,
-                assessment_recording_key, reflection_recording_key, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(candidate_id) DO UPDATE SET
-                assessment_id = excluded.assessment_id,
-                score = excluded.score,
-                code_quality = excluded.code_quality,
-                results_json = excluded.results_json,
-                diffs_json = excluded.diffs_json,
-                code_summary_json = excluded.code_summary_json,
-                report_ready = excluded.report_ready,
-                error = excluded.error,
-                assessment_type = excluded.assessment_type,
-                app_usage_json = excluded.app_usage_json,
-                total_duration = excluded.total_duration,
-                submission_file = excluded.submission_file,
-                assessment_recording_key = excluded.assessment_recording_key,
-                reflection_recording_key = excluded.reflection_recording_key,
-                updated_at = excluded.updated_at
-            """,
-            (
-                candidate_id,
-                assessment_id,
-                score,
-                code_quality,
-                json.dumps(results),
-                json.dumps(diffs),
-                json.dumps(code_summary_bullets),
-                1 if report_ready else 0,
-                error,
-                assessment_type,
-                json.dumps(app_usage),
-                total_duration,
-                submission_file,
-                assessment_recording_key,
-                reflection_recording_key,
-                now,
+        if stages is None:
+            row = connection.execute(
+                "SELECT stages_json FROM reports WHERE candidate_id = ?", (candidate_id,)
+            ).fetchone()
+            stages_json = (row[0] if row is not None else None) or "{}"
+        else:
+            stages_json = json.dumps(stages)
+        report = _write_report(
+            connection,
+            ReportRecord(
+                candidate_id=candidate_id,
+                assessment_id=assessment_id,
+                score=score,
+                code_quality=code_quality,
+                results_json=json.dumps(results),
+                diffs_json=json.dumps(diffs),
+                code_summary_json=json.dumps(code_summary_bullets),
+                report_ready=report_ready,
+                error=error,
+                assessment_type=assessment_type or "default",
+                app_usage_json=json.dumps(app_usage),
+                total_duration=total_duration,
+                submission_file=submission_file,
+                assessment_recording_key=assessment_recording_key,
+                reflection_recording_key=reflection_recording_key,
+                updated_at=_iso_now(),
+                stages_json=stages_json,
             ),
         )
-        row = connection.execute(
-            "SELECT * FROM reports WHERE candidate_id = ?",
-            (candidate_id,),
-        ).fetchone()
-        if row is None:
-            raise RuntimeError("Failed to upsert report")
-        return _row_to_report_record(row)
+    # The record is built from the values just written, so callers get it
+    # without a read-back query or any JSON decoding.
+    return report
+
+
+def _write_report(connection: sqlite3.Connection, report: ReportRecord) -> ReportRecord:
+    connection.execute(
+        """
+        INSERT INTO reports (
+            candidate_id, assessment_id, score, code_quality, results_json, diffs_json, code_summary_json,
+            report_ready, error, assessment_type, app_usage_json, total_duration, submission_file,
+            assessment_recording_key, reflection_recording_key, updated_at, stages_json
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(candidate_id) DO UPDATE SET
+            assessment_id = excluded.assessment_id,
+            score = excluded.score,
+            code_quality = excluded.code_quality,
+            results_json = excluded.results_json,
+            diffs_json = excluded.diffs_json,
+            code_summary_json = excluded.code_summary_json,
+            report_ready = excluded.report_ready,
+            error = excluded.error,
+            assessment_type = excluded.assessment_type,
+            app_usage_json = excluded.app_usage_json,
+            total_duration = excluded.total_duration,
+            submission_file = excluded.submission_file,
+            assessment_recording_key = excluded.assessment_recording_key,
+            reflection_recording_key = excluded.reflection_recording_key,
+            updated_at = excluded.updated_at,
+            stages_json = excluded.stages_json
+        """,
+        (
+            report.candidate_id,
+            report.assessment_id,
+            report.score,
+            report.code_quality,
+            report.results_json,
+            report.diffs_json,
+            report.code_summary_json,
+            1 if report.report_ready else 0,
+            report.error,
+            report.assessment_type,
+            report.app_usage_json,
+            report.total_duration,
+            report.submission_file,
+            report.assessment_recording_key,
+            report.reflection_recording_key,
+            report.updated_at,
+            report.stages_json,
+        ),
+    )
+    return report
+
+
+def reset_report_stages(settings: Settings, candidate_id: int) -> bool:
+    """Drop the candidate's stage checkpoints so the next run recomputes every stage."""
+    with _connect(settings) as connection:
+        cursor = connection.execute("UPDATE reports SET stages_json = '{}' WHERE candidate_id = ?", (candidate_id,))
+        return cursor.rowcount > 0
 
 
 def get_report_by_candidate(settings: Settings, candidate_id: int) -> ReportRecord | None:
     with _connect(settings) as connection:
-        row = connection.execute(
-            "SELECT * FROM reports WHERE candidate_id = ?",
+        return fetch_one(
+            connection,
+            _report_record,
+            f"SELECT {_REPORT_COLUMNS} FROM reports WHERE candidate_id = ?",
             (candidate_id,),
-        ).fetchone()
-        if row is None:
-            return None
-        return _row_to_report_record(row)
+        )
 
 
 def get_latest_report_by_assessment(settings: Settings, assessment_id: int) -> ReportRecord | None:
     with _connect(settings) as connection:
-        row = connection.execute(
-            """
-            SELECT * FROM reports
+        return fetch_one(
+            connection,
+            _report_record,
+            f"""
+            SELECT {_REPORT_COLUMNS} FROM reports
             WHERE assessment_id = ?
             ORDER BY updated_at DESC
             LIMIT 1
             """,
             (assessment_id,),
-        ).fetchone()
-        if row is None:
-            return None
-        return _row_to_report_record(row)
+        )
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, TypeVar
+
+from fastapi import UploadFile
+
+from app.core.config import Settings
+
+T = TypeVar("T")
+
+_CHUNK_SIZE = 1024 * 1024
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_file_executor(settings: Settings) -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.file_io_workers, thread_name_prefix="file-io")
+        return _executor
+
+
+def shutdown_file_executor() -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+async def _run(settings: Settings, func: Callable[..., T], *args: Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_file_executor(settings), functools.partial(func, *args))
+
+
+def _write(path: Path, data: bytes, mode: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open(mode) as handle:
+        handle.write(data)
+
+
+async def write_bytes(settings: Settings, path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` (creating parent directories) off the event loop."""
+    await _run(settings, _write, path, data, "wb")
+
+
+async def append_bytes(settings: Settings, path: Path, data: bytes) -> None:
+    await _run(settings, _write, path, data, "ab")
+
+
+async def save_upload(settings: Settings, upload: UploadFile, path: Path) -> int:
+    """Stream an uploaded file to ``path`` chunk by chunk; returns the number of bytes written."""
+
+    def open_destination() -> BinaryIO:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path.open("wb")
+
+    handle = await _run(settings, open_destination)
+    written = 0
+    try:
+        while chunk := await upload.read(_CHUNK_SIZE):
+            await _run(settings, handle.write, chunk)
+            written += len(chunk)
+    finally:
+        await _run(settings, handle.close)
+    return written
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from app.core.config import Settings
+from app.services import assessment_store
+from app.services.assessment_store import AssessmentRecord
+
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_db_executor(settings: Settings) -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.db_executor_workers, thread_name_prefix="db")
+        return _executor
+
+
+def shutdown_db_executor() -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+async def run_db(settings: Settings, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking store call on the dedicated DB executor.
+
+    Async endpoints await this instead of calling the SQLite store (or other
+    short blocking work such as signing an S3 URL) directly, so the event
+    loop never blocks and that work does not compete with sync endpoints for
+    the default threadpool.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_db_executor(settings), functools.partial(func, *args, **kwargs))
+
+
+async def get_assessment(settings: Settings, assessment_id: int, *, fresh: bool = False) -> AssessmentRecord | None:
+    return await run_db(settings, assessment_store.get_assessment, settings, assessment_id, fresh=fresh)
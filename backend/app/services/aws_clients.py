@@ -1,11 +1,79 @@
-import boto3
+import threading
+from datetime import UTC, datetime
+from typing import Any
 
 from app.core.config import Settings
 
+# boto3 is imported on first use so local-only deployments never load it.
+# Clients are thread-safe once built, but sessions are not, so both are
+# created under one lock and then shared process-wide.
+_clients: dict[tuple[str, str, str | None], Any] = {}
+_session: Any = None
+_lock = threading.Lock()
+
+
+def _client(service: str, settings: Settings) -> Any:
+    global _session
+    key = (service, settings.aws_region, settings.aws_endpoint_url or None)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            import boto3
+            from botocore.config import Config
+
+            if _session is None:
+                _session = boto3.session.Session()
+            # SES throttling is retried by SesBatchSender against its own token
+            # bucket; botocore retries underneath would multiply those attempts.
+            # total_max_attempts counts the first call, unlike max_attempts.
+            total_max_attempts = 1 if service == "ses" else settings.aws_max_attempts
+            client = _session.client(
+                service,
+                region_name=settings.aws_region,
+                endpoint_url=key[2],
+                config=Config(
+                    max_pool_connections=settings.aws_max_pool_connections,
+                    tcp_keepalive=settings.aws_tcp_keepalive,
+                    retries={"total_max_attempts": total_max_attempts, "mode": "standard"},
+                ),
+            )
+            _clients[key] = client
+        return client
+
 
 def s3_client(settings: Settings):
-    return boto3.client("s3", region_name=settings.aws_region)
+    return _client("s3", settings)
 
 
 def ses_client(settings: Settings):
-    return boto3.client("ses", region_name=settings.aws_region)
+    return _client("ses", settings)
+
+
+def signing_identity(settings: Settings) -> tuple[str | None, float | None]:
+    """Return the access key the clients sign with and the seconds until it expires.
+
+    The expiry is ``None`` for static keys; role, SSO and STS credentials
+    rotate, and anything signed with them stops working when they expire.
+    """
+    s3_client(settings)
+    with _lock:
+        credentials = _session.get_credentials() if _session is not None else None
+    if credentials is None:
+        return None, None
+    access_key = credentials.get_frozen_credentials().access_key
+    # botocore exposes the expiry of refreshable credentials only as this attribute.
+    expiry = getattr(credentials, "_expiry_time", None)
+    if expiry is None:
+        return access_key, None
+    return access_key, max(0.0, (expiry - datetime.now(UTC)).total_seconds())
+
+
+def reset_clients() -> None:
+    """Forget the cached session and clients, e.g. after credentials or endpoints change."""
+    global _session
+    with _lock:
+        _clients.clear()
+        _session = None
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import ast
+import atexit
+import hashlib
+import logging
+import multiprocessing
+import re
+import threading
+import zipfile
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+
+logger = logging.getLogger(__name__)
+
+LANGUAGE_BY_SUFFIX = {'.py': 'python', '.js': 'javascript', '.ts': 'javascript', '.java': 'java'}
+MAX_FILE_BYTES = 512 * 1024
+MAX_FILES = 400
+LONG_FUNCTION_LINES = 50
+DUPLICATE_WINDOW_LINES = 6
+
+_POOL_MIN_FILES = 8
+_CACHE_MAX_ENTRIES = 4096
+
+_TOKEN_RE = re.compile(
+    r'''//[^\n]*|/\*.*?\*/|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`'''
+    r'''|=>|&&|\|\||[A-Za-z_$][\w$]*|[{}()?;\n]''',
+    re.DOTALL,
+)
+_BRANCH_KEYWORDS = {'if', 'for', 'while', 'case', 'catch', '&&', '||', '?'}
+_NON_FUNCTION_HEADS = {'if', 'for', 'while', 'switch', 'catch', 'with', 'synchronized', 'return', 'new'}
+
+
+@dataclass
+class FileMetrics:
+    path: str
+    language: str
+    functions: int = 0
+    complexities: list[int] = field(default_factory=list)
+    function_lengths: list[int] = field(default_factory=list)
+    window_hashes: list[str] = field(default_factory=list)
+    parse_error: bool = False
+
+
+@dataclass
+class CodeMetricsSummary:
+    files: int = 0
+    functions: int = 0
+    avg_complexity: float = 0.0
+    max_complexity: int = 0
+    avg_function_length: float = 0.0
+    long_functions: int = 0
+    duplication_ratio: float = 0.0
+    parse_errors: int = 0
+    cached_files: int = 0
+
+    @property
+    def quality_score(self) -> int:
+        score = 100.0
+        score -= max(0.0, self.avg_complexity - 4) * 6
+        score -= min(20, self.max_complexity // 5 * 2)
+        if self.functions:
+            score -= 30 * self.long_functions / self.functions
+        score -= 40 * self.duplication_ratio
+        if self.files:
+            score -= 20 * self.parse_errors / self.files
+        return max(0, min(100, round(score)))
+
+
+class _PythonComplexity(ast.NodeVisitor):
+    def __init__(self) -> None:
+        self.value = 1
+
+    def generic_visit(self, node: ast.AST) -> None:
+        if isinstance(node, (ast.If, ast.For, ast.AsyncFor, ast.While, ast.IfExp, ast.ExceptHandler, ast.Assert)):
+            self.value += 1
+        elif isinstance(node, ast.BoolOp):
+            self.value += len(node.values) - 1
+        elif isinstance(node, ast.comprehension):
+            self.value += 1 + len(node.ifs)
+        elif isinstance(node, ast.match_case):
+            self.value += 1
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            # Nested functions are measured on their own.
+            return
+        super().generic_visit(node)
+
+
+def _python_functions(source: str, metrics: FileMetrics) -> None:
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError, RecursionError, MemoryError):
+        metrics.parse_error = True
+        return
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        visitor = _PythonComplexity()
+        for child in ast.iter_child_nodes(node):
+            visitor.visit(child)
+        metrics.complexities.append(visitor.value)
+        end_lineno = getattr(node, 'end_lineno', None) or node.lineno
+        metrics.function_lengths.append(end_lineno - node.lineno + 1)
+
+
+def _brace_functions(source: str, metrics: FileMetrics) -> None:
+    # Lightweight tokenizer for JS/TS/Java: a "function" is any brace block
+    # opened right after a parameter list (or an arrow) whose head is not a
+    # control-flow keyword. Complexity counts branch tokens inside it.
+    stack: list[tuple[bool, int, int]] = []
+    line = 1
+    last_tokens: list[str] = []
+    paren_head: list[str] = []
+    for match in _TOKEN_RE.finditer(source):
+        token = match.group(0)
+        if token[:2] in ('//', '/*') or token[:1] in ('"', "'", '`'):
+            line += token.count('\n')
+            continue
+        if token == '\n':
+            line += 1
+            continue
+        if token == '(':
+            paren_head.append(last_tokens[-1] if last_tokens else '')
+        elif token == ')':
+            head = paren_head.pop() if paren_head else ''
+            last_tokens.append(f'){head}')
+            continue
+        elif token == '{':
+            is_function = bool(last_tokens) and last_tokens[-1] == '=>'
+            for previous in reversed(last_tokens if not is_function else []):
+                if previous.startswith(')'):
+                    is_function = previous[1:] not in _NON_FUNCTION_HEADS
+                    break
+                # Allow `throws X` / return-type annotations between `)` and `{`.
+                if not (previous[:1].isalpha() or previous[:1] in '_$') or previous in _NON_FUNCTION_HEADS:
+                    break
+            stack.append((is_function, line, 1))
+        elif token == '}':
+            if stack:
+                is_function, start, complexity = stack.pop()
+                if is_function:
+                    metrics.complexities.append(complexity)
+                    metrics.function_lengths.append(line - start + 1)
+        elif token in _BRANCH_KEYWORDS:
+            for index in range(len(stack) - 1, -1, -1):
+                if stack[index][0]:
+                    is_function, start, complexity = stack[index]
+                    stack[index] = (is_function, start, complexity + 1)
+                    break
+        last_tokens.append(token)
+        if len(last_tokens) > 4:
+            del last_tokens[0]
+
+
+def _window_hashes(source: str, language: str) -> list[str]:
+    comment_prefix = '#' if language == 'python' else '//'
+    lines = [
+        ' '.join(line.split())
+        for line in source.splitlines()
+        if line.strip() and not line.strip().startswith(comment_prefix)
+    ]
+    lines = [line for line in lines if len(line) > 3]
+    return [
+        hashlib.blake2b('\n'.join(lines[i : i + DUPLICATE_WINDOW_LINES]).encode(), digest_size=8).hexdigest()
+        for i in range(0, max(0, len(lines) - DUPLICATE_WINDOW_LINES + 1))
+    ]
+
+
+def measure_source(path: str, language: str, source: str) -> FileMetrics:
+    metrics = FileMetrics(path=path, language=language)
+    if language == 'python':
+        _python_functions(source, metrics)
+    else:
+        _brace_functions(source, metrics)
+    metrics.functions = len(metrics.complexities)
+    metrics.window_hashes = _window_hashes(source, language)
+    return metrics
+
+
+def _measure_job(job: tuple[str, str, str]) -> FileMetrics:
+    path, language, _ = job
+    try:
+        return measure_source(*job)
+    except (RecursionError, MemoryError):
+        # Pathologically nested sources only cost their own file, not the archive.
+        return FileMetrics(path=path, language=language, parse_error=True)
+
+
+_cache: OrderedDict[str, FileMetrics] = OrderedDict()
+_cache_lock = threading.Lock()
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(max_workers: int | None) -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+            atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _cache_get(key: str) -> FileMetrics | None:
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+        return cached
+
+
+def _cache_put(key: str, metrics: FileMetrics) -> None:
+    with _cache_lock:
+        _cache[key] = metrics
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def _summarize(files: list[FileMetrics], cached_files: int) -> CodeMetricsSummary:
+    complexities = [value for item in files for value in item.complexities]
+    lengths = [value for item in files for value in item.function_lengths]
+    windows = Counter(digest for item in files for digest in item.window_hashes)
+    total_windows = sum(windows.values())
+    duplicated = sum(count for count in windows.values() if count > 1)
+    return CodeMetricsSummary(
+        files=len(files),
+        functions=len(complexities),
+        avg_complexity=sum(complexities) / len(complexities) if complexities else 0.0,
+        max_complexity=max(complexities, default=0),
+        avg_function_length=sum(lengths) / len(lengths) if lengths else 0.0,
+        long_functions=sum(1 for value in lengths if value > LONG_FUNCTION_LINES),
+        duplication_ratio=duplicated / total_windows if total_windows else 0.0,
+        parse_errors=sum(1 for item in files if item.parse_error),
+        cached_files=cached_files,
+    )
+
+
+def analyze_archive(zipf: zipfile.ZipFile, names: list[str], *, max_workers: int | None = None) -> CodeMetricsSummary:
+    """Compute complexity, function-length and duplication metrics for archive sources.
+
+    Per-file results are memoized by content hash, so only new or changed
+    files are parsed; those are spread across a process pool when there are
+    enough of them to amortize the dispatch cost.
+    """
+    results: list[FileMetrics] = []
+    pending: list[tuple[str, tuple[str, str, str]]] = []
+    cached_files = 0
+    for name in names:
+        if name.endswith('/') or name.startswith('__MACOSX/') or '/node_modules/' in f'/{name}':
+            continue
+        language = LANGUAGE_BY_SUFFIX.get(PurePosixPath(name).suffix.lower())
+        if language is None:
+            continue
+        info = zipf.getinfo(name)
+        if info.file_size > MAX_FILE_BYTES:
+            continue
+        raw = zipf.read(name)
+        key = f'{language}:{hashlib.sha256(raw).hexdigest()}'
+        cached = _cache_get(key)
+        if cached is not None:
+            cached_files += 1
+            results.append(cached)
+        else:
+            pending.append((key, (name, language, raw.decode('utf-8', errors='replace'))))
+        if len(results) + len(pending) >= MAX_FILES:
+            break
+
+    measured: list[FileMetrics] | None = None
+    if len(pending) >= _POOL_MIN_FILES:
+        pool = _get_pool(max_workers)
+        try:
+            measured = list(pool.map(_measure_job, [job for _, job in pending], chunksize=4))
+        except BrokenProcessPool:
+            # A dead worker poisons the executor for good: drop it so the next
+            # archive gets a fresh pool, and finish this one in-process.
+            logger.warning('Code metrics process pool broke; rebuilding it')
+            _discard_pool(pool)
+    if measured is None:
+        measured = [_measure_job(job) for _, job in pending]
+    for (key, _), metrics in zip(pending, measured):
+        _cache_put(key, metrics)
+        results.append(metrics)
+
+    return _summarize(results, cached_files)
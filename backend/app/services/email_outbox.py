@@ -0,0 +1,283 @@
+import json
+import logging
+import secrets
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from app.core.config import Settings
+from app.services.assessment import send_email, send_emails_via_ses
+from app.services.email_templates import EmailContent, assessment_invite_email, assessment_reminder_email
+from app.services.ses_sender import SendResult
+from app.services.smtp_pool import DeliveryUncertainError
+
+logger = logging.getLogger(__name__)
+
+_CLAIM_LEASE_SECONDS = 5 * 60
+
+
+@dataclass
+class OutboxEmail:
+    kind: str
+    to_email: str
+    payload: dict[str, object] = field(default_factory=dict)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+def _iso(dt: datetime) -> str:
+    return dt.isoformat()
+
+
+def _connect(settings: Settings) -> sqlite3.Connection:
+    db_path = Path(settings.local_db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(db_path)
+    connection.row_factory = sqlite3.Row
+    return connection
+
+
+def init_outbox(settings: Settings) -> None:
+    with _connect(settings) as connection:
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS email_outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                to_email TEXT NOT NULL,
+                payload_json TEXT NOT NULL DEFAULT '{}',
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at TEXT NOT NULL,
+                claim_token TEXT,
+                claimed_at TEXT,
+                last_error TEXT,
+                provider_message_id TEXT,
+                created_at TEXT NOT NULL,
+                sent_at TEXT
+            )
+            """
+        )
+        columns = {str(row["name"]) for row in connection.execute("PRAGMA table_info(email_outbox)")}
+        if "provider_message_id" not in columns:
+            connection.execute("ALTER TABLE email_outbox ADD COLUMN provider_message_id TEXT")
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_email_outbox_due ON email_outbox(status, next_attempt_at)"
+        )
+
+
+def enqueue_emails_in_connection(connection: sqlite3.Connection, emails: list[OutboxEmail]) -> None:
+    """Insert outbox rows on the caller's connection so they commit with the caller's writes.
+
+    Callers should ``notify_dispatcher()`` once their transaction has committed.
+    """
+    now = _iso(_utc_now())
+    connection.executemany(
+        """
+        INSERT INTO email_outbox (kind, to_email, payload_json, status, next_attempt_at, created_at)
+        VALUES (?, ?, ?, 'pending', ?, ?)
+        """,
+        [(email.kind, email.to_email, json.dumps(email.payload), now, now) for email in emails],
+    )
+
+
+def _claim_batch(settings: Settings, limit: int) -> list[sqlite3.Row]:
+    now = _utc_now()
+    claim_token = secrets.token_hex(16)
+    with _connect(settings) as connection:
+        connection.execute(
+            """
+            UPDATE email_outbox
+            SET status = 'sending', claim_token = ?, claimed_at = ?, attempts = attempts + 1
+            WHERE id IN (
+                SELECT id FROM email_outbox
+                WHERE (status = 'pending' AND next_attempt_at <= ?)
+                   OR (status = 'sending' AND claimed_at <= ?)
+                ORDER BY next_attempt_at
+                LIMIT ?
+            )
+            """,
+            (
+                claim_token,
+                _iso(now),
+                _iso(now),
+                _iso(now - timedelta(seconds=_CLAIM_LEASE_SECONDS)),
+                limit,
+            ),
+        )
+        return connection.execute(
+            "SELECT * FROM email_outbox WHERE claim_token = ? ORDER BY id", (claim_token,)
+        ).fetchall()
+
+
+def _content(row: sqlite3.Row) -> EmailContent:
+    payload = json.loads(row["payload_json"] or "{}")
+    kind = str(row["kind"])
+    if kind == "assessment":
+        return assessment_invite_email(
+            instructions_link=str(payload["instructions_link"]),
+            is_resend=bool(payload.get("is_resend")),
+        )
+    if kind == "reminder":
+        return assessment_reminder_email()
+    raise ValueError(f"Unknown outbox email kind: {kind}")
+
+
+def _failure(exc: Exception) -> SendResult:
+    return SendResult(
+        error=str(exc) or exc.__class__.__name__,
+        retryable=not isinstance(exc, DeliveryUncertainError),
+    )
+
+
+def _deliver(settings: Settings, row: sqlite3.Row) -> SendResult:
+    try:
+        return SendResult(message_id=send_email(str(row["to_email"]), _content(row), settings))
+    except Exception as exc:  # noqa: BLE001 - failures are retried or dead-lettered
+        return _failure(exc)
+
+
+def _deliver_via_ses(settings: Settings, rows: list[sqlite3.Row]) -> list[SendResult]:
+    results: list[SendResult | None] = [None] * len(rows)
+    messages: list[tuple[str, EmailContent]] = []
+    positions: list[int] = []
+    for index, row in enumerate(rows):
+        try:
+            messages.append((str(row["to_email"]), _content(row)))
+        except Exception as exc:  # noqa: BLE001
+            results[index] = _failure(exc)
+            continue
+        positions.append(index)
+    for index, result in zip(positions, send_emails_via_ses(messages, settings)):
+        results[index] = result
+    return [result or SendResult(error="not sent") for result in results]
+
+
+def _record_results(settings: Settings, results: list[tuple[sqlite3.Row, SendResult]]) -> None:
+    now = _utc_now()
+    sent: list[tuple[str, str | None, int]] = []
+    retry: list[tuple[str, str, int]] = []
+    dead: list[tuple[str, int]] = []
+    uncertain: set[int] = set()
+    for row, result in results:
+        error = result.error
+        if error is None:
+            sent.append((_iso(now), result.message_id, int(row["id"])))
+        elif not result.retryable:
+            # Requeueing could deliver a second copy; leave it for review instead.
+            dead.append((f"Delivery uncertain, not retried: {error}", int(row["id"])))
+            uncertain.add(int(row["id"]))
+        elif int(row["attempts"]) >= settings.email_outbox_max_attempts:
+            dead.append((error, int(row["id"])))
+        else:
+            backoff = min(
+                settings.email_outbox_max_backoff_seconds,
+                settings.email_outbox_base_backoff_seconds * 2 ** (int(row["attempts"]) - 1),
+            )
+            retry.append((error, _iso(now + timedelta(seconds=backoff)), int(row["id"])))
+    with _connect(settings) as connection:
+        connection.executemany(
+            """
+            UPDATE email_outbox
+            SET status = 'sent', sent_at = ?, provider_message_id = ?, claim_token = NULL, last_error = NULL
+            WHERE id = ?
+            """,
+            sent,
+        )
+        connection.executemany(
+            """
+            UPDATE email_outbox
+            SET status = 'pending', last_error = ?, next_attempt_at = ?, claim_token = NULL
+            WHERE id = ?
+            """,
+            retry,
+        )
+        connection.executemany(
+            "UPDATE email_outbox SET status = 'dead', last_error = ?, claim_token = NULL WHERE id = ?",
+            dead,
+        )
+    for error, outbox_id in dead:
+        if outbox_id in uncertain:
+            logger.warning("Email outbox row %s may already be delivered, dead-lettered: %s", outbox_id, error)
+        else:
+            logger.error("Email outbox row %s dead-lettered: %s", outbox_id, error)
+
+
+def dispatch_due_emails(settings: Settings, pool: ThreadPoolExecutor) -> int:
+    rows = _claim_batch(settings, settings.email_outbox_batch_size)
+    if not rows:
+        return 0
+
+    if settings.email_provider == "aws_ses":
+        # SES sends go through the rate-limited batch sender and its own pool.
+        results = _deliver_via_ses(settings, rows)
+    else:
+        results = list(pool.map(lambda row: _deliver(settings, row), rows))
+    _record_results(settings, list(zip(rows, results)))
+    return len(rows)
+
+
+class EmailOutboxDispatcher:
+    def __init__(self, settings: Settings) -> None:
+        self._settings = settings
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="email-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def _run(self) -> None:
+        settings = self._settings
+        with ThreadPoolExecutor(
+            max_workers=max(1, settings.email_send_concurrency), thread_name_prefix="outbox-sender"
+        ) as pool:
+            while not self._stop.is_set():
+                self._wake.clear()
+                try:
+                    if dispatch_due_emails(settings, pool) >= settings.email_outbox_batch_size:
+                        continue
+                except Exception:
+                    logger.exception("Email outbox dispatch failed")
+                self._wake.wait(settings.email_outbox_poll_seconds)
+
+
+_dispatcher: EmailOutboxDispatcher | None = None
+
+
+def start_dispatcher(settings: Settings) -> EmailOutboxDispatcher:
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = EmailOutboxDispatcher(settings)
+    _dispatcher.start()
+    return _dispatcher
+
+
+def stop_dispatcher() -> None:
+    global _dispatcher
+    if _dispatcher is not None:
+        _dispatcher.stop()
+        _dispatcher = None
+
+
+def notify_dispatcher() -> None:
+    if _dispatcher is not None:
+        _dispatcher.wake()
@@ -0,0 +1,201 @@
+import json
+import logging
+import sqlite3
+import threading
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from app.core.config import Settings
+from app.services.email_outbox import OutboxEmail, enqueue_emails_in_connection, notify_dispatcher
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long the timer sleeps without re-reading the next due
+# time, so rows scheduled by other worker processes are picked up promptly.
+_MAX_SLEEP_SECONDS = 30.0
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+def _iso(dt: datetime) -> str:
+    return dt.isoformat()
+
+
+def _connect(settings: Settings) -> sqlite3.Connection:
+    db_path = Path(settings.local_db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(db_path)
+    connection.row_factory = sqlite3.Row
+    return connection
+
+
+def init_scheduler_store(settings: Settings) -> None:
+    with _connect(settings) as connection:
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scheduled_emails (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                to_email TEXT NOT NULL,
+                payload_json TEXT NOT NULL DEFAULT '{}',
+                due_at TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                created_at TEXT NOT NULL,
+                released_at TEXT
+            )
+            """
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_scheduled_emails_due ON scheduled_emails(status, due_at)"
+        )
+
+
+def schedule_email(
+    settings: Settings,
+    *,
+    kind: str,
+    to_email: str,
+    due_at: datetime,
+    payload: dict[str, object] | None = None,
+) -> int:
+    with _connect(settings) as connection:
+        cursor = connection.execute(
+            """
+            INSERT INTO scheduled_emails (kind, to_email, payload_json, due_at, status, created_at)
+            VALUES (?, ?, ?, ?, 'pending', ?)
+            """,
+            (kind, to_email, json.dumps(payload or {}), _iso(due_at), _iso(_utc_now())),
+        )
+        scheduled_id = int(cursor.lastrowid)
+    notify_scheduler()
+    return scheduled_id
+
+
+def schedule_reminder_email(to_email: str, settings: Settings) -> int:
+    return schedule_email(
+        settings,
+        kind="reminder",
+        to_email=to_email,
+        due_at=_utc_now() + timedelta(seconds=settings.reminder_delay_seconds),
+    )
+
+
+def _next_due_at(settings: Settings) -> datetime | None:
+    with _connect(settings) as connection:
+        row = connection.execute(
+            "SELECT MIN(due_at) AS due_at FROM scheduled_emails WHERE status = 'pending'"
+        ).fetchone()
+    if row is None or row["due_at"] is None:
+        return None
+    return datetime.fromisoformat(str(row["due_at"]))
+
+
+def release_due_emails(settings: Settings, *, limit: int) -> int:
+    """Move due rows into the email outbox in one write transaction.
+
+    ``BEGIN IMMEDIATE`` takes the write lock before reading, so concurrent
+    workers never release the same row twice.
+    """
+    now = _iso(_utc_now())
+    connection = _connect(settings)
+    try:
+        connection.execute("BEGIN IMMEDIATE")
+        rows = connection.execute(
+            """
+            SELECT id, kind, to_email, payload_json
+            FROM scheduled_emails
+            WHERE status = 'pending' AND due_at <= ?
+            ORDER BY due_at
+            LIMIT ?
+            """,
+            (now, limit),
+        ).fetchall()
+        if rows:
+            enqueue_emails_in_connection(
+                connection,
+                [
+                    OutboxEmail(
+                        kind=str(row["kind"]),
+                        to_email=str(row["to_email"]),
+                        payload=json.loads(row["payload_json"] or "{}"),
+                    )
+                    for row in rows
+                ],
+            )
+            connection.executemany(
+                "UPDATE scheduled_emails SET status = 'released', released_at = ? WHERE id = ?",
+                [(now, int(row["id"])) for row in rows],
+            )
+        connection.commit()
+    except BaseException:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+    if rows:
+        notify_dispatcher()
+    return len(rows)
+
+
+class EmailScheduler:
+    def __init__(self, settings: Settings) -> None:
+        self._settings = settings
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="email-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def _run(self) -> None:
+        batch_size = self._settings.email_outbox_batch_size
+        while not self._stop.is_set():
+            self._wake.clear()
+            timeout = _MAX_SLEEP_SECONDS
+            try:
+                if release_due_emails(self._settings, limit=batch_size) >= batch_size:
+                    continue
+                next_due = _next_due_at(self._settings)
+                if next_due is not None:
+                    timeout = min(timeout, max(0.0, (next_due - _utc_now()).total_seconds()))
+            except Exception:
+                logger.exception("Scheduled email release failed")
+            self._wake.wait(timeout)
+
+
+_scheduler: EmailScheduler | None = None
+
+
+def start_scheduler(settings: Settings) -> EmailScheduler:
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = EmailScheduler(settings)
+    _scheduler.start()
+    return _scheduler
+
+
+def stop_scheduler() -> None:
+    global _scheduler
+    if _scheduler is not None:
+        _scheduler.stop()
+        _scheduler = None
+
+
+def notify_scheduler() -> None:
+    if _scheduler is not None:
+        _scheduler.wake()
@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from email import policy
+from email.utils import formatdate, make_msgid, parseaddr
+from functools import lru_cache
 
 
 @dataclass(frozen=True)
@@ -8,6 +11,32 @@ class EmailContent:
     text_body: str
 
 
+# Placeholder spliced out of the rendered layouts; the NUL bytes keep it from
+# ever colliding with real template text.
+_LINK = "\x00link\x00"
+
+
+@dataclass(frozen=True)
+class _SplicedTemplate:
+    prefix: str
+    suffix: str
+
+    @classmethod
+    def compile(cls, rendered: str) -> "_SplicedTemplate":
+        prefix, suffix = rendered.split(_LINK)
+        return cls(prefix=prefix, suffix=suffix)
+
+    def render(self, value: str) -> str:
+        return f"{self.prefix}{value}{self.suffix}"
+
+
+@dataclass(frozen=True)
+class _InviteTemplate:
+    subject: str
+    html: _SplicedTemplate
+    text: _SplicedTemplate
+
+
 def _layout(title: str, body_html: str) -> str:
     return f"""
     <html>
@@ -36,7 +65,8 @@ def _layout(title: str, body_html: str) -> str:
     """
 
 
-def assessment_invite_email(*, instructions_link: str, is_resend: bool = False) -> EmailContent:
+@lru_cache(maxsize=2)
+def _invite_template(is_resend: bool) -> _InviteTemplate:
     subject = "Your InterviewOS Assessment"
     if is_resend:
         subject = "Reminder: Your InterviewOS Assessment"
@@ -57,7 +87,7 @@ def assessment_invite_email(*, instructions_link: str, is_resend: bool = False)
           <strong>Recording:</strong> Please record your screen and camera
         </p>
         <p style="margin:0 0 20px 0;">
-          <a href="{instructions_link}" target="_blank" style="display:inline-block;background:#111;color:#fff;text-decoration:none;padding:10px 16px;border-radius:8px;font-weight:600;">Open assessment</a>
+          <a href="{_LINK}" target="_blank" style="display:inline-block;background:#111;color:#fff;text-decoration:none;padding:10px 16px;border-radius:8px;font-weight:600;">Open assessment</a>
         </p>
         <p style="margin:0;">Good luck!<br/>The InterviewOS Team</p>
         """,
@@ -68,14 +98,28 @@ def assessment_invite_email(*, instructions_link: str, is_resend: bool = False)
         f"{intro}\n\n"
         "Time limit: 60 minutes\n"
         "Recording: Please record your screen and camera\n"
-        f"Instructions: {instructions_link}\n\n"
+        f"Instructions: {_LINK}\n\n"
         "Good luck!\n"
         "The InterviewOS Team"
     )
 
-    return EmailContent(subject=subject, html_body=html_body, text_body=text_body)
+    return _InviteTemplate(
+        subject=subject,
+        html=_SplicedTemplate.compile(html_body),
+        text=_SplicedTemplate.compile(text_body),
+    )
+
+
+def assessment_invite_email(*, instructions_link: str, is_resend: bool = False) -> EmailContent:
+    template = _invite_template(is_resend)
+    return EmailContent(
+        subject=template.subject,
+        html_body=template.html.render(instructions_link),
+        text_body=template.text.render(instructions_link),
+    )
 
 
+@lru_cache(maxsize=1)
 def assessment_reminder_email() -> EmailContent:
     subject = "15 Minutes Left - InterviewOS Assessment"
     text_body = (
@@ -99,3 +143,87 @@ def assessment_reminder_email() -> EmailContent:
     )
 
     return EmailContent(subject=subject, html_body=html_body, text_body=text_body)
+
+
+# Raw MIME assembly. The layouts are pure ASCII with short lines, so messages
+# are written as 7bit multipart/alternative from cached header and boundary
+# segments; anything else falls back to the stdlib serializer.
+_BOUNDARY = "=_interviewos_alt_0f1e2d3c"
+_MAX_LINE = 998
+
+
+@lru_cache(maxsize=32)
+def _header(name: str, value: str) -> bytes:
+    return policy.SMTP.fold_binary(name, value)
+
+
+@lru_cache(maxsize=1)
+def _mime_segments() -> tuple[bytes, bytes, bytes, bytes]:
+    crlf = "\r\n"
+    content_header = (
+        f"MIME-Version: 1.0{crlf}"
+        f'Content-Type: multipart/alternative; boundary="{_BOUNDARY}"{crlf}{crlf}'
+    ).encode("ascii")
+    text_part = (
+        f"--{_BOUNDARY}{crlf}Content-Type: text/plain; charset=\"us-ascii\"{crlf}"
+        f"Content-Transfer-Encoding: 7bit{crlf}{crlf}"
+    ).encode("ascii")
+    html_part = (
+        f"{crlf}--{_BOUNDARY}{crlf}Content-Type: text/html; charset=\"us-ascii\"{crlf}"
+        f"Content-Transfer-Encoding: 7bit{crlf}{crlf}"
+    ).encode("ascii")
+    closing = f"{crlf}--{_BOUNDARY}--{crlf}".encode("ascii")
+    return content_header, text_part, html_part, closing
+
+
+def _message_id(sender: str) -> str:
+    # An explicit domain avoids make_msgid's per-call hostname lookup.
+    domain = parseaddr(sender)[1].rpartition("@")[2] or "localhost"
+    return make_msgid(domain=domain)
+
+
+def _encode_body(body: str) -> bytes | None:
+    if not body.isascii() or _BOUNDARY in body:
+        return None
+    lines = body.replace("\r\n", "\n").split("\n")
+    if any(len(line) > _MAX_LINE for line in lines):
+        return None
+    return "\r\n".join(lines).encode("ascii")
+
+
+def _render_with_stdlib(content: EmailContent, *, sender: str, to_email: str) -> bytes:
+    from email.message import EmailMessage
+
+    msg = EmailMessage()
+    msg["Subject"] = content.subject
+    msg["From"] = sender
+    msg["To"] = to_email
+    msg["Date"] = formatdate(usegmt=True)
+    msg["Message-ID"] = _message_id(sender)
+    msg.set_content(content.text_body)
+    msg.add_alternative(content.html_body, subtype="html")
+    return msg.as_bytes(policy=policy.SMTP)
+
+
+def render_raw_email(content: EmailContent, *, sender: str, to_email: str) -> bytes:
+    """Serialize ``content`` as a multipart/alternative message ready for SMTP or SES raw sends."""
+    text = _encode_body(content.text_body)
+    html = _encode_body(content.html_body)
+    if text is None or html is None:
+        return _render_with_stdlib(content, sender=sender, to_email=to_email)
+    content_header, text_part, html_part, closing = _mime_segments()
+    return b"".join(
+        (
+            _header("Subject", content.subject),
+            _header("From", sender),
+            policy.SMTP.fold_binary("To", to_email),
+            policy.SMTP.fold_binary("Date", formatdate(usegmt=True)),
+            policy.SMTP.fold_binary("Message-ID", _message_id(sender)),
+            content_header,
+            text_part,
+            text,
+            html_part,
+            html,
+            closing,
+        )
+    )
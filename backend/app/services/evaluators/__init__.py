@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import importlib
+import threading
+from functools import lru_cache
+from importlib.metadata import entry_points
+
+from app.services.evaluators.base import EvaluationContext, EvaluationResult, Evaluator
+
+ENTRY_POINT_GROUP = 'interviewos.evaluators'
+DEFAULT_ASSESSMENT_TYPE = 'default'
+
+# Built-in evaluators, imported on first use so the API process never pays for
+# parsing or ML dependencies it does not need. Third-party packages can add or
+# override types through the ``interviewos.evaluators`` entry-point group.
+_BUILTIN_EVALUATORS = {
+    'default': 'app.services.evaluators.users_api:UsersApiEvaluator',
+    'assessment3-rag': 'app.services.evaluators.rag:RagEvaluator',
+    'assessment4-ner': 'app.services.evaluators.ner:NerEvaluator',
+    'json-comparison': 'app.services.evaluators.json_documents:JsonComparisonEvaluator',
+    'java-maven': 'app.services.evaluators.java_maven:JavaMavenEvaluator',
+}
+
+_loaded: dict[str, Evaluator] = {}
+_load_lock = threading.Lock()
+
+
+@lru_cache
+def _evaluator_targets() -> dict[str, str]:
+    targets = dict(_BUILTIN_EVALUATORS)
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        targets[entry_point.name.strip().lower()] = entry_point.value
+    return targets
+
+
+def detect_assessment_type(assessment_type: str | None) -> str:
+    if not assessment_type:
+        return DEFAULT_ASSESSMENT_TYPE
+    normalized = assessment_type.strip().lower()
+    if normalized in _evaluator_targets():
+        return normalized
+    return DEFAULT_ASSESSMENT_TYPE
+
+
+def get_evaluator(assessment_type: str) -> Evaluator:
+    assessment_type = detect_assessment_type(assessment_type)
+    evaluator = _loaded.get(assessment_type)
+    if evaluator is not None:
+        return evaluator
+    with _load_lock:
+        evaluator = _loaded.get(assessment_type)
+        if evaluator is None:
+            module_name, _, attr = _evaluator_targets()[assessment_type].partition(':')
+            evaluator_cls = getattr(importlib.import_module(module_name), attr)
+            if not (isinstance(evaluator_cls, type) and issubclass(evaluator_cls, Evaluator)):
+                raise TypeError(f'{module_name}:{attr} is not an Evaluator subclass')
+            # Instantiating fails here, once, if the class does not implement evaluate().
+            evaluator = evaluator_cls()
+            _loaded[assessment_type] = evaluator
+        return evaluator
+
+
+__all__ = [
+    'ENTRY_POINT_GROUP',
+    'EvaluationContext',
+    'EvaluationResult',
+    'Evaluator',
+    'detect_assessment_type',
+    'get_evaluator',
+]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import zipfile
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import ClassVar
+
+from app.core.config import Settings
+
+
+@dataclass
+class EvaluationContext:
+    settings: Settings
+    submission: Path
+    notebook: Path | None
+    zipf: zipfile.ZipFile
+    names: list[str]
+    question_id: int | None = None
+
+    def any_name(self, *markers: str) -> bool:
+        return any(marker in name.lower() for name in self.names for marker in markers)
+
+
+@dataclass
+class EvaluationResult:
+    code_quality: int
+    checks: list[dict[str, object]] = field(default_factory=list)
+    summary: list[str] = field(default_factory=list)
+    diffs: list[dict[str, object]] = field(default_factory=list)
+
+
+class Evaluator(ABC):
+    """Type-specific scoring for one ``assessment_type``.
+
+    ``artifacts`` names the uploads the evaluator needs (``submission``,
+    ``notebook``) so the pipeline can skip lookups nobody uses. The report
+    pipeline reuses a stored evaluation only while ``version`` and the content
+    of ``reference_paths`` are unchanged, so bump ``version`` whenever the
+    scoring logic changes.
+    """
+
+    assessment_type: ClassVar[str] = 'default'
+    artifacts: ClassVar[frozenset[str]] = frozenset({'submission'})
+    version: ClassVar[str] = '1'
+
+    def reference_paths(self, settings: Settings, question_id: int | None) -> list[Path]:
+        """Server-side reference data (expected outputs, question sets) the scores depend on."""
+        return []
+
+    @abstractmethod
+    def evaluate(self, context: EvaluationContext) -> EvaluationResult: ...
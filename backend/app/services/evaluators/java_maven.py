@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.services.evaluators.base import EvaluationContext, EvaluationResult, Evaluator
+
+
+class JavaMavenEvaluator(Evaluator):
+    assessment_type = 'java-maven'
+
+    def evaluate(self, context: EvaluationContext) -> EvaluationResult:
+        has_java = any(n.endswith('.java') for n in context.names)
+        has_pom = any(Path(n).name.lower() == 'pom.xml' for n in context.names)
+        return EvaluationResult(
+            code_quality=80 if has_java and has_pom else 60,
+            checks=[
+                {
+                    'name': 'Maven project structure',
+                    'status': 'pass' if has_pom else 'fail',
+                    'expected': 'Include pom.xml for java-maven assessment',
+                    'output': 'pom.xml found' if has_pom else 'pom.xml not found',
+                },
+                {
+                    'name': 'Java source presence',
+                    'status': 'pass' if has_java else 'partial',
+                    'expected': 'Include Java implementation files',
+                    'output': 'Java files found' if has_java else 'No Java files found',
+                },
+            ],
+            summary=['Java Maven evaluation path executed.'],
+        )
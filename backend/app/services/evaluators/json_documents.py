@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.core.config import Settings
+from app.services.evaluators.base import EvaluationContext, EvaluationResult, Evaluator
+from app.services.json_comparison import compare_json_outputs, load_expected_outputs
+
+
+class JsonComparisonEvaluator(Evaluator):
+    assessment_type = 'json-comparison'
+
+    def reference_paths(self, settings: Settings, question_id: int | None) -> list[Path]:
+        if question_id is None:
+            return []
+        return [Path(settings.json_expected_outputs_dir) / str(question_id)]
+
+    def evaluate(self, context: EvaluationContext) -> EvaluationResult:
+        has_json = any(n.endswith('.json') for n in context.names)
+        has_llama_marker = context.any_name('llama', 'document')
+        result = EvaluationResult(
+            code_quality=82 if has_json and has_llama_marker else 60,
+            checks=[
+                {
+                    'name': 'JSON output artifacts',
+                    'status': 'pass' if has_json else 'partial',
+                    'expected': 'Include structured JSON outputs/parsers',
+                    'output': 'JSON artifacts found' if has_json else 'No JSON artifacts found',
+                },
+                {
+                    'name': 'Document processing markers',
+                    'status': 'pass' if has_llama_marker else 'partial',
+                    'expected': 'Include document parsing/extraction pipeline artifacts',
+                    'output': 'Document-processing markers found' if has_llama_marker else 'No extraction markers found',
+                },
+            ],
+        )
+
+        expected_documents: dict[str, object] = {}
+        for reference_dir in self.reference_paths(context.settings, context.question_id):
+            expected_documents.update(load_expected_outputs(reference_dir))
+        comparison = compare_json_outputs(context.zipf, context.names, expected_documents)
+        if comparison.documents:
+            result.code_quality = round(40 + 60 * comparison.f1)
+            result.checks.append(
+                {
+                    'name': 'Field-level JSON comparison',
+                    'status': 'pass' if comparison.f1 >= 0.9 else 'partial' if comparison.f1 > 0 else 'fail',
+                    'expected': 'Extracted fields should match the expected outputs',
+                    'output': (
+                        f'precision {comparison.precision:.2%}, recall {comparison.recall:.2%} '
+                        f'across {comparison.documents} documents'
+                    ),
+                }
+            )
+            if comparison.missing_documents:
+                result.checks.append(
+                    {
+                        'name': 'Expected documents produced',
+                        'status': 'partial',
+                        'expected': 'Produce an output JSON for every expected document',
+                        'output': f'{len(comparison.missing_documents)} expected outputs have no match',
+                    }
+                )
+            for mismatch in comparison.mismatches[:8]:
+                result.diffs.append(
+                    {
+                        'path': f"{mismatch['document']}:{mismatch['path']}",
+                        'status': 'modified',
+                        'modified': f"expected {mismatch['expected']!r}, got {mismatch['actual']!r}",
+                    }
+                )
+            result.summary.append(
+                f'JSON comparison matched {comparison.matched_fields:.1f} of '
+                f'{comparison.expected_fields} expected fields.'
+            )
+        result.summary.append('JSON-comparison evaluation path executed.')
+        return result
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from app.services.evaluators.base import EvaluationContext, EvaluationResult, Evaluator
+
+
+class NerEvaluator(Evaluator):
+    assessment_type = 'assessment4-ner'
+    artifacts = frozenset({'submission', 'notebook'})
+
+    def evaluate(self, context: EvaluationContext) -> EvaluationResult:
+        notebook = context.notebook
+        has_ipynb = any(n.endswith('.ipynb') for n in context.names) or notebook is not None
+        has_ner_marker = context.any_name('ner')
+        result = EvaluationResult(
+            code_quality=82 if has_ipynb else 62,
+            checks=[
+                {
+                    'name': 'NER notebook artifact',
+                    'status': 'pass' if has_ipynb else 'partial',
+                    'expected': 'Include notebook/script for NER training/evaluation',
+                    'output': 'Notebook found' if has_ipynb else 'Notebook not found',
+                },
+                {
+                    'name': 'NER model indicators',
+                    'status': 'pass' if has_ner_marker else 'partial',
+                    'expected': 'Include NER-related code/config artifacts',
+                    'output': 'NER markers found' if has_ner_marker else 'No explicit NER markers found',
+                },
+            ],
+        )
+        if notebook is not None:
+            result.checks.append(
+                {
+                    'name': 'Separate notebook upload',
+                    'status': 'pass',
+                    'expected': 'Assessment4 notebook uploaded as companion artifact',
+                    'output': f'Found {notebook.name}',
+                }
+            )
+            result.summary.append(f'Assessment4 companion notebook detected: {notebook.name}.')
+        result.summary.append('Assessment4 (NER) evaluation path executed.')
+        return result
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.core.config import Settings
+from app.services.evaluators.base import EvaluationContext, EvaluationResult, Evaluator
+from app.services.rag_harness import RetrievalMetrics, evaluate_retrieval
+
+
+def _retrieval_checks(metrics: RetrievalMetrics) -> tuple[list[dict[str, object]], list[str]]:
+    if metrics.error is not None:
+        return (
+            [
+                {
+                    'name': 'Retrieval quality harness',
+                    'status': 'fail',
+                    'expected': f'{metrics.entry_point} answers the gold question set',
+                    'output': f'Harness failed: {metrics.error}',
+                }
+            ],
+            [f'Retrieval harness could not run {metrics.entry_point}.'],
+        )
+    return (
+        [
+            {
+                'name': f'Retrieval recall@{metrics.k}',
+                'status': 'pass' if metrics.recall_at_k >= 0.8 else 'partial' if metrics.recall_at_k > 0 else 'fail',
+                'expected': f'Gold passages retrieved in the top {metrics.k} results',
+                'output': f'recall@{metrics.k} {metrics.recall_at_k:.2f}, MRR {metrics.mrr:.2f} over {metrics.questions} questions',
+            },
+            {
+                'name': 'Retrieval latency',
+                'status': 'pass' if metrics.latency_p95_ms <= 1000 else 'partial',
+                'expected': 'p95 query latency under 1s',
+                'output': (
+                    f'p50 {metrics.latency_p50_ms:.0f}ms, p95 {metrics.latency_p95_ms:.0f}ms, '
+                    f'p99 {metrics.latency_p99_ms:.0f}ms'
+                ),
+            },
+        ],
+        [
+            f'Retrieval harness ran {metrics.questions} gold questions through {metrics.entry_point}: '
+            f'recall@{metrics.k} {metrics.recall_at_k:.2f}, MRR {metrics.mrr:.2f}.',
+            f'Retrieval latency p50/p95/p99: {metrics.latency_p50_ms:.0f}/{metrics.latency_p95_ms:.0f}/'
+            f'{metrics.latency_p99_ms:.0f} ms.',
+        ],
+    )
+
+
+class RagEvaluator(Evaluator):
+    assessment_type = 'assessment3-rag'
+
+    def reference_paths(self, settings: Settings, question_id: int | None) -> list[Path]:
+        return [Path(settings.rag_eval_questions_path)]
+
+    def evaluate(self, context: EvaluationContext) -> EvaluationResult:
+        has_rag_marker = context.any_name('rag')
+        has_retrieval_marker = context.any_name('retriev', 'vector')
+        result = EvaluationResult(
+            code_quality=84 if has_rag_marker and has_retrieval_marker else 70,
+            checks=[
+                {
+                    'name': 'RAG pipeline artifacts',
+                    'status': 'pass' if has_rag_marker else 'partial',
+                    'expected': 'Include retrieval/indexing or RAG-related implementation files',
+                    'output': 'RAG-specific files found' if has_rag_marker else 'No explicit RAG markers found',
+                },
+                {
+                    'name': 'Retrieval/index markers',
+                    'status': 'pass' if has_retrieval_marker else 'partial',
+                    'expected': 'Include retrieval/index/vector database logic',
+                    'output': 'Retrieval markers found' if has_retrieval_marker else 'No retrieval markers found',
+                },
+            ],
+        )
+
+        metrics = evaluate_retrieval(context.settings, context.submission)
+        if metrics is not None:
+            retrieval_checks, retrieval_summary = _retrieval_checks(metrics)
+            result.checks.extend(retrieval_checks)
+            result.summary.extend(retrieval_summary)
+            if metrics.error is None:
+                result.code_quality = round(50 + 50 * (metrics.recall_at_k + metrics.mrr) / 2)
+        result.summary.insert(0, 'Assessment3 (RAG) evaluation path executed.')
+        return result
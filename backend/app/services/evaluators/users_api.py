@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from app.services.evaluators.base import EvaluationContext, EvaluationResult, Evaluator
+
+
+class UsersApiEvaluator(Evaluator):
+    assessment_type = 'default'
+
+    def evaluate(self, context: EvaluationContext) -> EvaluationResult:
+        has_users_api_marker = context.any_name('users-service', 'server.js')
+        return EvaluationResult(
+            code_quality=80 if has_users_api_marker else 58,
+            checks=[
+                {
+                    'name': 'Users API structure',
+                    'status': 'pass' if has_users_api_marker else 'partial',
+                    'expected': 'Include users-service/server implementation artifacts',
+                    'output': 'Users API markers found' if has_users_api_marker else 'Users API markers missing',
+                }
+            ],
+            summary=['Default evaluation path executed.'],
+        )
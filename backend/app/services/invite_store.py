@@ -1,15 +1,22 @@
+import logging
 import secrets
 import sqlite3
-from dataclasses import dataclass
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 from app.core.config import Settings
+from app.services.assessment_store import upsert_candidates_in_connection
+from app.services.sql_records import fetch_all, fetch_one, record_columns, record_factory
+
+logger = logging.getLogger(__name__)
 
 ACTIVE_STATUSES = ("invited", "resent")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InviteRecord:
     id: int
     email: str
@@ -64,55 +71,49 @@ def init_store(settings: Settings) -> None:
         cols = {str(row["name"]) for row in connection.execute("PRAGMA table_info(invites)").fetchall()}
         if "assessment_id" not in cols:
             connection.execute("ALTER TABLE invites ADD COLUMN assessment_id INTEGER")
+        connection.execute("DROP INDEX IF EXISTS idx_invites_email_created_at")
         connection.execute(
-            "CREATE INDEX IF NOT EXISTS idx_invites_email_created_at ON invites(email, created_at DESC)"
+            """
+            CREATE INDEX IF NOT EXISTS idx_invites_email_assessment
+            ON invites(lower(email), assessment_id, created_at DESC)
+            """
+        )
+        connection.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_invites_email_lower_created_at
+            ON invites(lower(email), created_at DESC)
+            """
         )
         connection.execute("CREATE INDEX IF NOT EXISTS idx_invites_token ON invites(token)")
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_invites_status_expires_at ON invites(status, expires_at)"
+        )
 
 
-def _row_to_record(row: sqlite3.Row) -> InviteRecord:
-    return InviteRecord(
-        id=int(row["id"]),
-        email=str(row["email"]),
-        token=str(row["token"]),
-        assessment_id=row["assessment_id"],
-        status=str(row["status"]),
-        created_at=str(row["created_at"]),
-        expires_at=str(row["expires_at"]),
-        taken_at=row["taken_at"],
-        superseded_at=row["superseded_at"],
-        resent_from_token=row["resent_from_token"],
-    )
-
-
-def _set_status(connection: sqlite3.Connection, invite_id: int, status: str) -> None:
-    superseded_at = _iso(_utc_now()) if status == "superseded" else None
-    taken_at = _iso(_utc_now()) if status == "taken" else None
-    connection.execute(
-        """
-        UPDATE invites
-        SET status = ?,
-            superseded_at = COALESCE(?, superseded_at),
-            taken_at = COALESCE(?, taken_at)
-        WHERE id = ?
-        """,
-        (status, superseded_at, taken_at, invite_id),
-    )
+_INVITE_COLUMNS = record_columns(InviteRecord)
+_invite_record = record_factory(InviteRecord)
 
 
-def _expire_if_needed(connection: sqlite3.Connection, invite: InviteRecord) -> InviteRecord:
-    if invite.status not in ACTIVE_STATUSES:
-        return invite
+def _effective(invite: InviteRecord) -> InviteRecord:
+    # Reads never write: an active invite past its expiry that the sweeper
+    # has not reached yet is reported as expired without touching the row.
+    if invite.status in ACTIVE_STATUSES and invite.expires_at <= _iso(_utc_now()):
+        return replace(invite, status="expired")
+    return invite
 
-    expires_at = datetime.fromisoformat(invite.expires_at)
-    if expires_at > _utc_now():
-        return invite
 
-    _set_status(connection, invite.id, "expired")
-    row = connection.execute("SELECT * FROM invites WHERE id = ?", (invite.id,)).fetchone()
-    if row is None:
-        return invite
-    return _row_to_record(row)
+def expire_due_invites(settings: Settings) -> int:
+    with _connect(settings) as connection:
+        result = connection.execute(
+            """
+            UPDATE invites
+            SET status = 'expired'
+            WHERE status IN ('invited', 'resent')
+              AND expires_at <= ?
+            """,
+            (_iso(_utc_now()),),
+        )
+        return int(result.rowcount)
 
 
 def _supersede_active_invites_in_connection(
@@ -171,10 +172,12 @@ def create_invite(
     status: str = "invited",
     resent_from_token: str | None = None,
     supersede_existing: bool = True,
+    token: str | None = None,
+    in_transaction: Callable[[sqlite3.Connection], None] | None = None,
 ) -> InviteRecord:
     now = _utc_now()
     expires_at = now + timedelta(seconds=settings.invite_expiry_seconds)
-    token = secrets.token_urlsafe(32)
+    token = token or secrets.token_urlsafe(32)
 
     with _connect(settings) as connection:
         if supersede_existing:
@@ -193,69 +196,193 @@ def create_invite(
             (email, token, assessment_id, status, _iso(now), _iso(expires_at), resent_from_token),
         )
         invite_id = int(cursor.lastrowid)
-        row = connection.execute("SELECT * FROM invites WHERE id = ?", (invite_id,)).fetchone()
-        if row is None:
+        if in_transaction is not None:
+            in_transaction(connection)
+        invite = fetch_one(
+            connection, _invite_record, f"SELECT {_INVITE_COLUMNS} FROM invites WHERE id = ?", (invite_id,)
+        )
+        if invite is None:
             raise RuntimeError("Failed to persist invite")
-        return _row_to_record(row)
+    return invite
+
+
+def create_invites_bulk(
+    emails: list[str],
+    settings: Settings,
+    *,
+    assessment_id: int | None = None,
+    status: str = "invited",
+    candidate_names: dict[str, str | None] | None = None,
+    tokens: list[str] | None = None,
+    in_transaction: Callable[[sqlite3.Connection], None] | None = None,
+) -> list[InviteRecord]:
+    """Supersede, insert and register candidates for many invites in one transaction.
+
+    ``in_transaction`` runs on the same connection before commit, so callers
+    can write related rows (such as queued emails) atomically with the invites.
+    """
+    now = _utc_now()
+    created_at = _iso(now)
+    expires_at = _iso(now + timedelta(seconds=settings.invite_expiry_seconds))
+    tokens = tokens or [secrets.token_urlsafe(32) for _ in emails]
+
+    with _connect(settings) as connection:
+        if assessment_id is None:
+            connection.executemany(
+                """
+                UPDATE invites
+                SET status = 'superseded', superseded_at = ?
+                WHERE lower(email) = lower(?)
+                  AND assessment_id IS NULL
+                  AND status IN ('invited', 'resent')
+                """,
+                [(created_at, email) for email in emails],
+            )
+        else:
+            connection.executemany(
+                """
+                UPDATE invites
+                SET status = 'superseded', superseded_at = ?
+                WHERE lower(email) = lower(?)
+                  AND assessment_id = ?
+                  AND status IN ('invited', 'resent')
+                """,
+                [(created_at, email, assessment_id) for email in emails],
+            )
+        connection.executemany(
+            """
+            INSERT INTO invites (email, token, assessment_id, status, created_at, expires_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [(email, token, assessment_id, status, created_at, expires_at) for email, token in zip(emails, tokens)],
+        )
+        if assessment_id is not None and candidate_names is not None:
+            upsert_candidates_in_connection(
+                connection,
+                assessment_id=assessment_id,
+                candidates=[(email, candidate_names.get(email)) for email in emails],
+                status=status,
+            )
+        if in_transaction is not None:
+            in_transaction(connection)
+
+        by_token: dict[str, InviteRecord] = {}
+        for offset in range(0, len(tokens), 500):
+            chunk = tokens[offset : offset + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            for invite in fetch_all(
+                connection,
+                _invite_record,
+                f"SELECT {_INVITE_COLUMNS} FROM invites WHERE token IN ({placeholders})",
+                chunk,
+            ):
+                by_token[invite.token] = invite
+    return [by_token[token] for token in tokens]
 
 
 def get_invite_by_token(token: str, settings: Settings) -> InviteRecord | None:
     with _connect(settings) as connection:
-        row = connection.execute("SELECT * FROM invites WHERE token = ?", (token,)).fetchone()
-        if row is None:
-            return None
-        invite = _row_to_record(row)
-        return _expire_if_needed(connection, invite)
+        invite = fetch_one(
+            connection, _invite_record, f"SELECT {_INVITE_COLUMNS} FROM invites WHERE token = ?", (token,)
+        )
+        return _effective(invite) if invite is not None else None
 
 
 def get_latest_invite_by_email(email: str, settings: Settings) -> InviteRecord | None:
     with _connect(settings) as connection:
-        row = connection.execute(
-            """
-            SELECT * FROM invites
+        invite = fetch_one(
+            connection,
+            _invite_record,
+            f"""
+            SELECT {_INVITE_COLUMNS} FROM invites
             WHERE lower(email) = lower(?)
             ORDER BY created_at DESC
             LIMIT 1
             """,
             (email,),
-        ).fetchone()
-        if row is None:
-            return None
-        invite = _row_to_record(row)
-        return _expire_if_needed(connection, invite)
+        )
+        return _effective(invite) if invite is not None else None
 
 
 def get_latest_invite_by_email_and_assessment(
     email: str, assessment_id: int, settings: Settings
 ) -> InviteRecord | None:
     with _connect(settings) as connection:
-        row = connection.execute(
-            """
-            SELECT * FROM invites
+        invite = fetch_one(
+            connection,
+            _invite_record,
+            f"""
+            SELECT {_INVITE_COLUMNS} FROM invites
             WHERE lower(email) = lower(?)
               AND assessment_id = ?
             ORDER BY created_at DESC
             LIMIT 1
             """,
             (email, assessment_id),
-        ).fetchone()
-        if row is None:
-            return None
-        invite = _row_to_record(row)
-        return _expire_if_needed(connection, invite)
+        )
+        return _effective(invite) if invite is not None else None
 
 
 def mark_invite_taken(token: str, settings: Settings) -> InviteRecord | None:
     with _connect(settings) as connection:
-        row = connection.execute("SELECT * FROM invites WHERE token = ?", (token,)).fetchone()
-        if row is None:
-            return None
-        invite = _expire_if_needed(connection, _row_to_record(row))
-        if invite.status not in ACTIVE_STATUSES:
-            return invite
-
-        _set_status(connection, invite.id, "taken")
-        updated = connection.execute("SELECT * FROM invites WHERE id = ?", (invite.id,)).fetchone()
-        if updated is None:
-            return invite
-        return _row_to_record(updated)
+        connection.execute(
+            """
+            UPDATE invites
+            SET status = 'taken', taken_at = ?
+            WHERE token = ?
+              AND status IN ('invited', 'resent')
+              AND expires_at > ?
+            """,
+            (_iso(_utc_now()), token, _iso(_utc_now())),
+        )
+        invite = fetch_one(
+            connection, _invite_record, f"SELECT {_INVITE_COLUMNS} FROM invites WHERE token = ?", (token,)
+        )
+        return _effective(invite) if invite is not None else None
+
+
+class InviteExpirySweeper:
+    def __init__(self, settings: Settings) -> None:
+        self._settings = settings
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="invite-expiry-sweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                expired = expire_due_invites(self._settings)
+                if expired:
+                    logger.info("Expired %s invites", expired)
+            except Exception:
+                logger.exception("Invite expiry sweep failed")
+            self._stop.wait(self._settings.invite_sweep_interval_seconds)
+
+
+_sweeper: InviteExpirySweeper | None = None
+
+
+def start_invite_sweeper(settings: Settings) -> InviteExpirySweeper:
+    global _sweeper
+    if _sweeper is None:
+        _sweeper = InviteExpirySweeper(settings)
+    _sweeper.start()
+    return _sweeper
+
+
+def stop_invite_sweeper() -> None:
+    global _sweeper
+    if _sweeper is not None:
+        _sweeper.stop()
+        _sweeper = None
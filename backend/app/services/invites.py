@@ -1,16 +1,19 @@
+import secrets
+import sqlite3
+from collections.abc import Callable
+
 from fastapi import HTTPException
 
 from app.core.config import Settings
-from app.services.assessment import (
-    generate_assessment_download_link,
-    send_assessment_email,
-)
+from app.services.assessment import generate_assessment_download_link
 from app.services.assessment_store import add_or_update_candidate, get_candidate_by_id
-from app.services.assessment_store import get_assessment, get_candidate_by_assessment_and_email
+from app.services.assessment_store import assessment_exists, get_candidate_names_by_email
+from app.services.email_outbox import OutboxEmail, enqueue_emails_in_connection, notify_dispatcher
 from app.services.invite_store import (
     ACTIVE_STATUSES,
     InviteRecord,
     create_invite,
+    create_invites_bulk,
     get_invite_by_token,
     get_latest_invite_by_email,
     get_latest_invite_by_email_and_assessment,
@@ -22,15 +25,40 @@ def _invite_url(token: str, settings: Settings) -> str:
     return f"{settings.frontend_base_url}/take-assessment?token={token}"
 
 
-def _to_public_invite(invite: InviteRecord, settings: Settings) -> dict[str, str | int | None]:
-    candidate_name = None
-    if invite.assessment_id is not None:
-        candidate = get_candidate_by_assessment_and_email(
-            settings, assessment_id=invite.assessment_id, email=invite.email
+def _invite_email(email: str, token: str, settings: Settings, *, is_resend: bool = False) -> OutboxEmail:
+    return OutboxEmail(
+        kind="assessment",
+        to_email=email,
+        payload={"instructions_link": _invite_url(token, settings), "is_resend": is_resend},
+    )
+
+
+def _enqueue(emails: list[OutboxEmail]) -> Callable[[sqlite3.Connection], None]:
+    return lambda connection: enqueue_emails_in_connection(connection, emails)
+
+
+def _to_public_invites(invites: list[InviteRecord], settings: Settings) -> list[dict[str, str | int | None]]:
+    names = get_candidate_names_by_email(
+        settings,
+        [(invite.assessment_id, invite.email) for invite in invites if invite.assessment_id is not None],
+    )
+    return [
+        _public_invite_payload(
+            invite,
+            settings,
+            names.get((invite.assessment_id, invite.email.lower())) if invite.assessment_id is not None else None,
         )
-        if candidate is not None:
-            candidate_name = candidate.name
+        for invite in invites
+    ]
+
+
+def _to_public_invite(invite: InviteRecord, settings: Settings) -> dict[str, str | int | None]:
+    return _to_public_invites([invite], settings)[0]
 
+
+def _public_invite_payload(
+    invite: InviteRecord, settings: Settings, candidate_name: str | None
+) -> dict[str, str | int | None]:
     return {
         "id": invite.id,
         "email": invite.email,
@@ -54,16 +82,19 @@ def create_and_send_invite(
     candidate_name: str | None = None,
 ) -> dict[str, str | int | None]:
     normalized_email = email.strip().lower()
-    if assessment_id is not None and get_assessment(settings, assessment_id) is None:
+    if assessment_id is not None and not assessment_exists(settings, assessment_id):
         raise HTTPException(status_code=404, detail="Assessment not found.")
+    token = secrets.token_urlsafe(32)
     invite = create_invite(
         normalized_email,
         settings,
         assessment_id=assessment_id,
         status="invited",
         supersede_existing=True,
+        token=token,
+        in_transaction=_enqueue([_invite_email(normalized_email, token, settings)]),
     )
-    send_assessment_email(normalized_email, _invite_url(invite.token, settings), settings)
+    notify_dispatcher()
     if assessment_id is not None:
         add_or_update_candidate(
             settings,
@@ -75,6 +106,43 @@ def create_and_send_invite(
     return _to_public_invite(invite, settings)
 
 
+def create_and_send_bulk_invites(
+    candidates: list[tuple[str, str | None]],
+    settings: Settings,
+    *,
+    assessment_id: int | None = None,
+) -> tuple[list[dict[str, str | int | None]], list[dict[str, object]]]:
+    if assessment_id is not None and not assessment_exists(settings, assessment_id):
+        raise HTTPException(status_code=404, detail="Assessment not found.")
+
+    names: dict[str, str | None] = {}
+    for email, name in candidates:
+        normalized_email = email.strip().lower()
+        if normalized_email in names and not (name or "").strip():
+            continue
+        names[normalized_email] = name
+    emails = list(names)
+    if not emails:
+        return [], []
+
+    tokens = [secrets.token_urlsafe(32) for _ in emails]
+    invites = create_invites_bulk(
+        emails,
+        settings,
+        assessment_id=assessment_id,
+        status="invited",
+        candidate_names=names if assessment_id is not None else None,
+        tokens=tokens,
+        in_transaction=_enqueue([_invite_email(email, token, settings) for email, token in zip(emails, tokens)]),
+    )
+    notify_dispatcher()
+    deliveries: list[dict[str, object]] = [
+        {"email": invite.email, "inviteId": invite.id, "status": "queued", "error": None} for invite in invites
+    ]
+
+    return _to_public_invites(invites, settings), deliveries
+
+
 def resend_invite(
     *,
     settings: Settings,
@@ -125,9 +193,10 @@ def resend_invite(
     resolved_assessment_id = (
         target_assessment_id if target_assessment_id is not None else source_invite.assessment_id
     )
-    if resolved_assessment_id is not None and get_assessment(settings, resolved_assessment_id) is None:
+    if resolved_assessment_id is not None and not assessment_exists(settings, resolved_assessment_id):
         raise HTTPException(status_code=404, detail="Assessment not found.")
 
+    token = secrets.token_urlsafe(32)
     resent = create_invite(
         source_invite.email,
         settings,
@@ -135,8 +204,10 @@ def resend_invite(
         status="resent",
         resent_from_token=source_invite.token,
         supersede_existing=True,
+        token=token,
+        in_transaction=_enqueue([_invite_email(source_invite.email, token, settings, is_resend=True)]),
     )
-    send_assessment_email(source_invite.email, _invite_url(resent.token, settings), settings, is_resend=True)
+    notify_dispatcher()
     if resolved_assessment_id is not None:
         add_or_update_candidate(
             settings,
@@ -155,7 +226,7 @@ def verify_invite(token: str, settings: Settings) -> dict[str, object]:
 
     assessment_missing = False
     if invite.assessment_id is not None:
-        assessment_missing = get_assessment(settings, invite.assessment_id) is None
+        assessment_missing = not assessment_exists(settings, invite.assessment_id)
 
     is_active = invite.status in ACTIVE_STATUSES and not assessment_missing
     payload: dict[str, object] = {
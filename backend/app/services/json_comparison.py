@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import json
+import re
+import zipfile
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from pathlib import Path, PurePosixPath
+
+FUZZY_MATCH_THRESHOLD = 0.9
+_EXPECTED_DIR_MARKERS = ('expected', 'expected_outputs', 'expected-outputs', 'golden', 'ground_truth')
+_IGNORED_JSON_NAMES = {'package.json', 'package-lock.json', 'tsconfig.json', 'jsconfig.json', 'composer.json'}
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@dataclass
+class JsonComparisonResult:
+    documents: int = 0
+    expected_fields: int = 0
+    actual_fields: int = 0
+    matched_fields: float = 0.0
+    missing_documents: list[str] = field(default_factory=list)
+    mismatches: list[dict[str, object]] = field(default_factory=list)
+
+    @property
+    def precision(self) -> float:
+        return self.matched_fields / self.actual_fields if self.actual_fields else 0.0
+
+    @property
+    def recall(self) -> float:
+        return self.matched_fields / self.expected_fields if self.expected_fields else 0.0
+
+    @property
+    def f1(self) -> float:
+        total = self.precision + self.recall
+        return 2 * self.precision * self.recall / total if total else 0.0
+
+
+def flatten_json(value: object, prefix: str = '') -> dict[str, object]:
+    """Flatten nested JSON into a ``path -> scalar`` table (``a.b[0].c``)."""
+    flat: dict[str, object] = {}
+    stack: list[tuple[str, object]] = [(prefix, value)]
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, dict):
+            if not node and path:
+                flat[path] = {}
+            for key, child in node.items():
+                stack.append((f'{path}.{key}' if path else str(key), child))
+        elif isinstance(node, list):
+            if not node and path:
+                flat[path] = []
+            for index, child in enumerate(node):
+                stack.append((f'{path}[{index}]', child))
+        else:
+            flat[path] = node
+    return flat
+
+
+def _normalize(value: object) -> object:
+    if isinstance(value, str):
+        return _WHITESPACE_RE.sub(' ', value).strip().casefold()
+    if isinstance(value, bool):
+        # Tagged so that true/false never equal 1/0 after ints become floats.
+        return ('bool', value)
+    if value is None:
+        return value
+    if isinstance(value, (int, float)):
+        return round(float(value), 6)
+    return value
+
+
+def _is_expected_path(name: str) -> bool:
+    parts = [part.lower() for part in PurePosixPath(name).parts[:-1]]
+    return any(part in _EXPECTED_DIR_MARKERS for part in parts)
+
+
+def _json_members(names: list[str]) -> dict[str, str]:
+    actual: dict[str, str] = {}
+    for name in names:
+        if not name.endswith('.json') or name.startswith('__MACOSX/') or '/node_modules/' in f'/{name}':
+            continue
+        path = PurePosixPath(name)
+        # Expected-style directories inside the submission are the candidate's
+        # own files: never trusted as references, and not graded as outputs.
+        if path.name.lower() in _IGNORED_JSON_NAMES or _is_expected_path(name):
+            continue
+        actual.setdefault(path.stem.lower(), name)
+    return actual
+
+
+def load_expected_outputs(directory: Path) -> dict[str, object]:
+    """Load the server-side reference documents in ``directory``, keyed by lower-cased file stem.
+
+    Returns an empty mapping when the directory does not exist; unreadable
+    documents are skipped.
+    """
+    expected: dict[str, object] = {}
+    if not directory.is_dir():
+        return expected
+    for path in sorted(directory.glob('*.json')):
+        try:
+            expected.setdefault(path.stem.lower(), json.loads(path.read_text(encoding='utf-8-sig')))
+        except (OSError, ValueError, RecursionError):
+            continue
+    return expected
+
+
+def _load_member(zipf: zipfile.ZipFile, name: str) -> object:
+    with zipf.open(name) as handle:
+        return json.loads(handle.read().decode('utf-8-sig'))
+
+
+def _similarity_batch(pairs: set[tuple[str, str]], threshold: float) -> dict[tuple[str, str], float]:
+    # Score each distinct string pair once for the whole submission. The
+    # cheap length/character-multiset upper bounds reject most pairs before
+    # the quadratic SequenceMatcher ratio is ever computed.
+    scores: dict[tuple[str, str], float] = {}
+    matcher = SequenceMatcher(autojunk=False)
+    for expected, actual in sorted(pairs, key=lambda pair: pair[1]):
+        if not expected or not actual:
+            scores[(expected, actual)] = 0.0
+            continue
+        if matcher.b != actual:
+            matcher.set_seq2(actual)
+        matcher.set_seq1(expected)
+        if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+            scores[(expected, actual)] = 0.0
+            continue
+        scores[(expected, actual)] = matcher.ratio()
+    return scores
+
+
+def compare_json_outputs(
+    zipf: zipfile.ZipFile,
+    names: list[str],
+    expected_documents: dict[str, object],
+    *,
+    fuzzy_threshold: float = FUZZY_MATCH_THRESHOLD,
+    max_mismatches: int = 20,
+) -> JsonComparisonResult:
+    """Score candidate JSON outputs against server-side reference documents.
+
+    ``expected_documents`` maps a file stem to its reference document (see
+    :func:`load_expected_outputs`) and is paired with candidate outputs by
+    file stem; JSON under ``expected``-style directories in the archive is
+    ignored. Every document is flattened
+    into a path table; exact matches are resolved by key lookup and the
+    remaining string mismatches are fuzzy-scored in a single deduplicated
+    batch, so cost grows with distinct values rather than documents x fields.
+    """
+    result = JsonComparisonResult()
+    if not expected_documents:
+        return result
+    actual_members = _json_members(names)
+
+    tables: list[tuple[str, dict[str, object], dict[str, object]]] = []
+    for stem, expected_document in sorted(expected_documents.items()):
+        actual_name = actual_members.get(stem)
+        expected_flat = flatten_json(expected_document)
+        result.documents += 1
+        result.expected_fields += len(expected_flat)
+        if actual_name is None:
+            result.missing_documents.append(stem)
+            continue
+        try:
+            actual_flat = flatten_json(_load_member(zipf, actual_name))
+        except (ValueError, UnicodeDecodeError, RecursionError):
+            # Deeply nested candidate JSON counts as unreadable, not as a server error.
+            result.missing_documents.append(stem)
+            continue
+        result.actual_fields += len(actual_flat)
+        tables.append((stem, expected_flat, actual_flat))
+
+    fuzzy_candidates: list[tuple[str, str, str, str, object, object]] = []
+    for stem, expected_flat, actual_flat in tables:
+        for path in expected_flat.keys() & actual_flat.keys():
+            expected_value = _normalize(expected_flat[path])
+            actual_value = _normalize(actual_flat[path])
+            if expected_value == actual_value:
+                result.matched_fields += 1
+            elif isinstance(expected_value, str) and isinstance(actual_value, str):
+                fuzzy_candidates.append(
+                    (stem, path, expected_value, actual_value, expected_flat[path], actual_flat[path])
+                )
+            elif len(result.mismatches) < max_mismatches:
+                result.mismatches.append(
+                    {'document': stem, 'path': path, 'expected': expected_flat[path], 'actual': actual_flat[path]}
+                )
+
+    scores = _similarity_batch({(item[2], item[3]) for item in fuzzy_candidates}, fuzzy_threshold)
+    for stem, path, expected_value, actual_value, expected_raw, actual_raw in fuzzy_candidates:
+        similarity = scores[(expected_value, actual_value)]
+        if similarity >= fuzzy_threshold:
+            result.matched_fields += similarity
+        elif len(result.mismatches) < max_mismatches:
+            result.mismatches.append({'document': stem, 'path': path, 'expected': expected_raw, 'actual': actual_raw})
+
+    return result
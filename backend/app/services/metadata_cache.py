@@ -0,0 +1,56 @@
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class VersionedCache:
+    """Read-through cache for rarely changing rows, shared by all threads of a worker.
+
+    Entries expire after ``ttl_seconds``. Every ``check_seconds`` the cache
+    also reads a version number through ``read_version``; writers in any
+    worker bump that version in the same transaction as their change, so a
+    mismatch drops every entry and other workers never serve stale data for
+    longer than the check interval.
+    """
+
+    def __init__(self, read_version: Callable[[], int], *, ttl_seconds: float, check_seconds: float) -> None:
+        self._read_version = read_version
+        self._ttl_seconds = ttl_seconds
+        self._check_seconds = check_seconds
+        self._entries: dict[Hashable, tuple[object, float]] = {}
+        self._version: int | None = None
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def _sync_version(self, now: float) -> None:
+        if now - self._checked_at < self._check_seconds:
+            return
+        version = self._read_version()
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            self._checked_at = now
+
+    def get(self, key: Hashable, loader: Callable[[], T]) -> T:
+        if self._ttl_seconds <= 0:
+            return loader()
+        now = time.monotonic()
+        self._sync_version(now)
+        entry = self._entries.get(key)
+        if entry is not None and now - entry[1] < self._ttl_seconds:
+            return entry[0]  # type: ignore[return-value]
+        value = loader()
+        # Misses are not cached, so a row created elsewhere shows up at once.
+        if value is not None:
+            with self._lock:
+                self._entries[key] = (value, now)
+        return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._checked_at = float("-inf")
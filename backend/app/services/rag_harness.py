@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import zipfile
+from dataclasses import asdict, dataclass
+from pathlib import Path, PurePosixPath
+
+from app.core.config import Settings
+
+RETRIEVER_MODULE_NAMES = ('retriever.py', 'retrieval.py', 'rag.py')
+_CACHE_DIRNAME = '.rag-eval-cache'
+
+_MEMORY_LIMIT_BYTES = 2 * 1024 * 1024 * 1024
+_FILE_SIZE_LIMIT_BYTES = 64 * 1024 * 1024
+
+# Executed in a child interpreter that only talks to the parent via
+# stdin/stdout. It applies its resource limits before importing candidate
+# code and only ever sees question ids and text: gold answers stay in the
+# parent, which does all scoring.
+_RUNNER = r'''
+import concurrent.futures
+import importlib.util
+import json
+import sys
+import time
+
+spec = json.load(sys.stdin)
+try:
+    import resource
+except ImportError:
+    resource = None
+if resource is not None:
+    for limit_name, value in spec["limits"].items():
+        resource.setrlimit(getattr(resource, limit_name), (value, value))
+del spec["limits"]
+sys.path.insert(0, spec["root"])
+module_spec = importlib.util.spec_from_file_location("candidate_retriever", spec["entry"])
+module = importlib.util.module_from_spec(module_spec)
+module_spec.loader.exec_module(module)
+retrieve = getattr(module, "retrieve", None)
+retrieve_batch = getattr(module, "retrieve_batch", None)
+if retrieve is None and retrieve_batch is None:
+    raise SystemExit("entry point must define retrieve(query, k) or retrieve_batch(queries, k)")
+
+def _ids(items):
+    out = []
+    for item in list(items or [])[: spec["k"]]:
+        if isinstance(item, dict):
+            item = item.get("id", item.get("text", ""))
+        elif isinstance(item, (tuple, list)) and item:
+            item = item[0]
+        out.append(str(item))
+    return out
+
+def _run(batch):
+    started = time.perf_counter()
+    if retrieve_batch is not None:
+        ranked = [_ids(items) for items in retrieve_batch([q["question"] for q in batch], spec["k"])]
+        per_query = (time.perf_counter() - started) / max(1, len(batch))
+        return [(q["id"], items, per_query) for q, items in zip(batch, ranked)]
+    rows = []
+    for q in batch:
+        query_started = time.perf_counter()
+        items = _ids(retrieve(q["question"], spec["k"]))
+        rows.append((q["id"], items, time.perf_counter() - query_started))
+    return rows
+
+questions = spec["questions"]
+size = spec["batch_size"]
+batches = [questions[i : i + size] for i in range(0, len(questions), size)]
+rows = []
+with concurrent.futures.ThreadPoolExecutor(max_workers=spec["concurrency"]) as pool:
+    for batch_rows in pool.map(_run, batches):
+        rows.extend(batch_rows)
+json.dump({"rows": rows}, sys.stdout)
+'''
+
+
+@dataclass
+class RetrievalMetrics:
+    questions: int
+    k: int
+    recall_at_k: float
+    mrr: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+    entry_point: str
+    error: str | None = None
+
+
+def _find_entry_point(names: list[str]) -> str | None:
+    matches = [
+        name
+        for name in names
+        if not name.startswith('__MACOSX/') and PurePosixPath(name).name.lower() in RETRIEVER_MODULE_NAMES
+    ]
+    if not matches:
+        return None
+    return min(matches, key=lambda name: (name.count('/'), RETRIEVER_MODULE_NAMES.index(PurePosixPath(name).name.lower())))
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+
+def _load_question_set(settings: Settings) -> tuple[list[dict[str, object]], str] | None:
+    path = Path(settings.rag_eval_questions_path)
+    if not path.is_file():
+        return None
+    raw = path.read_bytes()
+    questions = [
+        {
+            'id': str(item.get('id', index)),
+            'question': str(item['question']),
+            'gold': [str(gold) for gold in item.get('gold', [])],
+        }
+        for index, item in enumerate(json.loads(raw))
+        if isinstance(item, dict) and item.get('question')
+    ]
+    return questions, hashlib.sha256(raw).hexdigest()
+
+
+def _score(
+    questions: list[dict[str, object]],
+    rows: list[list[object]],
+    *,
+    k: int,
+    entry_point: str,
+) -> RetrievalMetrics:
+    gold_by_id = {str(q['id']): set(q['gold']) for q in questions}
+    recalls: list[float] = []
+    reciprocal_ranks: list[float] = []
+    latencies: list[float] = []
+    for question_id, ranked, latency in rows:
+        gold = gold_by_id.get(str(question_id), set())
+        ranked = [str(item) for item in ranked][:k]
+        latencies.append(float(latency) * 1000)
+        if not gold:
+            continue
+        recalls.append(len(gold.intersection(ranked)) / len(gold))
+        rank = next((position for position, item in enumerate(ranked, start=1) if item in gold), None)
+        reciprocal_ranks.append(1 / rank if rank else 0.0)
+    return RetrievalMetrics(
+        questions=len(rows),
+        k=k,
+        recall_at_k=sum(recalls) / len(recalls) if recalls else 0.0,
+        mrr=sum(reciprocal_ranks) / len(reciprocal_ranks) if reciprocal_ranks else 0.0,
+        latency_p50_ms=_percentile(latencies, 50),
+        latency_p95_ms=_percentile(latencies, 95),
+        latency_p99_ms=_percentile(latencies, 99),
+        entry_point=entry_point,
+    )
+
+
+def _make_read_only(root: Path) -> None:
+    for path in sorted(root.rglob('*'), reverse=True):
+        path.chmod(0o555 if path.is_dir() else 0o444)
+    root.chmod(0o555)
+
+
+def _run_retriever(
+    settings: Settings, root: Path, entry: Path, scratch: Path, questions: list[dict[str, object]]
+) -> list[list[object]]:
+    """Run the candidate retriever in a child interpreter and return its ranked rows.
+
+    This is process separation, not a sandbox: unless ``RAG_EVAL_COMMAND_PREFIX``
+    wraps the child in real isolation (a dedicated user, ``bwrap``, ``nsjail``,
+    a network namespace), candidate code runs with the API's uid, can read
+    anything that uid can (including the SQLite database and ``.env``) and
+    has network access. What the harness itself enforces: an isolated
+    interpreter (``-I``) with a stripped environment in its own session, a
+    read-only copy of the archive as working directory, and memory, CPU-time
+    and file-size limits set by the runner before candidate code is imported.
+    """
+    spec = {
+        'root': str(root),
+        'entry': str(entry),
+        'questions': [{'id': q['id'], 'question': q['question']} for q in questions],
+        'k': settings.rag_eval_top_k,
+        'batch_size': settings.rag_eval_batch_size,
+        'concurrency': settings.rag_eval_concurrency,
+        'limits': {
+            'RLIMIT_AS': _MEMORY_LIMIT_BYTES,
+            'RLIMIT_CPU': max(1, settings.rag_eval_timeout_seconds),
+            'RLIMIT_FSIZE': _FILE_SIZE_LIMIT_BYTES,
+        },
+    }
+    env = {
+        'PATH': os.environ.get('PATH', ''),
+        'HOME': str(scratch),
+        'TMPDIR': str(scratch),
+        'PYTHONDONTWRITEBYTECODE': '1',
+    }
+    result = subprocess.run(
+        [*settings.rag_eval_command_prefix, sys.executable, '-I', '-c', _RUNNER],
+        input=json.dumps(spec),
+        capture_output=True,
+        text=True,
+        cwd=root,
+        env=env,
+        timeout=settings.rag_eval_timeout_seconds,
+        start_new_session=True,
+    )
+    if result.returncode != 0:
+        message = (result.stderr or result.stdout).strip().splitlines()
+        raise RuntimeError(message[-1] if message else f'exit code {result.returncode}')
+    return json.loads(result.stdout)['rows']
+
+
+def evaluate_retrieval(settings: Settings, submission: Path) -> RetrievalMetrics | None:
+    """Run the candidate's retriever against the local gold question set.
+
+    Returns ``None`` when there is no question set configured or the archive
+    has no retriever entry point. Metrics are cached per (submission, question
+    set) hash so re-scoring the same archive skips the subprocess entirely.
+    """
+    loaded = _load_question_set(settings)
+    if loaded is None:
+        return None
+    questions, question_set_hash = loaded
+
+    digest = hashlib.sha256()
+    with submission.open('rb') as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b''):
+            digest.update(chunk)
+    cache_key = f'{digest.hexdigest()}-{question_set_hash[:16]}-k{settings.rag_eval_top_k}'
+    cache_path = Path(settings.local_submissions_dir) / _CACHE_DIRNAME / f'{cache_key}.json'
+    if cache_path.is_file():
+        try:
+            return RetrievalMetrics(**json.loads(cache_path.read_text()))
+        except (TypeError, ValueError):
+            pass
+
+    with zipfile.ZipFile(submission, 'r') as zipf:
+        entry_name = _find_entry_point(zipf.namelist())
+        if entry_name is None:
+            return None
+        with tempfile.TemporaryDirectory(prefix='rag-eval-') as tmp:
+            root = Path(tmp) / 'submission'
+            scratch = Path(tmp) / 'scratch'
+            scratch.mkdir()
+            zipf.extractall(root)
+            _make_read_only(root)
+            entry = root / entry_name
+            try:
+                rows = _run_retriever(settings, entry.parent, entry, scratch, questions)
+                metrics = _score(questions, rows, k=settings.rag_eval_top_k, entry_point=entry_name)
+            except (OSError, RuntimeError, ValueError, KeyError, subprocess.TimeoutExpired) as exc:
+                metrics = RetrievalMetrics(
+                    questions=0,
+                    k=settings.rag_eval_top_k,
+                    recall_at_k=0.0,
+                    mrr=0.0,
+                    latency_p50_ms=0.0,
+                    latency_p95_ms=0.0,
+                    latency_p99_ms=0.0,
+                    entry_point=entry_name,
+                    error=str(exc) or exc.__class__.__name__,
+                )
+
+    if metrics.error is None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(asdict(metrics)))
+    return metrics
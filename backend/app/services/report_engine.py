@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 import zipfile
 
@@ -8,8 +11,12 @@ from app.services.assessment_store import (
     CandidateRecord,
     get_assessment,
     get_latest_reflection_key_for_candidate,
+    get_report_by_candidate,
+    reset_report_stages,
     upsert_report,
 )
+from app.services.code_metrics import analyze_archive
+from app.services.evaluators import EvaluationContext, detect_assessment_type, get_evaluator
 from app.services.screen_time_analyzer import analyze_screen_time
 
 
@@ -24,6 +31,10 @@ def _safe_relative(path: Path, base: Path) -> str | None:
         return None
 
 
+def _iso_now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
 def _find_latest_submission(settings: Settings, assessment_id: int) -> Path | None:
     root = Path(settings.local_submissions_dir)
     if not root.exists():
@@ -81,307 +92,414 @@ def _find_latest_reflection_recording(
     return matches[0]
 
 
-def _detect_assessment_type(assessment_type: str | None) -> str:
-    if not assessment_type:
-        return 'default'
-    normalized = assessment_type.strip().lower()
-    if normalized in {'default', 'assessment3-rag', 'assessment4-ner', 'json-comparison', 'java-maven'}:
-        return normalized
-    return 'default'
+STAGES = ('archive', 'tests', 'diff', 'recording', 'reflection')
+_ARCHIVE_STAGES = ('archive', 'tests', 'diff')
+_STAGE_ATTEMPTS = 2
 
+_SOURCE_SUFFIXES = ('.py', '.js', '.ts', '.java', '.ipynb')
+_CODE_SUFFIXES = ('.py', '.js', '.ts', '.java', '.ipynb', '.json')
 
-def _evaluate_submission(
-    *,
-    submission: Path | None,
-    notebook: Path | None,
-    assessment_type: str,
-) -> tuple[int, int, list[dict[str, object]], list[str], list[dict[str, object]]]:
-    if submission is None:
-        return (
-            0,
-            0,
-            [
-                {
-                    'name': 'Submission ZIP received',
-                    'status': 'fail',
-                    'expected': 'Upload a valid .zip project archive',
-                    'output': 'No submission archive found',
-                }
-            ],
-            ['No submission archive found.'],
-            [],
-        )
 
-    archive_checks: list[dict[str, object]] = []
-    summary: list[str] = []
-    diffs: list[dict[str, object]] = []
-    score = 40
-    code_quality = 50
-
-    try:
-        with zipfile.ZipFile(submission, 'r') as zipf:
-            names = zipf.namelist()
-            file_count = len([n for n in names if not n.endswith('/')])
-            has_readme = any(Path(n).name.lower().startswith('readme') for n in names)
-            has_source = any(n.endswith(('.py', '.js', '.ts', '.java', '.ipynb')) for n in names)
-            has_json = any(n.endswith('.json') for n in names)
-            has_java = any(n.endswith('.java') for n in names)
-            has_pom = any(Path(n).name.lower() == 'pom.xml' for n in names)
-            has_ipynb = any(n.endswith('.ipynb') for n in names) or notebook is not None
-            has_rag_marker = any('rag' in n.lower() for n in names)
-            has_ner_marker = any('ner' in n.lower() for n in names)
-            has_users_api_marker = any('users-service' in n.lower() or 'server.js' in n.lower() for n in names)
-            has_retrieval_marker = any('retriev' in n.lower() or 'vector' in n.lower() for n in names)
-            has_llama_marker = any('llama' in n.lower() or 'document' in n.lower() for n in names)
-            code_files = [n for n in names if n.endswith(('.py', '.js', '.ts', '.java', '.ipynb', '.json'))]
-
-        for entry in code_files[:8]:
-            diffs.append(
-                {
-                    'path': entry,
-                    'status': 'modified',
-                    'modified': f'Submission artifact includes {entry}',
-                }
-            )
-
-        archive_checks.append(
+def _missing_submission_stage() -> dict[str, object]:
+    return {
+        'score': 0,
+        'code_quality': 0,
+        'checks': [
             {
                 'name': 'Submission ZIP received',
-                'status': 'pass',
+                'status': 'fail',
                 'expected': 'Upload a valid .zip project archive',
-                'output': f'Found {submission.name}',
-            }
-        )
-        archive_checks.append(
-            {
-                'name': 'Archive contains source files',
-                'status': 'pass' if has_source else 'partial',
-                'expected': 'Archive should include implementation files',
-                'output': f'{file_count} files scanned',
-            }
-        )
-        archive_checks.append(
-            {
-                'name': 'Documentation presence',
-                'status': 'pass' if has_readme else 'partial',
-                'expected': 'README or instructions included',
-                'output': 'README found' if has_readme else 'README not found',
+                'output': 'No submission archive found',
             }
-        )
+        ],
+        'summary': ['No submission archive found.'],
+    }
 
-        score = min(100, 55 + min(file_count, 45))
-        if not has_source:
-            score = max(20, score - 25)
-        if not has_readme:
-            score = max(20, score - 10)
 
-        if assessment_type == 'assessment3-rag':
-            code_quality = 84 if has_rag_marker and has_retrieval_marker else 70
-            archive_checks.append(
-                {
-                    'name': 'RAG pipeline artifacts',
-                    'status': 'pass' if has_rag_marker else 'partial',
-                    'expected': 'Include retrieval/indexing or RAG-related implementation files',
-                    'output': 'RAG-specific files found' if has_rag_marker else 'No explicit RAG markers found',
-                }
-            )
-            archive_checks.append(
-                {
-                    'name': 'Retrieval/index markers',
-                    'status': 'pass' if has_retrieval_marker else 'partial',
-                    'expected': 'Include retrieval/index/vector database logic',
-                    'output': 'Retrieval markers found' if has_retrieval_marker else 'No retrieval markers found',
-                }
-            )
-            summary.append('Assessment3 (RAG) evaluation path executed.')
-        elif assessment_type == 'assessment4-ner':
-            code_quality = 82 if has_ipynb else 62
-            archive_checks.append(
-                {
-                    'name': 'NER notebook artifact',
-                    'status': 'pass' if has_ipynb else 'partial',
-                    'expected': 'Include notebook/script for NER training/evaluation',
-                    'output': 'Notebook found' if has_ipynb else 'Notebook not found',
-                }
-            )
-            archive_checks.append(
-                {
-                    'name': 'NER model indicators',
-                    'status': 'pass' if has_ner_marker else 'partial',
-                    'expected': 'Include NER-related code/config artifacts',
-                    'output': 'NER markers found' if has_ner_marker else 'No explicit NER markers found',
-                }
-            )
-            if notebook is not None:
-                archive_checks.append(
-                    {
-                        'name': 'Separate notebook upload',
-                        'status': 'pass',
-                        'expected': 'Assessment4 notebook uploaded as companion artifact',
-                        'output': f'Found {notebook.name}',
-                    }
-                )
-            summary.append('Assessment4 (NER) evaluation path executed.')
-        elif assessment_type == 'java-maven':
-            code_quality = 80 if has_java and has_pom else 60
-            archive_checks.append(
-                {
-                    'name': 'Maven project structure',
-                    'status': 'pass' if has_pom else 'fail',
-                    'expected': 'Include pom.xml for java-maven assessment',
-                    'output': 'pom.xml found' if has_pom else 'pom.xml not found',
-                }
-            )
-            archive_checks.append(
-                {
-                    'name': 'Java source presence',
-                    'status': 'pass' if has_java else 'partial',
-                    'expected': 'Include Java implementation files',
-                    'output': 'Java files found' if has_java else 'No Java files found',
-                }
-            )
-            summary.append('Java Maven evaluation path executed.')
-        elif assessment_type == 'json-comparison':
-            code_quality = 82 if has_json and has_llama_marker else 60
-            archive_checks.append(
-                {
-                    'name': 'JSON output artifacts',
-                    'status': 'pass' if has_json else 'partial',
-                    'expected': 'Include structured JSON outputs/parsers',
-                    'output': 'JSON artifacts found' if has_json else 'No JSON artifacts found',
-                }
-            )
-            archive_checks.append(
-                {
-                    'name': 'Document processing markers',
-                    'status': 'pass' if has_llama_marker else 'partial',
-                    'expected': 'Include document parsing/extraction pipeline artifacts',
-                    'output': 'Document-processing markers found' if has_llama_marker else 'No extraction markers found',
-                }
-            )
-            summary.append('JSON-comparison evaluation path executed.')
-        else:
-            code_quality = 80 if has_users_api_marker else 58
-            archive_checks.append(
+def _stage_archive(settings: Settings, *, submission: Path | None, **_: object) -> dict[str, object]:
+    if submission is None:
+        return _missing_submission_stage()
+
+    try:
+        with zipfile.ZipFile(submission, 'r') as zipf:
+            names = zipf.namelist()
+            code_metrics = analyze_archive(zipf, names)
+    except (zipfile.BadZipFile, OSError) as exc:
+        return {
+            'score': 0,
+            'code_quality': 0,
+            'archive_error': True,
+            'checks': [
                 {
-                    'name': 'Users API structure',
-                    'status': 'pass' if has_users_api_marker else 'partial',
-                    'expected': 'Include users-service/server implementation artifacts',
-                    'output': 'Users API markers found' if has_users_api_marker else 'Users API markers missing',
+                    'name': 'Archive integrity',
+                    'status': 'fail',
+                    'expected': 'ZIP should be readable',
+                    'output': f'Failed to parse archive: {exc}',
                 }
-            )
-            summary.append('Default evaluation path executed.')
-
-        summary.append(f'Submission archive {submission.name} analyzed with {file_count} files.')
-        summary.append(f'Evaluation path selected by assessment type: {assessment_type}.')
-    except Exception as exc:
-        archive_checks.append(
+            ],
+            'summary': ['Submission archive could not be parsed.'],
+        }
+
+    file_count = len([n for n in names if not n.endswith('/')])
+    has_readme = any(Path(n).name.lower().startswith('readme') for n in names)
+    has_source = any(n.endswith(_SOURCE_SUFFIXES) for n in names)
+    checks: list[dict[str, object]] = [
+        {
+            'name': 'Submission ZIP received',
+            'status': 'pass',
+            'expected': 'Upload a valid .zip project archive',
+            'output': f'Found {submission.name}',
+        },
+        {
+            'name': 'Archive contains source files',
+            'status': 'pass' if has_source else 'partial',
+            'expected': 'Archive should include implementation files',
+            'output': f'{file_count} files scanned',
+        },
+        {
+            'name': 'Documentation presence',
+            'status': 'pass' if has_readme else 'partial',
+            'expected': 'README or instructions included',
+            'output': 'README found' if has_readme else 'README not found',
+        },
+    ]
+    summary = [f'Submission archive {submission.name} analyzed with {file_count} files.']
+
+    score = min(100, 55 + min(file_count, 45))
+    if not has_source:
+        score = max(20, score - 25)
+    if not has_readme:
+        score = max(20, score - 10)
+
+    metrics_quality = None
+    if code_metrics.files:
+        metrics_quality = code_metrics.quality_score
+        checks.append(
             {
-                'name': 'Archive integrity',
-                'status': 'fail',
-                'expected': 'ZIP should be readable',
-                'output': f'Failed to parse archive: {exc}',
+                'name': 'Static code metrics',
+                'status': 'pass' if code_metrics.quality_score >= 70 else 'partial',
+                'expected': 'Readable functions with low complexity and little duplication',
+                'output': (
+                    f'{code_metrics.functions} functions in {code_metrics.files} files, '
+                    f'avg complexity {code_metrics.avg_complexity:.1f} (max {code_metrics.max_complexity}), '
+                    f'{code_metrics.long_functions} long functions, '
+                    f'{code_metrics.duplication_ratio:.0%} duplicated blocks'
+                ),
             }
         )
-        summary.append('Submission archive could not be parsed.')
-        score = 0
-        code_quality = 0
-
-    return score, code_quality, archive_checks, summary, diffs
-
-
-def run_scoring_and_store_report(settings: Settings, candidate: CandidateRecord) -> None:
-    assessment = get_assessment(settings, candidate.assessment_id)
-    if assessment is None:
-        return
+        summary.append(
+            f'Static analysis scored {code_metrics.quality_score}/100 across {code_metrics.files} source files '
+            f'(avg function length {code_metrics.avg_function_length:.0f} lines).'
+        )
+    return {'score': score, 'metrics_quality': metrics_quality, 'checks': checks, 'summary': summary}
 
-    assessment_type = _detect_assessment_type(getattr(assessment, 'assessment_type', 'default'))
-    submission = _find_latest_submission(settings, candidate.assessment_id)
-    notebook = _find_latest_notebook(settings, candidate.assessment_id)
-    recording = _find_latest_assessment_recording(settings, candidate.assessment_id)
-    reflection = _find_latest_reflection_recording(settings, candidate.assessment_id, candidate.email)
 
-    try:
-        base_score, code_quality, checks, summary, diffs = _evaluate_submission(
-            submission=submission,
-            notebook=notebook,
-            assessment_type=assessment_type,
+def _stage_tests(
+    settings: Settings,
+    *,
+    submission: Path | None,
+    notebook: Path | None,
+    assessment_type: str,
+    question_id: int | None,
+    **_: object,
+) -> dict[str, object]:
+    # Not a finer-grained checkpoint than "the evaluation ran": this stage is
+    # the whole type-specific evaluator call (including any harness run such
+    # as the RAG retriever), so a failure or stale input repeats all of it.
+    if submission is None:
+        return {}
+    with zipfile.ZipFile(submission, 'r') as zipf:
+        evaluation = get_evaluator(assessment_type).evaluate(
+            EvaluationContext(
+                settings=settings,
+                submission=submission,
+                notebook=notebook,
+                zipf=zipf,
+                names=zipf.namelist(),
+                question_id=question_id,
+            )
         )
+    return {
+        'code_quality': evaluation.code_quality,
+        'checks': evaluation.checks,
+        'summary': [*evaluation.summary, f'Evaluation path selected by assessment type: {assessment_type}.'],
+        'diffs': evaluation.diffs,
+    }
 
-        app_usage = []
-        total_duration = 0
-        if recording is not None:
-            app_usage, total_duration = analyze_screen_time(recording)
 
-        checks.append(
+def _stage_diff(settings: Settings, *, submission: Path | None, **_: object) -> dict[str, object]:
+    if submission is None:
+        return {}
+    with zipfile.ZipFile(submission, 'r') as zipf:
+        code_files = [n for n in zipf.namelist() if n.endswith(_CODE_SUFFIXES)]
+    return {
+        'diffs': [
+            {
+                'path': entry,
+                'status': 'modified',
+                'modified': f'Submission artifact includes {entry}',
+            }
+            for entry in code_files[:8]
+        ]
+    }
+
+
+def _stage_recording(settings: Settings, *, recording: Path | None, **_: object) -> dict[str, object]:
+    app_usage: list[dict[str, object]] = []
+    total_duration = 0
+    if recording is not None:
+        app_usage, total_duration = analyze_screen_time(recording)
+    summary = []
+    if recording and total_duration > 0:
+        summary.append(f'Screen-time analyzer processed recording: {total_duration}s total duration.')
+    return {
+        'app_usage': app_usage,
+        'total_duration': total_duration,
+        'bonus': 5 if recording else 0,
+        'checks': [
             {
                 'name': 'Workflow recording',
                 'status': 'pass' if recording else 'partial',
                 'expected': 'Upload full-screen workflow recording',
                 'output': recording.name if recording else 'No workflow recording found',
             }
-        )
-        checks.append(
+        ],
+        'summary': summary,
+    }
+
+
+def _stage_reflection(settings: Settings, *, reflection: Path | None, **_: object) -> dict[str, object]:
+    return {
+        'bonus': 5 if reflection else 0,
+        'checks': [
             {
                 'name': 'Reflection recording',
                 'status': 'pass' if reflection else 'partial',
                 'expected': 'Upload reflection response recording',
                 'output': reflection.name if reflection else 'No reflection recording found',
             }
-        )
+        ],
+    }
+
+
+_STAGE_RUNNERS = {
+    'archive': _stage_archive,
+    'tests': _stage_tests,
+    'diff': _stage_diff,
+    'recording': _stage_recording,
+    'reflection': _stage_reflection,
+}
 
-        if recording and total_duration > 0:
-            summary.append(f'Screen-time analyzer processed recording: {total_duration}s total duration.')
-        if notebook is not None and assessment_type == 'assessment4-ner':
-            summary.append(f'Assessment4 companion notebook detected: {notebook.name}.')
 
-        final_score = base_score
-        if recording:
-            final_score = min(100, final_score + 5)
-        if reflection:
-            final_score = min(100, final_score + 5)
+def _fingerprint(path: Path | None) -> str | None:
+    if path is None:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return str(path)
+    return f'{path}:{stat.st_size}:{stat.st_mtime_ns}'
+
+
+def _reference_files(paths: list[Path]) -> tuple[tuple[str, int, int], ...]:
+    files: list[tuple[str, int, int]] = []
+    for path in paths:
+        members = sorted(p for p in path.rglob('*') if p.is_file()) if path.is_dir() else [path]
+        for member in members:
+            try:
+                stat = member.stat()
+            except OSError:
+                files.append((str(member), -1, 0))
+                continue
+            files.append((str(member), stat.st_size, stat.st_mtime_ns))
+    return tuple(files)
+
+
+@lru_cache(maxsize=64)
+def _hash_reference_files(files: tuple[tuple[str, int, int], ...]) -> str:
+    # Keyed by (path, size, mtime) so unchanged reference data is hashed once.
+    digest = hashlib.sha256()
+    for name, size, _mtime in files:
+        digest.update(name.encode())
+        if size >= 0:
+            digest.update(Path(name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _reference_fingerprint(paths: list[Path]) -> str:
+    """Content hash of the server-side reference data an evaluation was scored against."""
+    try:
+        return _hash_reference_files(_reference_files(paths))
+    except OSError:
+        return 'unreadable'
+
+
+def _assemble(stages: dict[str, dict[str, object]]) -> dict[str, object]:
+    checks: list[dict[str, object]] = []
+    summary: list[str] = []
+    diffs: list[dict[str, object]] = []
+    failed = []
+    for name in STAGES:
+        stage = stages.get(name)
+        if stage is None:
+            continue
+        if stage.get('status') == 'failed':
+            failed.append(name)
+            checks.append(
+                {
+                    'name': f'Report stage: {name}',
+                    'status': 'fail',
+                    'expected': f'Complete the {name} stage',
+                    'output': f"Failed with error: {stage.get('error')}",
+                }
+            )
+            continue
+        output = stage.get('output') or {}
+        checks.extend(output.get('checks', []))
+        summary.extend(output.get('summary', []))
+        diffs.extend(output.get('diffs', []))
+
+    def _output(name: str) -> dict[str, object]:
+        stage = stages.get(name) or {}
+        return (stage.get('output') or {}) if stage.get('status') == 'done' else {}
+
+    archive = _output('archive')
+    tests = _output('tests')
+    recording = _output('recording')
+    reflection = _output('reflection')
+
+    score = archive.get('score')
+    # Missing or unreadable archives pin code quality to 0; otherwise blend
+    # the type-specific evaluation with the static metrics.
+    code_quality = archive.get('code_quality')
+    if code_quality is None:
+        code_quality = tests.get('code_quality')
+        if code_quality is not None and archive.get('metrics_quality') is not None:
+            code_quality = round((int(code_quality) + int(archive['metrics_quality'])) / 2)
+    if score is not None:
+        score = min(100, int(score) + int(recording.get('bonus', 0)) + int(reflection.get('bonus', 0)))
+
+    return {
+        'score': score,
+        'code_quality': code_quality,
+        'checks': checks,
+        'summary': summary,
+        'diffs': diffs,
+        'app_usage': recording.get('app_usage', []),
+        'total_duration': recording.get('total_duration') if recording else None,
+        'failed': failed,
+    }
+
+
+def run_scoring_and_store_report(settings: Settings, candidate: CandidateRecord, *, force: bool = False) -> None:
+    """Run the report pipeline stage by stage, checkpointing into the ``reports`` row.
+
+    Every finished stage is written immediately so ``/report/{id}`` can show
+    partial results. Stages whose inputs are unchanged since a previous
+    successful run are reused, so a re-run only repeats failed or stale work.
+    ``force`` discards the stored stages and recomputes every one of them.
+    """
+    assessment = get_assessment(settings, candidate.assessment_id)
+    if assessment is None:
+        return
+
+    assessment_type = detect_assessment_type(getattr(assessment, 'assessment_type', 'default'))
+    evaluator = get_evaluator(assessment_type)
+    artifacts = evaluator.artifacts
+    submission = _find_latest_submission(settings, candidate.assessment_id)
+    notebook = _find_latest_notebook(settings, candidate.assessment_id) if 'notebook' in artifacts else None
+    recording = _find_latest_assessment_recording(settings, candidate.assessment_id)
+    reflection = _find_latest_reflection_recording(settings, candidate.assessment_id, candidate.email)
 
+    inputs = {
+        'archive': _fingerprint(submission),
+        'tests': '|'.join(
+            [
+                assessment_type,
+                evaluator.version,
+                str(assessment.question_id),
+                _reference_fingerprint(evaluator.reference_paths(settings, assessment.question_id)),
+                str(_fingerprint(submission)),
+                str(_fingerprint(notebook)),
+            ]
+        ),
+        'diff': _fingerprint(submission),
+        'recording': _fingerprint(recording),
+        'reflection': _fingerprint(reflection),
+    }
+    stage_kwargs = {
+        'submission': submission,
+        'notebook': notebook,
+        'recording': recording,
+        'reflection': reflection,
+        'assessment_type': assessment_type,
+        'question_id': assessment.question_id,
+    }
+    submission_file = _safe_relative(submission, Path(settings.local_submissions_dir)) if submission else None
+    assessment_recording_key = _safe_relative(recording, Path(settings.local_recordings_dir)) if recording else None
+    reflection_recording_key = _safe_relative(reflection, Path(settings.local_recordings_dir)) if reflection else None
+
+    if force:
+        reset_report_stages(settings, candidate.id)
+    previous = get_report_by_candidate(settings, candidate.id)
+    stages: dict[str, dict[str, object]] = {}
+    if previous is not None:
+        stages = {
+            name: stage
+            for name, stage in previous.stages.items()
+            if stage.get('status') == 'done' and stage.get('inputs') == inputs.get(name)
+        }
+
+    def _checkpoint(report_ready: bool) -> None:
+        assembled = _assemble(stages)
+        score = assembled['score']
+        code_quality = assembled['code_quality']
+        error = None
+        if report_ready and assembled['failed']:
+            error = f"Report stages failed: {', '.join(assembled['failed'])}"
+            if 'archive' in assembled['failed']:
+                # Without the archive stage there is no score to report: persist
+                # the report as failed (0/0 with the error) rather than unscored.
+                score = 0
+                code_quality = 0
         upsert_report(
             settings,
             candidate_id=candidate.id,
             assessment_id=candidate.assessment_id,
-            score=final_score,
+            score=score,
             code_quality=code_quality,
-            results=checks,
-            diffs=diffs,
-            code_summary_bullets=summary,
-            report_ready=True,
-            error=None,
-            assessment_type=assessment_type,
-            app_usage=app_usage,
-            total_duration=total_duration,
-            submission_file=_safe_relative(submission, Path(settings.local_submissions_dir)) if submission else None,
-            assessment_recording_key=_safe_relative(recording, Path(settings.local_recordings_dir)) if recording else None,
-            reflection_recording_key=_safe_relative(reflection, Path(settings.local_recordings_dir)) if reflection else None,
-        )
-    except Exception as exc:
-        upsert_report(
-            settings,
-            candidate_id=candidate.id,
-            assessment_id=candidate.assessment_id,
-            score=0,
-            code_quality=0,
-            results=[
-                {
-                    'name': 'Report generation',
-                    'status': 'fail',
-                    'expected': 'Evaluate submission and produce report payload',
-                    'output': f'Failed with error: {exc}',
-                }
-            ],
-            diffs=[],
-            code_summary_bullets=['Report generation failed. Please inspect backend logs.'],
-            report_ready=True,
-            error=str(exc),
+            results=assembled['checks'],
+            diffs=assembled['diffs'],
+            code_summary_bullets=assembled['summary'] or ['Submission received. Report generation is in progress.'],
+            report_ready=report_ready,
+            error=error,
             assessment_type=assessment_type,
-            app_usage=[],
-            total_duration=None,
-            submission_file=_safe_relative(submission, Path(settings.local_submissions_dir)) if submission else None,
-            assessment_recording_key=_safe_relative(recording, Path(settings.local_recordings_dir)) if recording else None,
-            reflection_recording_key=_safe_relative(reflection, Path(settings.local_recordings_dir)) if reflection else None,
+            app_usage=assembled['app_usage'],
+            total_duration=assembled['total_duration'],
+            submission_file=submission_file,
+            assessment_recording_key=assessment_recording_key,
+            reflection_recording_key=reflection_recording_key,
+            stages=stages,
         )
+
+    for name in STAGES:
+        if name in stages:
+            continue
+        archive = stages.get('archive', {}).get('output') or {}
+        if name in _ARCHIVE_STAGES[1:] and archive.get('archive_error'):
+            stages[name] = {'status': 'done', 'inputs': inputs[name], 'output': {}, 'updated_at': _iso_now()}
+            continue
+        error = None
+        for _attempt in range(_STAGE_ATTEMPTS):
+            try:
+                output = _STAGE_RUNNERS[name](settings, **stage_kwargs)
+            except Exception as exc:  # noqa: BLE001 - a failing stage must not lose the others
+                error = str(exc) or exc.__class__.__name__
+                continue
+            stages[name] = {'status': 'done', 'inputs': inputs[name], 'output': output, 'updated_at': _iso_now()}
+            break
+        else:
+            stages[name] = {'status': 'failed', 'inputs': inputs[name], 'error': error, 'updated_at': _iso_now()}
+        _checkpoint(report_ready=False)
+
+    _checkpoint(report_ready=True)
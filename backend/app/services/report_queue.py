@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+from app.core.config import Settings
+from app.services.assessment_store import CandidateRecord
+from app.services.report_engine import run_scoring_and_store_report
+
+logger = logging.getLogger(__name__)
+
+_WAIT_SAMPLES = 200
+_IDLE_STATS_LIMIT = 100
+
+
+class ReportPriority(IntEnum):
+    RERUN = 0
+    SUBMISSION = 1
+    BACKFILL = 2
+
+
+@dataclass
+class ReportJob:
+    candidate: CandidateRecord
+    priority: ReportPriority
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _AssessmentStats:
+    completed: int = 0
+    failed: int = 0
+    running: int = 0
+    waits: deque[float] = field(default_factory=lambda: deque(maxlen=_WAIT_SAMPLES))
+
+
+class ReportScheduler:
+    """Runs report jobs on a small worker pool with priority classes and per-assessment fairness.
+
+    Higher priority classes always drain first. Within a class, assessments
+    are served round-robin, so one assessment's burst of submissions only
+    ever holds one slot in the rotation instead of the whole queue.
+
+    A candidate is never queued twice or run concurrently: a submit while its
+    job is pending is deduplicated (or promoted), and a submit while it is
+    running is coalesced into a single follow-up run queued once the current
+    run finishes. ``RERUN`` jobs discard the stored stage checkpoints, so an
+    admin rerun recomputes the whole report.
+
+    Per-assessment stats are kept for every assessment with queued or running
+    work, plus the ``_IDLE_STATS_LIMIT`` most recently active idle ones.
+    """
+
+    def __init__(self, settings: Settings, *, workers: int) -> None:
+        self._settings = settings
+        self._workers = max(1, workers)
+        self._queues: dict[ReportPriority, OrderedDict[int, deque[ReportJob]]] = {
+            priority: OrderedDict() for priority in ReportPriority
+        }
+        self._queued: dict[int, ReportJob] = {}
+        self._running: set[int] = set()
+        self._followups: dict[int, ReportJob] = {}
+        self._stats: dict[int, _AssessmentStats] = {}
+        self._cond = threading.Condition()
+        self._threads: list[threading.Thread] = []
+
+    def _ensure_workers(self) -> None:
+        if self._threads:
+            return
+        for index in range(self._workers):
+            thread = threading.Thread(target=self._run, name=f'report-worker-{index}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, candidate: CandidateRecord, priority: ReportPriority = ReportPriority.SUBMISSION) -> bool:
+        with self._cond:
+            if candidate.id in self._running:
+                followup = self._followups.get(candidate.id)
+                if followup is not None and priority >= followup.priority:
+                    return False
+                self._followups[candidate.id] = ReportJob(candidate=candidate, priority=priority)
+                return True
+            return self._enqueue(candidate, priority)
+
+    def _enqueue(self, candidate: CandidateRecord, priority: ReportPriority) -> bool:
+        with self._cond:
+            queued = self._queued.get(candidate.id)
+            if queued is not None:
+                if priority >= queued.priority:
+                    return False
+                # Promote: drop the queued job and re-enqueue it in the higher class.
+                self._remove(queued)
+            job = ReportJob(candidate=candidate, priority=priority)
+            self._queues[priority].setdefault(candidate.assessment_id, deque()).append(job)
+            self._queued[candidate.id] = job
+            self._stats.setdefault(candidate.assessment_id, _AssessmentStats())
+            self._ensure_workers()
+            self._cond.notify()
+            return True
+
+    def _remove(self, job: ReportJob) -> None:
+        rotation = self._queues[job.priority]
+        pending = rotation.get(job.candidate.assessment_id)
+        if pending is None:
+            return
+        try:
+            pending.remove(job)
+        except ValueError:
+            return
+        if not pending:
+            rotation.pop(job.candidate.assessment_id, None)
+
+    def _take(self) -> ReportJob | None:
+        for priority in ReportPriority:
+            rotation = self._queues[priority]
+            if not rotation:
+                continue
+            assessment_id, pending = rotation.popitem(last=False)
+            job = pending.popleft()
+            if pending:
+                rotation[assessment_id] = pending
+            self._queued.pop(job.candidate.id, None)
+            self._running.add(job.candidate.id)
+            return job
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                job = self._take()
+                while job is None:
+                    self._cond.wait()
+                    job = self._take()
+                stats = self._stats[job.candidate.assessment_id]
+                stats.waits.append(time.monotonic() - job.enqueued_at)
+                stats.running += 1
+            failed = False
+            try:
+                run_scoring_and_store_report(
+                    self._settings, job.candidate, force=job.priority is ReportPriority.RERUN
+                )
+            except Exception:
+                failed = True
+                logger.exception('Report job failed for candidate %s', job.candidate.id)
+            with self._cond:
+                stats.running -= 1
+                stats.completed += 1
+                stats.failed += 1 if failed else 0
+                self._running.discard(job.candidate.id)
+                followup = self._followups.pop(job.candidate.id, None)
+                if followup is not None:
+                    self._enqueue(followup.candidate, followup.priority)
+                # Re-insert so the dict stays ordered by last activity.
+                self._stats[job.candidate.assessment_id] = self._stats.pop(job.candidate.assessment_id)
+                self._prune_stats()
+
+    def _prune_stats(self) -> None:
+        idle = [
+            assessment_id
+            for assessment_id, stats in self._stats.items()
+            if stats.running == 0 and not any(assessment_id in self._queues[priority] for priority in ReportPriority)
+        ]
+        for assessment_id in idle[: max(0, len(idle) - _IDLE_STATS_LIMIT)]:
+            del self._stats[assessment_id]
+
+    def metrics(self) -> dict[str, object]:
+        now = time.monotonic()
+        with self._cond:
+            per_assessment: dict[int, dict[str, object]] = {}
+            for assessment_id, stats in self._stats.items():
+                depth = {
+                    priority.name.lower(): len(self._queues[priority].get(assessment_id, ()))
+                    for priority in ReportPriority
+                }
+                oldest = min(
+                    (
+                        job.enqueued_at
+                        for priority in ReportPriority
+                        for job in self._queues[priority].get(assessment_id, ())
+                    ),
+                    default=None,
+                )
+                waits = sorted(stats.waits)
+                per_assessment[assessment_id] = {
+                    'assessmentId': assessment_id,
+                    'queued': sum(depth.values()),
+                    'queuedByPriority': depth,
+                    'running': stats.running,
+                    'completed': stats.completed,
+                    'failed': stats.failed,
+                    'oldestWaitSeconds': round(now - oldest, 3) if oldest is not None else 0.0,
+                    'avgWaitSeconds': round(sum(waits) / len(waits), 3) if waits else 0.0,
+                    'p95WaitSeconds': round(waits[max(0, int(len(waits) * 0.95) - 1)], 3) if waits else 0.0,
+                }
+            return {
+                'workers': self._workers,
+                'queued': len(self._queued),
+                'followups': len(self._followups),
+                'assessments': sorted(per_assessment.values(), key=lambda item: -int(item['queued'])),
+            }
+
+
+_scheduler: ReportScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_report_scheduler(settings: Settings) -> ReportScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = ReportScheduler(settings, workers=settings.report_workers)
+        return _scheduler
+
+
+def enqueue_report_job(
+    settings: Settings,
+    candidate: CandidateRecord,
+    priority: ReportPriority = ReportPriority.SUBMISSION,
+) -> bool:
+    return get_report_scheduler(settings).submit(candidate, priority)
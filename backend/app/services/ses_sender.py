@@ -0,0 +1,162 @@
+import logging
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from app.core.config import Settings
+from app.services.aws_clients import ses_client
+
+logger = logging.getLogger(__name__)
+
+_THROTTLE_CODES = {"Throttling", "ThrottlingException", "MaxSendingRateExceeded"}
+_THROTTLE_RETRIES = 4
+_QUOTA_REFRESH_SECONDS = 10 * 60
+_MAX_WORKERS = 50
+
+
+@dataclass(frozen=True)
+class SendResult:
+    message_id: str | None = None
+    error: str | None = None
+    # False when resending could deliver the message twice.
+    retryable: bool = True
+
+
+class TokenBucket:
+    """Blocking token bucket: ``rate`` tokens per second, bursting up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self._lock = threading.Lock()
+        self._rate = rate
+        self._capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self._rate = rate
+            self._capacity = max(1.0, rate)
+            self._tokens = min(self._tokens, self._capacity)
+
+    def drain(self) -> None:
+        """Empty the bucket after the server pushed back, so callers slow down immediately."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0)
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+def _error_code(exc: Exception) -> str | None:
+    response = getattr(exc, "response", None)
+    if isinstance(response, dict):
+        return response.get("Error", {}).get("Code")
+    return None
+
+
+def _worker_count(rate: float) -> int:
+    return max(1, min(_MAX_WORKERS, math.ceil(rate)))
+
+
+class SesBatchSender:
+    """Sends raw SES messages concurrently without exceeding the account's send rate.
+
+    The rate comes from ``SES_MAX_SEND_RATE`` or, when unset, from
+    ``GetSendQuota`` (re-read every few minutes); the worker pool is resized
+    with it, so a quota raise also raises concurrency. Throttled sends drain the
+    bucket and retry with exponential backoff; every message gets its own
+    ``SendResult`` carrying the SES ``MessageId`` or the final error.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self._settings = settings
+        self._rate_checked_at = 0.0
+        rate = self._max_send_rate()
+        self._bucket = TokenBucket(rate)
+        self._pool_lock = threading.Lock()
+        self._workers = _worker_count(rate)
+        self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="ses-sender")
+
+    def _max_send_rate(self) -> float:
+        self._rate_checked_at = time.monotonic()
+        if self._settings.ses_max_send_rate:
+            return float(self._settings.ses_max_send_rate)
+        try:
+            quota = ses_client(self._settings).get_send_quota()
+            return max(1.0, float(quota["MaxSendRate"]))
+        except Exception:
+            logger.warning("Could not read SES send quota; assuming 1 message/second", exc_info=True)
+            return 1.0
+
+    def _refresh_rate(self) -> None:
+        if time.monotonic() - self._rate_checked_at >= _QUOTA_REFRESH_SECONDS:
+            rate = self._max_send_rate()
+            self._bucket.set_rate(rate)
+            self._resize_pool(_worker_count(rate))
+
+    def _resize_pool(self, workers: int) -> None:
+        with self._pool_lock:
+            if workers == self._workers:
+                return
+            previous = self._pool
+            self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ses-sender")
+            self._workers = workers
+        # Sends already queued on the old pool still run; it just takes no new work.
+        previous.shutdown(wait=False)
+
+    def _send(self, source: str, to_email: str, raw_message: bytes) -> SendResult:
+        client = ses_client(self._settings)
+        for attempt in range(_THROTTLE_RETRIES + 1):
+            self._bucket.acquire()
+            try:
+                response = client.send_raw_email(
+                    Source=source,
+                    Destinations=[to_email],
+                    RawMessage={"Data": raw_message},
+                )
+            except Exception as exc:  # noqa: BLE001 - reported per message
+                if _error_code(exc) in _THROTTLE_CODES and attempt < _THROTTLE_RETRIES:
+                    self._bucket.drain()
+                    time.sleep(min(5.0, 0.25 * 2**attempt))
+                    continue
+                return SendResult(error=str(exc) or exc.__class__.__name__)
+            return SendResult(message_id=response.get("MessageId"))
+        return SendResult(error="SES throttling retries exhausted")
+
+    def send(self, source: str, to_email: str, raw_message: bytes) -> SendResult:
+        self._refresh_rate()
+        return self._send(source, to_email, raw_message)
+
+    def send_batch(self, source: str, messages: list[tuple[str, bytes]]) -> list[SendResult]:
+        self._refresh_rate()
+        with self._pool_lock:
+            results = self._pool.map(lambda message: self._send(source, *message), messages)
+        return list(results)
+
+
+_sender: SesBatchSender | None = None
+_sender_lock = threading.Lock()
+
+
+def get_ses_sender(settings: Settings) -> SesBatchSender:
+    global _sender
+    with _sender_lock:
+        if _sender is None:
+            _sender = SesBatchSender(settings)
+        return _sender
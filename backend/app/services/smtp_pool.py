@@ -0,0 +1,193 @@
+import smtplib
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+
+from app.core.config import Settings
+
+_LIVENESS_CHECK_AFTER_SECONDS = 5.0
+_RETRYABLE_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError, TimeoutError)
+
+
+class DeliveryUncertainError(Exception):
+    """The session dropped after DATA, so the server may already have accepted the message."""
+
+
+class _DataTracking:
+    # Once DATA has been issued the server may already have accepted the
+    # message, so a dropped session after that point must not be retried.
+    data_started = False
+
+    def data(self, msg):
+        self.data_started = True
+        return super().data(msg)
+
+
+class _SMTP(_DataTracking, smtplib.SMTP):
+    pass
+
+
+class _SMTP_SSL(_DataTracking, smtplib.SMTP_SSL):
+    pass
+
+
+class SmtpConnectionPool:
+    """Keeps up to ``size`` authenticated SMTP sessions open and reuses them across messages.
+
+    Sessions idle longer than ``idle_seconds`` are closed by a reaper thread;
+    sessions idle for more than a few seconds are probed with NOOP before
+    reuse, and a send that hits a dropped session before DATA is retried once
+    on a fresh one.
+    """
+
+    def __init__(self, settings: Settings, *, size: int, idle_seconds: float) -> None:
+        self._settings = settings
+        self._size = max(1, size)
+        self._idle_seconds = idle_seconds
+        self._idle: deque[tuple[smtplib.SMTP, float]] = deque()
+        self._open = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self._reaper = threading.Thread(target=self._reap_loop, name="smtp-pool-reaper", daemon=True)
+        self._reaper.start()
+
+    def _connect(self) -> smtplib.SMTP:
+        settings = self._settings
+        if settings.smtp_use_ssl:
+            server: smtplib.SMTP = _SMTP_SSL(settings.smtp_host, settings.smtp_port, timeout=30)
+        else:
+            server = _SMTP(settings.smtp_host, settings.smtp_port, timeout=30)
+            if settings.smtp_use_tls:
+                server.starttls()
+        if settings.smtp_username:
+            server.login(settings.smtp_username, settings.smtp_password or "")
+        return server
+
+    @staticmethod
+    def _close(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+    @staticmethod
+    def _is_alive(server: smtplib.SMTP) -> bool:
+        try:
+            return server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _acquire(self) -> smtplib.SMTP:
+        while True:
+            with self._cond:
+                while not self._idle and self._open >= self._size:
+                    self._cond.wait()
+                if self._idle:
+                    server, last_used = self._idle.pop()
+                else:
+                    self._open += 1
+                    server, last_used = None, 0.0
+            if server is None:
+                try:
+                    return self._connect()
+                except BaseException:
+                    self._discard(None)
+                    raise
+            if time.monotonic() - last_used < _LIVENESS_CHECK_AFTER_SECONDS or self._is_alive(server):
+                return server
+            self._discard(server)
+
+    def _release(self, server: smtplib.SMTP) -> None:
+        with self._cond:
+            if self._closed:
+                self._open -= 1
+            else:
+                self._idle.append((server, time.monotonic()))
+                self._cond.notify()
+                return
+        self._close(server)
+
+    def _discard(self, server: smtplib.SMTP | None) -> None:
+        with self._cond:
+            self._open -= 1
+            self._cond.notify()
+        if server is not None:
+            server.close()
+
+    def send_raw(self, sender: str, recipients: list[str], data: bytes) -> None:
+        self._send(lambda server: server.sendmail(sender, recipients, data))
+
+    def _send(self, send: Callable[[smtplib.SMTP], object]) -> None:
+        for attempt in range(2):
+            server = self._acquire()
+            server.data_started = False
+            try:
+                send(server)
+            except _RETRYABLE_ERRORS as exc:
+                self._discard(server)
+                if server.data_started:
+                    raise DeliveryUncertainError(str(exc) or exc.__class__.__name__) from exc
+                if attempt:
+                    raise
+                continue
+            except smtplib.SMTPRecipientsRefused:
+                self._release(server)
+                raise
+            except BaseException:
+                self._discard(server)
+                raise
+            self._release(server)
+            return
+
+    def _reap_idle(self) -> None:
+        cutoff = time.monotonic() - self._idle_seconds
+        expired: list[smtplib.SMTP] = []
+        with self._cond:
+            # Oldest sessions sit at the left end of the LIFO deque.
+            while self._idle and self._idle[0][1] < cutoff:
+                expired.append(self._idle.popleft()[0])
+                self._open -= 1
+            if expired:
+                self._cond.notify_all()
+        for server in expired:
+            self._close(server)
+
+    def _reap_loop(self) -> None:
+        interval = max(1.0, self._idle_seconds / 2)
+        while not self._closed:
+            time.sleep(interval)
+            self._reap_idle()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle = [server for server, _ in self._idle]
+            self._open -= len(idle)
+            self._idle.clear()
+        for server in idle:
+            self._close(server)
+
+
+_pool: SmtpConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_smtp_pool(settings: Settings) -> SmtpConnectionPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SmtpConnectionPool(
+                settings,
+                size=settings.smtp_pool_size,
+                idle_seconds=settings.smtp_pool_idle_seconds,
+            )
+        return _pool
+
+
+def close_smtp_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
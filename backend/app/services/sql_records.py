@@ -0,0 +1,59 @@
+import sqlite3
+from collections.abc import Callable
+from dataclasses import fields
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+RowFactory = Callable[[sqlite3.Cursor, tuple[Any, ...]], T]
+
+
+def _init_field_names(record_type: type) -> list[str]:
+    # Fields with init=False (memo slots and the like) are not columns.
+    return [field.name for field in fields(record_type) if field.init]
+
+
+def record_columns(record_type: type, **aliases: str) -> str:
+    """SELECT list for ``record_type``, in field order; ``aliases`` maps field name to column expression."""
+    return ", ".join(
+        f"{aliases[name]} AS {name}" if name in aliases else name for name in _init_field_names(record_type)
+    )
+
+
+def record_factory(record_type: type[T], **converters: Callable[[Any], Any]) -> RowFactory[T]:
+    """Build a cursor row factory that constructs ``record_type`` straight from the raw row tuple.
+
+    The query must select ``record_columns(record_type)``. Only fields listed
+    in ``converters`` are transformed; every other value is passed through.
+    """
+    names = _init_field_names(record_type)
+    unknown = set(converters) - set(names)
+    if unknown:
+        raise ValueError(f"{record_type.__name__} has no fields {sorted(unknown)}")
+    if not converters:
+        return lambda _cursor, row: record_type(*row)
+    steps = [(index, converters[name]) for index, name in enumerate(names) if name in converters]
+
+    def build(_cursor: sqlite3.Cursor, row: tuple[Any, ...]) -> T:
+        values = list(row)
+        for index, convert in steps:
+            values[index] = convert(values[index])
+        return record_type(*values)
+
+    return build
+
+
+def fetch_one(
+    connection: sqlite3.Connection, factory: RowFactory[T], sql: str, params: tuple[Any, ...] | list[Any] = ()
+) -> T | None:
+    cursor = connection.cursor()
+    cursor.row_factory = factory
+    return cursor.execute(sql, params).fetchone()
+
+
+def fetch_all(
+    connection: sqlite3.Connection, factory: RowFactory[T], sql: str, params: tuple[Any, ...] | list[Any] = ()
+) -> list[T]:
+    cursor = connection.cursor()
+    cursor.row_factory = factory
+    return cursor.execute(sql, params).fetchall()
@@ -0,0 +1,76 @@
+"""CPU versus bandwidth tradeoff of response compression levels.
+
+Run from the backend directory:
+
+    python -m benchmarks.compression [path/to/interviewos.sqlite3]
+
+Report payloads come from the ``reports`` table of the given database
+(``LOCAL_DB_PATH`` layout, default ``data/interviewos.sqlite3``); when it has
+no reports, the synthetic payload from ``benchmarks.responses`` is used.
+Brotli rows are only printed when the ``brotli`` package is installed.
+"""
+
+import sqlite3
+import sys
+import timeit
+import zlib
+from pathlib import Path
+
+from app.core.compression import brotli
+from app.core.responses import JSONFragment, dumps_json
+from benchmarks.responses import _report_columns, _report_payload
+
+
+def _stored_reports(db_path: Path) -> list[bytes]:
+    if not db_path.is_file():
+        return []
+    with sqlite3.connect(db_path) as connection:
+        rows = connection.execute(
+            "SELECT results_json, diffs_json, code_summary_json, app_usage_json FROM reports"
+        ).fetchall()
+    return [
+        dumps_json(
+            {
+                "results": JSONFragment(results or "[]"),
+                "diffs": JSONFragment(diffs or "[]"),
+                "codeSummaryBullets": JSONFragment(summary or "[]"),
+                "appUsage": JSONFragment(app_usage or "[]"),
+            }
+        )
+        for results, diffs, summary, app_usage in rows
+    ]
+
+
+def _measure(label: str, bodies: list[bytes], compress) -> None:
+    raw = sum(len(body) for body in bodies)
+    compressed = sum(len(compress(body)) for body in bodies)
+    seconds = min(timeit.repeat(lambda: [compress(body) for body in bodies], number=5, repeat=3)) / 5
+    print(f"{label:<12} {compressed:>10} B  ratio {raw / max(compressed, 1):>6.1f}x  {seconds * 1e3:>8.2f} ms")
+
+
+def _gzip(level: int):
+    def compress(body: bytes) -> bytes:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress(body) + compressor.flush()
+
+    return compress
+
+
+def main() -> None:
+    db_path = Path(sys.argv[1] if len(sys.argv) > 1 else "data/interviewos.sqlite3")
+    bodies = _stored_reports(db_path)
+    source = f"{len(bodies)} stored reports from {db_path}"
+    if not bodies:
+        bodies = [dumps_json(_report_payload(_report_columns(), raw=True))]
+        source = "synthetic report payload"
+    print(f"{source}: {sum(len(body) for body in bodies)} B uncompressed")
+
+    for level in (1, 3, 6, 9):
+        _measure(f"gzip -{level}", bodies, _gzip(level))
+    if brotli is not None:
+        for quality in (1, 4, 6, 11):
+            _measure(f"br q{quality}", bodies, lambda body, quality=quality: brotli.compress(body, quality=quality))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Serialization cost of the largest API responses.
+
+Run from the backend directory:
+
+    python -m benchmarks.responses
+
+Compares FastAPI's default path (``jsonable_encoder`` + stdlib ``json``)
+with ``FastJSONResponse`` for a report payload and a full candidate page.
+Install ``orjson`` to measure the fast path; without it the fallback
+encoder is measured instead.
+"""
+
+import json
+import timeit
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core import responses
+from app.core.responses import FastJSONResponse, JSONFragment
+
+
+def _report_columns() -> dict[str, str]:
+    results = [
+        {
+            "name": f"case_{index}",
+            "passed": index % 7 != 0,
+            "expected": {"id": index, "items": list(range(10))},
+            "actual": {"id": index, "items": list(range(10))},
+            "message": "Mismatch in field items" if index % 7 == 0 else "",
+        }
+        for index in range(200)
+    ]
+    diffs = [
+        {"file": f"src/module_{index}.py", "patch": "@@ -1,5 +1,7 @@\n" + "+ added line\n" * 40}
+        for index in range(60)
+    ]
+    app_usage = [
+        {"app": f"app-{index % 12}", "seconds": index * 3, "startedAt": "2026-01-01T00:00:00Z"}
+        for index in range(300)
+    ]
+    bullets = [f"Observation {index} about structure and naming." for index in range(20)]
+    return {
+        "results_json": json.dumps(results),
+        "diffs_json": json.dumps(diffs),
+        "app_usage_json": json.dumps(app_usage),
+        "code_summary_json": json.dumps(bullets),
+    }
+
+
+def _report_payload(columns: dict[str, str], *, raw: bool) -> dict[str, object]:
+    def column(name: str) -> object:
+        return JSONFragment(columns[name]) if raw else json.loads(columns[name])
+
+    return {
+        "id": 1,
+        "assessmentId": 1,
+        "assessmentTitle": "Backend Engineer",
+        "name": "Candidate",
+        "email": "candidate@example.com",
+        "score": 82,
+        "codeQuality": 74,
+        "results": column("results_json"),
+        "diffs": column("diffs_json"),
+        "codeSummaryBullets": column("code_summary_json"),
+        "reportReady": True,
+        "error": None,
+        "assessmentType": "default",
+        "appUsage": column("app_usage_json"),
+        "submittedAt": "2026-01-01T00:00:00Z",
+        "stages": {"tests": {"status": "done", "error": None, "updatedAt": "2026-01-01T00:00:00Z"}},
+    }
+
+
+def _listing_payload() -> dict[str, object]:
+    return {
+        "nextCursor": "WyIyMDI2LTAxLTAxIiwgNTAwXQ==",
+        "candidates": [
+            {
+                "id": index,
+                "assessmentId": 1,
+                "email": f"candidate{index}@example.com",
+                "name": f"Candidate {index}",
+                "status": "invited",
+                "invitedAt": "2026-01-01T00:00:00Z",
+            }
+            for index in range(500)
+        ],
+    }
+
+
+def _measure(label: str, func, number: int) -> None:
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{label:<44} {seconds * 1e6:>10.1f} us")
+
+
+def main() -> None:
+    columns = _report_columns()
+    listing = _listing_payload()
+    encoder = "orjson" if responses.orjson is not None else "stdlib json"
+    print(f"FastJSONResponse encoder: {encoder}")
+
+    _measure(
+        "report: decode + jsonable_encoder + json",
+        lambda: JSONResponse(jsonable_encoder(_report_payload(columns, raw=False))),
+        number=50,
+    )
+    _measure(
+        "report: FastJSONResponse + raw fragments",
+        lambda: FastJSONResponse(_report_payload(columns, raw=True)),
+        number=50,
+    )
+    _measure("listing: jsonable_encoder + json", lambda: JSONResponse(jsonable_encoder(listing)), number=50)
+    _measure("listing: FastJSONResponse", lambda: FastJSONResponse(listing), number=50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+from pathlib import Path
+
+import pytest
+
+from app.core.config import Settings
+
+
+@pytest.fixture
+def settings(tmp_path: Path) -> Settings:
+    # _env_file=None keeps a developer's local .env out of the tests.
+    return Settings(
+        _env_file=None,
+        local_db_path=str(tmp_path / "interviewos.sqlite3"),
+        local_submissions_dir=str(tmp_path / "submissions"),
+        local_recordings_dir=str(tmp_path / "recordings"),
+    )
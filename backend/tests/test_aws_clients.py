@@ -0,0 +1,58 @@
+from collections.abc import Iterator
+
+import pytest
+from botocore.stub import Stubber
+
+from app.core.config import Settings
+from app.services import aws_clients
+
+
+@pytest.fixture(autouse=True)
+def fresh_clients(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    aws_clients.reset_clients()
+    yield
+    aws_clients.reset_clients()
+
+
+def test_clients_are_reused_per_service_region_and_endpoint(settings: Settings):
+    s3 = aws_clients.s3_client(settings)
+    assert aws_clients.s3_client(settings) is s3
+    assert aws_clients.ses_client(settings) is not s3
+
+    other_region = settings.model_copy(update={"aws_region": "eu-west-1"})
+    assert aws_clients.s3_client(other_region) is not s3
+    assert aws_clients.s3_client(other_region).meta.region_name == "eu-west-1"
+
+    stand_in = settings.model_copy(update={"aws_endpoint_url": "http://localhost:4566"})
+    local = aws_clients.s3_client(stand_in)
+    assert local is not s3
+    assert local.meta.endpoint_url == "http://localhost:4566"
+    assert aws_clients.s3_client(stand_in) is local
+
+
+def test_reset_clients_drops_the_cache(settings: Settings):
+    s3 = aws_clients.s3_client(settings)
+    aws_clients.reset_clients()
+    assert aws_clients.s3_client(settings) is not s3
+
+
+def test_ses_client_leaves_retries_to_the_sender(settings: Settings):
+    retries = aws_clients.ses_client(settings).meta.config.retries
+    assert retries == {"mode": "standard", "total_max_attempts": 1}
+
+
+def test_s3_client_uses_configured_attempts(settings: Settings):
+    configured = settings.model_copy(update={"aws_max_attempts": 5})
+    assert aws_clients.s3_client(configured).meta.config.retries["total_max_attempts"] == 5
+
+
+def test_ses_client_talks_to_a_stubbed_endpoint(settings: Settings):
+    client = aws_clients.ses_client(settings)
+    with Stubber(client) as stubber:
+        stubber.add_response(
+            "get_send_quota", {"Max24HourSend": 200.0, "MaxSendRate": 14.0, "SentLast24Hours": 0.0}
+        )
+        assert client.get_send_quota()["MaxSendRate"] == 14.0
+        stubber.assert_no_pending_responses()
@@ -0,0 +1,20 @@
+from app.core.config import Settings
+from app.services import assessment_store
+
+
+def _names(settings: Settings, search: str) -> list[str | None]:
+    candidates, _ = assessment_store.list_candidates_page(settings, limit=10, assessment_id=1, search=search)
+    return sorted(candidate.name or "" for candidate in candidates)
+
+
+def test_prefix_search_folds_ascii_and_keeps_other_letters(settings: Settings):
+    assessment_store.init_assessment_store(settings)
+    for email, name in [("emile@example.com", "Émile Zola"), ("ana@example.com", "ANA Silva")]:
+        assessment_store.add_or_update_candidate(
+            settings, assessment_id=1, email=email, name=name, status="invited"
+        )
+
+    assert _names(settings, "Émile") == ["Émile Zola"]
+    assert _names(settings, "ÉMILE") == ["Émile Zola"]
+    assert _names(settings, "ana s") == ["ANA Silva"]
+    assert _names(settings, "EMILE@") == ["Émile Zola"]
@@ -0,0 +1,33 @@
+import io
+import json
+import zipfile
+
+from app.services.json_comparison import compare_json_outputs
+
+
+def _archive(members: dict[str, str]) -> zipfile.ZipFile:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return zipfile.ZipFile(buffer)
+
+
+def test_booleans_do_not_match_integers():
+    zipf = _archive({"out/claim.json": json.dumps({"approved": 1, "flagged": 0, "count": 1.0})})
+    expected = {"claim": {"approved": True, "flagged": False, "count": 1}}
+
+    result = compare_json_outputs(zipf, zipf.namelist(), expected)
+
+    assert result.matched_fields == 1
+    assert {mismatch["path"] for mismatch in result.mismatches} == {"approved", "flagged"}
+
+
+def test_deeply_nested_candidate_json_counts_as_missing():
+    nested = "[" * 100_000 + "]" * 100_000
+    zipf = _archive({"out/claim.json": nested})
+
+    result = compare_json_outputs(zipf, zipf.namelist(), {"claim": {"id": 1}})
+
+    assert result.missing_documents == ["claim"]
+    assert result.matched_fields == 0
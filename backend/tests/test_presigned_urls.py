@@ -0,0 +1,65 @@
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.core.config import Settings
+from app.services import assessment, aws_clients
+
+
+@pytest.fixture
+def s3_settings(monkeypatch: pytest.MonkeyPatch, settings: Settings) -> Iterator[Settings]:
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "AKIAFIRST")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
+    monkeypatch.setattr(assessment, "_presigned_urls", {})
+    aws_clients.reset_clients()
+    yield settings.model_copy(
+        update={"storage_provider": "s3", "assessment_bucket": "bucket", "assessment_object_key": "assessment.zip"}
+    )
+    aws_clients.reset_clients()
+
+
+def test_download_link_is_reused_for_the_same_signing_identity(s3_settings):
+    url = assessment.generate_assessment_download_link(s3_settings)
+    assert "AKIAFIRST" in url
+    assert assessment.generate_assessment_download_link(s3_settings) == url
+
+
+def test_rotated_credentials_get_a_fresh_link(monkeypatch, s3_settings):
+    first = assessment.generate_assessment_download_link(s3_settings)
+
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "AKIASECOND")
+    aws_clients.reset_clients()
+    second = assessment.generate_assessment_download_link(s3_settings)
+
+    assert second != first
+    assert "AKIASECOND" in second
+
+
+def test_region_and_endpoint_are_part_of_the_cache_key(s3_settings):
+    assessment.generate_assessment_download_link(s3_settings)
+    assessment.generate_assessment_download_link(s3_settings.model_copy(update={"aws_region": "eu-west-1"}))
+    assessment.generate_assessment_download_link(
+        s3_settings.model_copy(update={"aws_endpoint_url": "http://localhost:4566"})
+    )
+    assert len(assessment._presigned_urls) == 3
+
+
+def test_cache_lifetime_is_capped_by_credential_expiry(monkeypatch, s3_settings):
+    monkeypatch.setattr(assessment, "signing_identity", lambda settings: ("AKIATEMP", 60.0))
+    monkeypatch.setattr(assessment.time, "monotonic", lambda: 1000.0)
+    assessment.generate_assessment_download_link(s3_settings)
+
+    ((_, expires_at),) = assessment._presigned_urls.values()
+    assert expires_at == pytest.approx(1000.0 + 60.0 * assessment._PRESIGNED_REFRESH_FRACTION)
+
+
+def test_signing_identity_reports_refreshable_expiry(monkeypatch, s3_settings):
+    aws_clients.s3_client(s3_settings)
+    credentials = aws_clients._session.get_credentials()
+    monkeypatch.setattr(credentials, "_expiry_time", datetime.now(UTC) + timedelta(minutes=15), raising=False)
+
+    access_key, ttl = aws_clients.signing_identity(s3_settings)
+
+    assert access_key == "AKIAFIRST"
+    assert 14 * 60 < ttl <= 15 * 60
@@ -0,0 +1,128 @@
+"""EXPLAIN QUERY PLAN checks for the hot lookups and keyset pages.
+
+Each test runs the store function itself with statement tracing on, then
+explains every SELECT it issued, so the plans cover the SQL that ships.
+"""
+
+import sqlite3
+from collections.abc import Callable
+
+import pytest
+
+from app.core.config import Settings
+from app.services import assessment_store, invite_store
+
+
+@pytest.fixture
+def populated(settings: Settings) -> Settings:
+    invite_store.init_store(settings)
+    assessment_store.init_assessment_store(settings)
+    assessment_id = assessment_store.list_assessments(settings)[0].id
+    for index in range(100):
+        assessment_store.create_assessment(
+            settings, title=f"Assessment {index}", question_id=1, job_link=None, job_desc=None
+        )
+    emails = [f"candidate{index}@Example.com" for index in range(200)]
+    invite_store.create_invites_bulk(
+        emails,
+        settings,
+        assessment_id=assessment_id,
+        candidate_names={email: f"Name {index}" for index, email in enumerate(emails)},
+    )
+    invite_store.create_invites_bulk(emails[:50], settings)
+    with sqlite3.connect(settings.local_db_path) as connection:
+        connection.execute("ANALYZE")
+    return settings
+
+
+def _plans(monkeypatch: pytest.MonkeyPatch, settings: Settings, module, call: Callable[[], object]) -> list[str]:
+    statements: list[str] = []
+    connect = module._connect
+
+    def traced(settings: Settings) -> sqlite3.Connection:
+        connection = connect(settings)
+        connection.set_trace_callback(statements.append)
+        return connection
+
+    monkeypatch.setattr(module, "_connect", traced)
+    call()
+    selects = [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+    assert selects
+    with sqlite3.connect(settings.local_db_path) as connection:
+        return [
+            "\n".join(row[3] for row in connection.execute(f"EXPLAIN QUERY PLAN {sql}")) for sql in selects
+        ]
+
+
+def test_latest_invite_by_email_uses_lower_email_index(monkeypatch, populated):
+    (plan,) = _plans(
+        monkeypatch,
+        populated,
+        invite_store,
+        lambda: invite_store.get_latest_invite_by_email("Candidate7@example.com", populated),
+    )
+    assert "USING INDEX idx_invites_email_lower_created_at" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_latest_invite_by_email_and_assessment_uses_index(monkeypatch, populated):
+    (plan,) = _plans(
+        monkeypatch,
+        populated,
+        invite_store,
+        lambda: invite_store.get_latest_invite_by_email_and_assessment("candidate7@example.com", 1, populated),
+    )
+    assert "USING INDEX idx_invites_email_assessment" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_candidate_prefix_search_uses_range_scans(monkeypatch, populated):
+    (plan,) = _plans(
+        monkeypatch,
+        populated,
+        assessment_store,
+        lambda: assessment_store.list_candidates_page(populated, limit=20, search="Candidate1"),
+    )
+    assert "USING INDEX idx_candidates_email_lower" in plan
+    assert "USING INDEX idx_candidates_name_lower" in plan
+
+
+def test_candidate_prefix_search_within_assessment_uses_range_scans(monkeypatch, populated):
+    (plan,) = _plans(
+        monkeypatch,
+        populated,
+        assessment_store,
+        lambda: assessment_store.list_candidates_page(populated, limit=20, assessment_id=1, search="name 1"),
+    )
+    assert "USING INDEX idx_candidates_assessment_email" in plan
+    assert "USING INDEX idx_candidates_assessment_name" in plan
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "index"),
+    [
+        ({}, "idx_candidates_invited"),
+        ({"assessment_id": 1}, "idx_candidates_assessment_invited"),
+        ({"assessment_id": 1, "after": ("9999-01-01T00:00:00+00:00", 10**9)}, "idx_candidates_assessment_invited"),
+    ],
+)
+def test_candidate_keyset_pages_walk_the_invited_index(monkeypatch, populated, kwargs, index):
+    (plan,) = _plans(
+        monkeypatch,
+        populated,
+        assessment_store,
+        lambda: assessment_store.list_candidates_page(populated, limit=20, **kwargs),
+    )
+    assert f"USING INDEX {index}" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_assessment_keyset_page_walks_the_created_index(monkeypatch, populated):
+    (plan,) = _plans(
+        monkeypatch,
+        populated,
+        assessment_store,
+        lambda: assessment_store.list_assessments_page(populated, limit=20, after=("9999-01-01", 10**9)),
+    )
+    assert "USING INDEX idx_assessments_created" in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,102 @@
+import pytest
+from botocore.stub import Stubber
+
+from app.core.config import Settings
+from app.services import aws_clients, ses_sender
+from app.services.ses_sender import SesBatchSender, TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(ses_sender.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(ses_sender.time, "sleep", clock.sleep)
+    return clock
+
+
+@pytest.fixture
+def ses(monkeypatch: pytest.MonkeyPatch, settings: Settings):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    aws_clients.reset_clients()
+    client = aws_clients.ses_client(settings)
+    with Stubber(client) as stubber:
+        yield stubber
+    aws_clients.reset_clients()
+
+
+def test_token_bucket_bursts_to_capacity_then_waits_for_refill(clock):
+    bucket = TokenBucket(rate=2.0, capacity=2.0)
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_token_bucket_drain_forces_a_wait(clock):
+    bucket = TokenBucket(rate=4.0)
+    bucket.drain()
+    bucket.acquire()
+    assert sum(clock.sleeps) == pytest.approx(0.25)
+
+
+def test_throttled_send_drains_backs_off_and_retries(clock, ses, settings):
+    sender = SesBatchSender(settings.model_copy(update={"ses_max_send_rate": 10.0}))
+    ses.add_client_error("send_raw_email", service_error_code="Throttling", http_status_code=400)
+    ses.add_client_error("send_raw_email", service_error_code="MaxSendingRateExceeded", http_status_code=400)
+    ses.add_response("send_raw_email", {"MessageId": "msg-1"})
+
+    result = sender.send("from@example.com", "to@example.com", b"raw")
+
+    assert result.message_id == "msg-1"
+    assert result.error is None
+    ses.assert_no_pending_responses()
+    # Exponential backoff between attempts, on top of the drained bucket's waits.
+    assert 0.25 in clock.sleeps and 0.5 in clock.sleeps
+
+
+def test_non_throttling_errors_are_not_retried(clock, ses, settings):
+    sender = SesBatchSender(settings.model_copy(update={"ses_max_send_rate": 10.0}))
+    ses.add_client_error("send_raw_email", service_error_code="MessageRejected", http_status_code=400)
+
+    result = sender.send("from@example.com", "to@example.com", b"raw")
+
+    assert result.message_id is None
+    assert "MessageRejected" in (result.error or "")
+    ses.assert_no_pending_responses()
+
+
+def test_rate_change_resizes_the_worker_pool(monkeypatch, settings):
+    class FakeSes:
+        def send_raw_email(self, **kwargs):
+            return {"MessageId": kwargs["Destinations"][0]}
+
+    monkeypatch.setattr(ses_sender, "ses_client", lambda settings: FakeSes())
+    settings = settings.model_copy(update={"ses_max_send_rate": 2.0})
+    sender = SesBatchSender(settings)
+    first_pool = sender._pool
+    assert first_pool._max_workers == 2
+
+    settings.ses_max_send_rate = 20.0
+    sender._rate_checked_at = float("-inf")
+    results = sender.send_batch("from@example.com", [(f"user{index}@example.com", b"raw") for index in range(6)])
+
+    assert [result.message_id for result in results] == [f"user{index}@example.com" for index in range(6)]
+    assert sender._pool is not first_pool
+    assert sender._pool._max_workers == 20
+    assert first_pool._shutdown
@@ -1,4 +1,4 @@
-import { useEffect, useMemo, useState } from 'react'
+import { useEffect, useMemo, useRef, useState } from 'react'
 import Assessment from './Assessment'
 import ReportPage from './pages/Report'
 
@@ -128,8 +128,13 @@ function DashboardPage() {
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState('')
   const [assessments, setAssessments] = useState([])
+  const [assessmentsCursor, setAssessmentsCursor] = useState(null)
+  const [loadingMoreAssessments, setLoadingMoreAssessments] = useState(false)
   const [selectedAssessmentId, setSelectedAssessmentId] = useState(null)
   const [candidates, setCandidates] = useState([])
+  const [candidatesCursor, setCandidatesCursor] = useState(null)
+  const [loadingMoreCandidates, setLoadingMoreCandidates] = useState(false)
+  const selectedAssessmentRef = useRef(null)
 
   const assessmentsEndpoint = apiUrl('/api/assessments')
   const candidatesEndpointBase = apiUrl('/api/candidates')
@@ -146,6 +151,7 @@ function DashboardPage() {
         const payload = await response.json()
         const rows = payload.assessments || []
         setAssessments(rows)
+        setAssessmentsCursor(payload.nextCursor || null)
         if (rows.length > 0) {
           setSelectedAssessmentId(rows[0].id)
         }
@@ -159,6 +165,8 @@ function DashboardPage() {
   }, [assessmentsEndpoint])
 
   useEffect(() => {
+    selectedAssessmentRef.current = selectedAssessmentId
+    setCandidatesCursor(null)
     if (!selectedAssessmentId) {
       setCandidates([])
       return
@@ -172,6 +180,7 @@ function DashboardPage() {
         }
         const payload = await response.json()
         setCandidates(payload.candidates || [])
+        setCandidatesCursor(payload.nextCursor || null)
       } catch {
         setCandidates([])
       }
@@ -179,6 +188,53 @@ function DashboardPage() {
     loadCandidates()
   }, [candidatesEndpointBase, selectedAssessmentId])
 
+  async function loadMoreCandidates() {
+    if (!candidatesCursor) {
+      return
+    }
+    const assessmentId = selectedAssessmentId
+    setLoadingMoreCandidates(true)
+    try {
+      const response = await fetch(
+        `${candidatesEndpointBase}?assessmentId=${assessmentId}&cursor=${encodeURIComponent(candidatesCursor)}`,
+      )
+      if (!response.ok) {
+        throw new Error('Failed to load candidates')
+      }
+      const payload = await response.json()
+      // Drop the page if another assessment was selected while it loaded.
+      if (selectedAssessmentRef.current !== assessmentId) {
+        return
+      }
+      setCandidates((current) => [...current, ...(payload.candidates || [])])
+      setCandidatesCursor(payload.nextCursor || null)
+    } catch {
+      // Keep the rows already shown; the button stays available to retry.
+    } finally {
+      setLoadingMoreCandidates(false)
+    }
+  }
+
+  async function loadMoreAssessments() {
+    if (!assessmentsCursor) {
+      return
+    }
+    setLoadingMoreAssessments(true)
+    try {
+      const response = await fetch(`${assessmentsEndpoint}?cursor=${encodeURIComponent(assessmentsCursor)}`)
+      if (!response.ok) {
+        throw new Error('Failed to load assessments')
+      }
+      const payload = await response.json()
+      setAssessments((current) => [...current, ...(payload.assessments || [])])
+      setAssessmentsCursor(payload.nextCursor || null)
+    } catch (loadError) {
+      setError(loadError.message || 'Failed to load assessments')
+    } finally {
+      setLoadingMoreAssessments(false)
+    }
+  }
+
   return (
     <main className="page page-wide">
       <section className="card card-wide">
@@ -236,6 +292,18 @@ function DashboardPage() {
                   </tbody>
                 </table>
               </div>
+              {assessmentsCursor && (
+                <div className="actions-row">
+                  <button
+                    type="button"
+                    className="secondary"
+                    disabled={loadingMoreAssessments}
+                    onClick={loadMoreAssessments}
+                  >
+                    {loadingMoreAssessments ? 'Loading...' : 'Load more'}
+                  </button>
+                </div>
+              )}
             </div>
             <div>
               <h2 className="section-title">Candidates</h2>
@@ -264,6 +332,18 @@ function DashboardPage() {
                   </tbody>
                 </table>
               </div>
+              {candidatesCursor && (
+                <div className="actions-row">
+                  <button
+                    type="button"
+                    className="secondary"
+                    disabled={loadingMoreCandidates}
+                    onClick={loadMoreCandidates}
+                  >
+                    {loadingMoreCandidates ? 'Loading...' : 'Load more'}
+                  </button>
+                </div>
+              )}
             </div>
           </div>
         )}
@@ -289,16 +369,21 @@ function NewAssessmentPage() {
   useEffect(() => {
     async function loadDefaultTitle() {
       try {
-        const response = await fetch(apiUrl('/api/assessments'))
-        const payload = await response.json().catch(() => ({ assessments: [] }))
-        const existing = (payload.assessments || []).map((item) => item.title)
-
         const now = new Date()
         const dateLabel = `${now.getMonth() + 1}/${now.getDate()}`
         const baseTitle = `${dateLabel} Software Engineer`
         let unique = baseTitle
         let counter = 2
-        while (existing.includes(unique)) {
+        // Ask the server per candidate title instead of scanning one page of assessments.
+        for (;;) {
+          const response = await fetch(`${apiUrl('/api/assessments/check-title')}?title=${encodeURIComponent(unique)}`)
+          if (!response.ok) {
+            throw new Error('Unable to verify title right now.')
+          }
+          const payload = await response.json()
+          if (!payload.exists || counter > 50) {
+            break
+          }
           unique = `${baseTitle} (${counter})`
           counter += 1
         }
@@ -744,6 +829,8 @@ function AssessmentResultPage({ assessmentId }) {
 
   const [assessment, setAssessment] = useState(null)
   const [candidates, setCandidates] = useState([])
+  const [nextCursor, setNextCursor] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState('')
   const [showInvite, setShowInvite] = useState(false)
@@ -787,6 +874,7 @@ function AssessmentResultPage({ assessmentId }) {
         const candidatesPayload = await candidatesRes.json()
         setAssessment(assessmentPayload)
         setCandidates(candidatesPayload.candidates || [])
+        setNextCursor(candidatesPayload.nextCursor || null)
       } catch (loadError) {
         setError(loadError.message || 'Failed to load assessment result')
       } finally {
@@ -869,6 +957,7 @@ function AssessmentResultPage({ assessmentId }) {
       if (refreshed.ok) {
         const payload = await refreshed.json()
         setCandidates(payload.candidates || [])
+        setNextCursor(payload.nextCursor || null)
       }
       setInviteList([newInviteRow()])
       setShowInvite(false)
@@ -880,6 +969,28 @@ function AssessmentResultPage({ assessmentId }) {
     }
   }
 
+  async function loadMoreCandidates() {
+    if (!nextCursor) {
+      return
+    }
+    setLoadingMore(true)
+    try {
+      const response = await fetch(
+        apiUrl(`/api/candidates?assessmentId=${assessmentId}&cursor=${encodeURIComponent(nextCursor)}`),
+      )
+      if (!response.ok) {
+        throw new Error('Failed to load candidates')
+      }
+      const payload = await response.json()
+      setCandidates((current) => [...current, ...(payload.candidates || [])])
+      setNextCursor(payload.nextCursor || null)
+    } catch (loadError) {
+      setError(loadError.message || 'Failed to load candidates')
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   async function resendInvite(candidate) {
     try {
       const response = await fetch(apiUrl('/api/invite/resend'), {
@@ -899,6 +1010,7 @@ function AssessmentResultPage({ assessmentId }) {
       if (refreshed.ok) {
         const payload = await refreshed.json()
         setCandidates(payload.candidates || [])
+        setNextCursor(payload.nextCursor || null)
       }
       setToast(`Invite resent to ${candidate.email}.`)
     } catch (resendError) {
@@ -1012,6 +1124,13 @@ function AssessmentResultPage({ assessmentId }) {
                 </tbody>
               </table>
             </div>
+            {nextCursor && (
+              <div className="actions-row">
+                <button type="button" className="secondary" disabled={loadingMore} onClick={loadMoreCandidates}>
+                  {loadingMore ? 'Loading...' : 'Load more'}
+                </button>
+              </div>
+            )}
           </>
         )}
 